@@ -0,0 +1,823 @@
+#!/usr/bin/env python3
+"""
+Performance benchmarks for the Camera Detection and Person Tracking System.
+Each benchmark runs against stubbed or recorded inputs, so no camera is required.
+"""
+
+import sys
+import os
+import argparse
+import json
+import multiprocessing
+import queue
+import threading
+import time
+import tracemalloc
+
+import cv2
+import numpy as np
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from models.config import CameraConfig, SyntheticSceneConfig, SystemConfig
+from components.camera_manager import CameraManager, FrameData
+from components.person_detector import PersonDetector
+from components.detector_pool import DetectorWorkerPool
+from components.detection_pipeline import PipelinedPersonDetector, STAGES
+from components.jpeg_decoder import JpegDecoder, split_mjpeg_stream
+from components.synthetic_scene import SyntheticScene
+from components.inference_backends import BACKENDS, create_backend
+from components.tracker import box_iou, detection_to_xyxy
+from components.replay_source import ReplaySource
+from components.preprocessing import fit_to_input_size
+
+
+class StubPiCamera:
+    """
+    Stand-in for picamera.PiCamera that serves a fixed scene.
+    JPEG stills are encoded once up front (the real camera encodes on the GPU),
+    and recordings write pre-built raw frames at the frame rate, so the
+    benchmark measures only the CPU work done by CameraManager.
+    """
+
+    def __init__(self, width: int, height: int, framerate: float = 30):
+        self.framerate = framerate
+        self.scene = np.random.randint(0, 255, (height, width, 3), dtype=np.uint8)
+        ok, encoded = cv2.imencode('.jpg', self.scene)
+        self.jpeg_bytes = encoded.tobytes()
+        padded_width = (width + 31) // 32 * 32
+        padded_height = (height + 15) // 16 * 16
+        self.padded_bgr = np.zeros((padded_height, padded_width, 3), dtype=np.uint8)
+        self.padded_bgr[:height, :width] = self.scene
+        self.padded_yuv = np.zeros((padded_height * 3 // 2, padded_width), dtype=np.uint8)
+        self.recording = threading.Event()
+        self.recorder = None
+
+    def start_recording(self, output, format='h264'):
+        if format not in ('bgr', 'yuv'):
+            raise ValueError(f"Unsupported stub format: {format}")
+        frame = (self.padded_bgr if format == 'bgr' else self.padded_yuv).tobytes()
+
+        def record():
+            while self.recording.is_set():
+                output.write(frame)
+                time.sleep(1.0 / self.framerate)
+
+        self.recording.set()
+        self.recorder = threading.Thread(target=record, daemon=True)
+        self.recorder.start()
+
+    def stop_recording(self):
+        self.recording.clear()
+        if self.recorder is not None:
+            self.recorder.join()
+            self.recorder = None
+
+    def capture(self, output, format='jpeg', use_video_port=False):
+        if format == 'jpeg':
+            output.write(self.jpeg_bytes)
+        elif format == 'bgr':
+            np.copyto(output, self.padded_bgr[:output.shape[0], :output.shape[1]])
+        elif format == 'yuv':
+            np.copyto(output, self.padded_yuv)
+        else:
+            raise ValueError(f"Unsupported stub format: {format}")
+
+    def close(self):
+        pass
+
+
+def _measure_capture_cost(manager: CameraManager, num_frames: int):
+    """Return (average CPU milliseconds per _capture_frame() call, failed captures)."""
+    failures = 0
+    start_cpu = time.process_time()
+    for _ in range(num_frames):
+        captured = manager._capture_frame()
+        if captured is None:
+            failures += 1
+        elif captured[1] is not None:
+            manager.frame_pool.release(captured[1])
+    return (time.process_time() - start_cpu) * 1000.0 / num_frames, failures
+
+
+def benchmark_pi_capture(width: int, height: int, num_frames: int):
+    """Compare per-frame CPU cost of Pi Camera JPEG capture against raw video-port capture."""
+    print(f"Pi Camera capture benchmark - {width}x{height}, {num_frames} frames")
+
+    stub = StubPiCamera(width, height)
+    for mode, raw_format in [('jpeg', 'bgr'), ('read', 'bgr'), ('read', 'yuv')]:
+        config = CameraConfig(
+            name="Benchmark Pi Camera",
+            type="pi_camera",
+            width=width,
+            height=height,
+            horizontal_fov=62.2,
+            vertical_fov=48.8,
+            fps=30,
+            capture_mode=mode,
+            pi_raw_format=raw_format
+        )
+        manager = CameraManager(config, queue.Queue(), threading.Event())
+        manager.camera = stub
+
+        _measure_capture_cost(manager, 5)  # warm-up
+        cost_ms, failures = _measure_capture_cost(manager, num_frames)
+        note = f" ({failures} failed captures)" if failures else ""
+        print(f"   {manager._capture_mode_name():>8}: {cost_ms:.3f} ms CPU/frame{note}")
+        manager._cleanup_camera()
+
+
+def _load_mjpeg_frames(path: str, width: int, height: int, num_frames: int):
+    """Load a recorded MJPEG stream, or encode a synthetic one when no path is given."""
+    if path:
+        with open(path, 'rb') as f:
+            return split_mjpeg_stream(f.read())[:num_frames]
+
+    scene = SyntheticScene(SyntheticSceneConfig(num_people=5, cycle_frames=min(num_frames, 60)), width, height)
+    frames = []
+    for _ in range(min(num_frames, 60)):
+        frame, _ = scene.next_frame()
+        ok, encoded = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
+        frames.append(encoded.tobytes())
+    return frames
+
+
+def benchmark_mjpeg_decode(path: str, width: int, height: int, num_frames: int, target_widths):
+    """Compare JPEG decode cost per backend and decode-time scale on a recorded MJPEG stream."""
+    frames = _load_mjpeg_frames(path, width, height, num_frames)
+    if not frames:
+        print("No JPEG frames found")
+        return
+
+    probe = cv2.imdecode(np.frombuffer(frames[0], dtype=np.uint8), cv2.IMREAD_COLOR)
+    source_width = probe.shape[1]
+    print(f"MJPEG decode benchmark - {len(frames)} frames at {source_width}x{probe.shape[0]}, "
+          f"avg {sum(len(f) for f in frames) / len(frames) / 1024:.1f} KiB/frame")
+
+    for use_turbojpeg in (True, False):
+        for target_width in target_widths:
+            decoder = JpegDecoder(source_width, target_width or None, use_turbojpeg=use_turbojpeg)
+            if use_turbojpeg and decoder.backend != 'turbojpeg':
+                continue
+
+            start_cpu = time.process_time()
+            for encoded in frames:
+                decoded = decoder.decode(encoded)
+            cost_ms = (time.process_time() - start_cpu) * 1000.0 / len(frames)
+
+            decoded_width = decoded[0].shape[1] if decoded else 0
+            print(f"   {decoder.backend:>9} target {target_width or 'full':>4}: 1/{decoder.choose_scale_denominator()} "
+                  f"-> {decoded_width:>5} px wide, {cost_ms:.3f} ms CPU/frame")
+
+
+def _run_detector(config: SystemConfig, scene: SyntheticScene, duration: float, fps: float,
+                  model_path: str = "yolov8n.pt", detector_class=PersonDetector) -> dict:
+    """Feed synthetic frames to a detector thread for a while and return its stats."""
+    frame_queue = queue.Queue(maxsize=config.frame_queue_size)
+    detection_queue = queue.Queue()
+    stop_event = threading.Event()
+    detector = detector_class(config, frame_queue, detection_queue, stop_event, model_path=model_path)
+
+    detector_thread = threading.Thread(target=detector.run, daemon=True)
+    detector_thread.start()
+
+    frame_id = 0
+    end_time = time.monotonic() + duration
+    while time.monotonic() < end_time:
+        frame, ground_truth = scene.next_frame()
+        frame_data = FrameData(frame=frame, timestamp=time.time(), frame_id=frame_id,
+                               camera_id="benchmark", ground_truth=ground_truth)
+        try:
+            # fps == 0 saturates the detector; otherwise emulate a camera at that rate
+            frame_queue.put(frame_data, timeout=0.5)
+        except queue.Full:
+            pass
+        frame_id += 1
+        if fps > 0:
+            time.sleep(1.0 / fps)
+        while not detection_queue.empty():
+            detection_queue.get_nowait()
+
+    stop_event.set()
+    detector_thread.join(timeout=5.0)
+    return detector.get_detection_stats()
+
+
+def benchmark_batching(batch_sizes, timeout_ms: float, duration: float, fps: float, width: int, height: int):
+    """Compare detector throughput and p99 latency across batch sizes."""
+    print(f"Batched inference benchmark - {width}x{height}, {duration:.0f}s per run, "
+          f"{'saturated' if fps <= 0 else f'{fps:.0f} FPS'} input")
+
+    scene = SyntheticScene(SyntheticSceneConfig(num_people=5), width, height)
+    for batch_size in batch_sizes:
+        config = SystemConfig.create_default()
+        config.detection_batch_size = batch_size
+        config.detection_batch_timeout_ms = timeout_ms
+        config.frame_queue_size = max(config.frame_queue_size, batch_size * 2)
+
+        stats = _run_detector(config, scene, duration, fps)
+        print(f"   batch {batch_size:>2}: {stats['throughput_fps']:6.1f} FPS, "
+              f"p50 {stats['latency_p50_ms']:7.1f} ms, p99 {stats['latency_p99_ms']:7.1f} ms")
+
+
+def benchmark_worker_pool(worker_counts, duration: float, width: int, height: int):
+    """Show how saturated detector throughput scales with the number of worker processes."""
+    print(f"Detector worker pool benchmark - {width}x{height}, {duration:.0f}s per run, saturated input")
+
+    scene = SyntheticScene(SyntheticSceneConfig(num_people=5), width, height)
+    baseline = None
+    for num_workers in worker_counts:
+        config = SystemConfig.create_default()
+        config.camera.width, config.camera.height = width, height
+        config.detector_workers = num_workers
+        config.frame_queue_size = max(config.frame_queue_size, num_workers * 4)
+
+        detector_class = DetectorWorkerPool if num_workers > 1 else PersonDetector
+        stats = _run_detector(config, scene, duration, 0.0, detector_class=detector_class)
+        throughput = stats['throughput_fps']
+        baseline = baseline or throughput
+        speedup = throughput / baseline if baseline else 0.0
+        utilisation = ", ".join(f"{worker['utilisation'] * 100:.0f}%" for worker in stats.get('workers', []))
+        print(f"   {num_workers:>2} workers: {throughput:6.1f} FPS ({speedup:4.2f}x), "
+              f"p99 {stats['latency_p99_ms']:7.1f} ms"
+              + (f", utilisation [{utilisation}]" if utilisation else ""))
+
+
+def benchmark_pipeline(duration: float, width: int, height: int, batch_size: int):
+    """Compare saturated throughput of the sequential and the pipelined detector, with a stage breakdown."""
+    print(f"Pipelined detection benchmark - {width}x{height}, batch {batch_size}, {duration:.0f}s per run, "
+          f"saturated input")
+
+    scene = SyntheticScene(SyntheticSceneConfig(num_people=5), width, height)
+    baseline = None
+    for label, detector_class in (("sequential", PersonDetector), ("pipelined", PipelinedPersonDetector)):
+        config = SystemConfig.create_default()
+        config.camera.width, config.camera.height = width, height
+        config.detection_batch_size = batch_size
+        config.detector_preprocessing = True
+        config.frame_queue_size = max(config.frame_queue_size, batch_size * 4)
+
+        stats = _run_detector(config, scene, duration, 0.0, detector_class=detector_class)
+        throughput = stats['throughput_fps']
+        baseline = baseline or throughput
+        speedup = throughput / baseline if baseline else 0.0
+        print(f"   {label:>10}: {throughput:6.1f} FPS ({speedup:4.2f}x), p99 {stats['latency_p99_ms']:7.1f} ms")
+        if 'pipeline' in stats:
+            for stage in STAGES:
+                stage_stats = stats['pipeline'][stage]
+                print(f"   {'':>10}  {stage:>11}: {stage_stats['mean_ms']:6.2f} ms/batch, "
+                      f"busy {stage_stats['utilisation']:4.0%}")
+
+
+def _match_ground_truth(detections, ground_truth, iou_threshold: float = 0.5) -> int:
+    """Count ground-truth boxes matched by a detection with IoU >= iou_threshold."""
+    if not detections or not ground_truth:
+        return 0
+    predicted = np.array([detection_to_xyxy(d) for d in detections])
+    truth = np.array([[b.x, b.y, b.x + b.width, b.y + b.height] for b in ground_truth], dtype=np.float64)
+    return int(np.count_nonzero((box_iou(truth, predicted) >= iou_threshold).any(axis=1)))
+
+
+def benchmark_roi(width: int, height: int, num_frames: int, num_people: int, person_size: int):
+    """Compare recall and CPU per frame for full-frame detection vs track-guided ROI crops."""
+    print(f"ROI detection benchmark - {width}x{height}, {num_people} people of {person_size}px, {num_frames} frames")
+
+    scene = SyntheticScene(SyntheticSceneConfig(num_people=num_people, person_width=person_size // 2,
+                                                person_height=person_size), width, height)
+    for roi_enabled in (False, True):
+        config = SystemConfig.create_default()
+        config.roi_detection_enabled = roi_enabled
+        detector = PersonDetector(config, queue.Queue(), queue.Queue(), threading.Event())
+        if detector.model is None:
+            print("Model not available")
+            return
+
+        scene.position = 0
+        matched = total = 0
+        cpu_start = time.process_time()
+        for frame_id in range(num_frames):
+            frame, ground_truth = scene.next_frame()
+            frame_data = FrameData(frame=frame, timestamp=time.time(), frame_id=frame_id, camera_id="benchmark")
+            result = detector._process_frame(frame_data)
+            matched += _match_ground_truth(result.detections if result else [], ground_truth)
+            total += len(ground_truth)
+        cpu_ms = (time.process_time() - cpu_start) * 1000.0 / num_frames
+
+        label = "track-guided ROI" if roi_enabled else "full frame"
+        print(f"   {label:>16}: recall {matched / max(total, 1):6.1%}, {cpu_ms:7.1f} ms CPU/frame")
+        if roi_enabled:
+            roi_stats = detector.get_detection_stats()['roi_detection']
+            print(f"   {'':>16}  {roi_stats['full_passes']} full / {roi_stats['roi_passes']} ROI passes, "
+                  f"{roi_stats['crops_per_roi_pass']:.1f} crops covering {roi_stats['mean_crop_coverage']:.0%} "
+                  f"of the frame")
+
+
+def benchmark_roi_mask(width: int, height: int, num_frames: int, num_people: int, active_fraction: float):
+    """Compare pixels per inference, CPU per frame and recall with and without a static ROI mask."""
+    print(f"ROI mask benchmark - {width}x{height}, {num_people} people, {num_frames} frames, "
+          f"bottom {active_fraction:.0%} of the frame active")
+
+    top = int(height * (1.0 - active_fraction))
+    include = [[[0, top], [width, top], [width, height], [0, height]]]
+    scene = SyntheticScene(SyntheticSceneConfig(num_people=num_people), width, height)
+    for masked in (False, True):
+        config = SystemConfig.create_default()
+        config.camera.width, config.camera.height = width, height
+        config.camera.camera_id = "benchmark"
+        config.camera.roi_include = include if masked else None
+        detector = PersonDetector(config, queue.Queue(), queue.Queue(), threading.Event())
+        if detector.model is None:
+            print("Model not available")
+            return
+
+        # Recall counts only people whose centre is in the active area, for both runs
+        scene.position = 0
+        matched = total = 0
+        cpu_start = time.process_time()
+        for frame_id in range(num_frames):
+            frame, ground_truth = scene.next_frame()
+            ground_truth = [box for box in ground_truth if box.y + box.height / 2 >= top]
+            frame_data = FrameData(frame=frame, timestamp=time.time(), frame_id=frame_id, camera_id="benchmark")
+            result = detector._process_frame(frame_data)
+            matched += _match_ground_truth(result.detections if result else [], ground_truth)
+            total += len(ground_truth)
+        cpu_ms = (time.process_time() - cpu_start) * 1000.0 / num_frames
+
+        stats = detector.get_detection_stats()
+        mask_stats = (stats['roi_masks'] or {}).get("benchmark")
+        pixels = mask_stats['pixels_per_inference'] if mask_stats else width * height
+        label = "masked" if masked else "full frame"
+        print(f"   {label:>10}: recall {matched / max(total, 1):6.1%}, {pixels / 1e6:5.2f} MP per inference, "
+              f"{cpu_ms:7.1f} ms CPU/frame")
+        if mask_stats:
+            input_size = detector._masked_input_size(detector.roi_masks["benchmark"], (height, width))
+            print(f"   {'':>10}  input size {input_size} (full frame {detector.image_size}), "
+                  f"{mask_stats['boxes_dropped']} boxes dropped outside the mask")
+
+
+def benchmark_cascade(width: int, height: int, num_frames: int, num_people: int, small_model: str,
+                      large_model: str, margin: float, crop_size: int):
+    """Compare accuracy and time per frame for the small model, the large model and the two-tier cascade."""
+    print(f"Model cascade benchmark - {width}x{height}, {num_people} people, {num_frames} frames, "
+          f"{small_model} -> {large_model}")
+
+    scene = SyntheticScene(SyntheticSceneConfig(num_people=num_people), width, height)
+    runs = (
+        (f"{small_model} only", small_model, None),
+        (f"{large_model} only", large_model, None),
+        ("cascade", small_model, large_model)
+    )
+    baseline_ms = None
+    for label, model_path, cascade_model_path in runs:
+        config = SystemConfig.create_default()
+        config.model_path = model_path
+        config.cascade_model_path = cascade_model_path
+        config.cascade_margin = margin
+        config.cascade_image_size = crop_size
+        detector = PersonDetector(config, queue.Queue(), queue.Queue(), threading.Event())
+        if detector.model is None:
+            print(f"   {label}: model not available")
+            continue
+
+        scene.position = 0
+        matched = total = predicted = 0
+        elapsed = 0.0
+        for frame_id in range(num_frames):
+            frame, ground_truth = scene.next_frame()
+            frame_data = FrameData(frame=frame, timestamp=time.time(), frame_id=frame_id, camera_id="benchmark")
+            start = time.perf_counter()
+            result = detector._process_frame(frame_data)
+            elapsed += time.perf_counter() - start
+            detections = result.detections if result else []
+            matched += _match_ground_truth(detections, ground_truth)
+            total += len(ground_truth)
+            predicted += len(detections)
+        ms_per_frame = elapsed * 1000.0 / num_frames
+        if cascade_model_path is None and model_path == large_model:
+            baseline_ms = ms_per_frame
+
+        recall = matched / max(total, 1)
+        precision = min(matched, predicted) / max(predicted, 1)
+        cost = f" ({ms_per_frame / baseline_ms:4.0%} of {large_model})" if baseline_ms and cascade_model_path else ""
+        print(f"   {label:>16}: recall {recall:6.1%}, precision {precision:6.1%}, {ms_per_frame:7.1f} ms/frame{cost}")
+        cascade_stats = detector.get_detection_stats()['cascade']
+        if cascade_stats:
+            print(f"   {'':>16}  tier 2 fired on {cascade_stats['tier2_fire_rate']:.0%} of frames, "
+                  f"{cascade_stats['crops_per_tier2_frame']:.1f} crops and "
+                  f"{cascade_stats['tier2_ms_per_fired_frame']:.1f} ms when it did, "
+                  f"{cascade_stats['tier2_ms_per_frame']:.1f} ms/frame on average")
+
+
+def benchmark_preprocessing(width: int, height: int, batch_size: int, iterations: int):
+    """Compare hot-path allocations and time per frame with ultralytics vs detector-owned preprocessing."""
+    print(f"Preprocessing benchmark - {width}x{height}, batch {batch_size}, {iterations} batches")
+    print("   (traced: numpy/Python allocations; PyTorch's own allocator is not visible to tracemalloc)")
+
+    scene = SyntheticScene(SyntheticSceneConfig(num_people=5), width, height)
+    frames = [scene.next_frame()[0] for _ in range(batch_size)]
+
+    for label, detector_preprocessing, capture_resize in (("ultralytics", False, False),
+                                                          ("detector buffers", True, False),
+                                                          ("+ capture resize", True, True)):
+        config = SystemConfig.create_default()
+        config.detector_preprocessing = detector_preprocessing
+        config.detection_batch_size = batch_size
+        detector = PersonDetector(config, queue.Queue(), queue.Queue(), threading.Event())
+        if detector.model is None:
+            print("Model not available")
+            return
+        if detector_preprocessing and detector.preprocessor is None:
+            print("Detector preprocessing needs PyTorch")
+            return
+
+        # Capture resize happens on the camera thread, so it is done up front here
+        frame_scale = 1.0
+        inputs = frames
+        if capture_resize:
+            new_height, new_width = fit_to_input_size(height, width, config.inference_image_size)
+            inputs = [cv2.resize(frame, (new_width, new_height), interpolation=cv2.INTER_AREA) for frame in frames]
+            frame_scale = new_width / width
+
+        def make_batch(iteration):
+            return [FrameData(frame=frame, timestamp=time.time(), frame_id=iteration * batch_size + index,
+                              camera_id="benchmark", frame_scale=frame_scale)
+                    for index, frame in enumerate(inputs)]
+
+        for iteration in range(3):
+            detector._process_batch(make_batch(iteration))
+
+        transient_bytes = 0
+        elapsed = 0.0
+        tracemalloc.start()
+        for iteration in range(iterations):
+            batch = make_batch(iteration)
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            start = time.perf_counter()
+            detector._process_batch(batch)
+            elapsed += time.perf_counter() - start
+            transient_bytes += tracemalloc.get_traced_memory()[1] - baseline
+        tracemalloc.stop()
+
+        num_frames = iterations * batch_size
+        print(f"   {label:>16}: {transient_bytes / num_frames / 1024:9.1f} KiB peak allocation/frame, "
+              f"{elapsed * 1000.0 / num_frames:7.2f} ms/frame")
+
+
+class _StubBoxes:
+    """Minimal stand-in for ultralytics Boxes backed by an (n, 6) array."""
+
+    def __init__(self, data: np.ndarray):
+        self.data = data
+
+    def __len__(self):
+        return len(self.data)
+
+
+class _StubResult:
+    def __init__(self, data: np.ndarray):
+        self.boxes = _StubBoxes(data)
+
+
+def _random_yolo_boxes(num_boxes: int, width: int, height: int, rng) -> np.ndarray:
+    """Random [x1, y1, x2, y2, conf, cls] rows, roughly half of them persons."""
+    top_left = rng.uniform([0, 0], [width - 50, height - 100], size=(num_boxes, 2))
+    size = rng.uniform([20, 40], [50, 100], size=(num_boxes, 2))
+    confidences = rng.uniform(0.05, 1.0, size=num_boxes)
+    classes = np.where(rng.random(num_boxes) < 0.5, 0, rng.integers(1, 80, size=num_boxes))
+    return np.column_stack([top_left, top_left + size, confidences, classes]).astype(np.float32)
+
+
+def benchmark_extraction(box_counts, iterations: int):
+    """Measure per-frame person-box extraction cost for different box counts."""
+    config = SystemConfig.create_default()
+    detector = PersonDetector(config, queue.Queue(), queue.Queue(), threading.Event())
+    frame_data = FrameData(frame=None, timestamp=time.time(), frame_id=0, camera_id="benchmark")
+    rng = np.random.default_rng(0)
+
+    print(f"Person-box extraction benchmark - {iterations} iterations, "
+          f"threshold {detector.confidence_threshold}, top-{detector.max_detections}")
+    for num_boxes in box_counts:
+        result = _StubResult(_random_yolo_boxes(num_boxes, 640, 480, rng))
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            detections = detector._extract_person_detections(result, frame_data)
+        cost_us = (time.perf_counter() - start) * 1e6 / iterations
+        print(f"   {num_boxes:>4} boxes -> {len(detections):>3} persons: {cost_us:8.1f} us/frame")
+
+
+def benchmark_postprocess(image_path: str, iterations: int, model_path: str = "yolov8n.pt"):
+    """Compare post-processing time with class/confidence filtering outside vs inside NMS."""
+    config = SystemConfig.create_default()
+    detector = PersonDetector(config, queue.Queue(), queue.Queue(), threading.Event(), model_path=model_path)
+    if detector.model is None:
+        print("Model not available")
+        return
+
+    frame = cv2.imread(image_path)
+    if frame is None:
+        print(f"Failed to read image: {image_path}")
+        return
+    frame_data = FrameData(frame=frame, timestamp=time.time(), frame_id=0, camera_id="benchmark")
+
+    print(f"Post-processing benchmark - {image_path}, {iterations} iterations")
+    variants = [
+        ("all classes, filter after", {'verbose': False}),
+        ("person-only inside NMS", detector._inference_kwargs())
+    ]
+    for label, kwargs in variants:
+        nms_ms = extract_ms = 0.0
+        boxes = persons = 0
+        for _ in range(iterations):
+            result = detector.model(frame, **kwargs)[0]
+            nms_ms += result.speed.get('postprocess', 0.0)
+            start = time.perf_counter()
+            detections = detector._extract_person_detections(result, frame_data)
+            extract_ms += (time.perf_counter() - start) * 1000.0
+            boxes, persons = len(result.boxes), len(detections)
+        print(f"   {label:>26}: NMS {nms_ms / iterations:6.2f} ms + extraction {extract_ms / iterations:6.2f} ms "
+              f"({boxes} boxes -> {persons} persons)")
+
+
+def _resident_memory_mb() -> float:
+    """Current resident set size of this process in MB (Linux)."""
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024.0
+    return 0.0
+
+
+def _backend_worker(backend_name: str, model_path: str, image_size: int, iterations: int,
+                    cache_dir, results: multiprocessing.Queue):
+    """Load and time one backend; runs in its own process so memory figures don't mix."""
+    try:
+        backend = create_backend(backend_name, model_path, cache_dir)
+        if not backend.is_available():
+            results.put({'backend': backend_name, 'error': 'not installed'})
+            return
+
+        baseline_mb = _resident_memory_mb()
+        model = backend.load(image_size)
+        frame = np.random.default_rng(0).integers(0, 255, (image_size, image_size, 3), dtype=np.uint8)
+        kwargs = {'classes': [0], 'imgsz': image_size, 'verbose': False}
+        for _ in range(3):
+            model(frame, **kwargs)
+
+        latencies = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            model(frame, **kwargs)
+            latencies.append((time.perf_counter() - start) * 1000.0)
+
+        results.put({
+            'backend': backend_name,
+            'mean_ms': float(np.mean(latencies)),
+            'p95_ms': float(np.percentile(latencies, 95)),
+            'rss_mb': _resident_memory_mb(),
+            'model_mb': _resident_memory_mb() - baseline_mb,
+            'artifact': backend.artifact_path(image_size) or model_path
+        })
+    except Exception as e:
+        results.put({'backend': backend_name, 'error': str(e)})
+
+
+def benchmark_backends(backend_names, model_path: str, image_size: int, iterations: int, cache_dir=None):
+    """Compare inference latency and resident memory per backend, one process each."""
+    print(f"Inference backend benchmark - {model_path} at {image_size}px, {iterations} iterations")
+    context = multiprocessing.get_context('spawn')
+    for backend_name in backend_names:
+        results = context.Queue()
+        worker = context.Process(target=_backend_worker,
+                                 args=(backend_name, model_path, image_size, iterations, cache_dir, results))
+        worker.start()
+        result = results.get()
+        worker.join()
+
+        if 'error' in result:
+            print(f"   {backend_name:>12}: skipped ({result['error']})")
+            continue
+        print(f"   {backend_name:>12}: mean {result['mean_ms']:7.2f} ms, p95 {result['p95_ms']:7.2f} ms, "
+              f"RSS {result['rss_mb']:7.1f} MB (model +{result['model_mb']:.1f} MB) [{result['artifact']}]")
+
+
+def _load_clip_labels(clip: str):
+    """
+    Per-frame person boxes for a clip, if labelled.
+
+    Labels live in labels.json inside a packed recording directory, or in
+    <video>.labels.json next to a video file, as {"boxes": [[[x, y, w, h], ...], ...]}.
+    """
+    path = os.path.join(clip, "labels.json") if os.path.isdir(clip) else clip + ".labels.json"
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return [np.array([[x, y, x + w, y + h] for x, y, w, h in boxes], dtype=np.float64).reshape(-1, 4)
+                for boxes in json.load(f)["boxes"]]
+
+
+def _count_true_positives(predicted: np.ndarray, truth: np.ndarray, iou_threshold: float = 0.5) -> int:
+    """One-to-one greedy matching of predicted to reference boxes at IoU >= iou_threshold."""
+    if len(predicted) == 0 or len(truth) == 0:
+        return 0
+    iou = box_iou(predicted, truth)
+    matched_predictions, matched_truth = set(), set()
+    for flat_index in np.argsort(-iou, axis=None):
+        prediction_index, truth_index = np.unravel_index(flat_index, iou.shape)
+        if iou[prediction_index, truth_index] < iou_threshold:
+            break
+        if prediction_index not in matched_predictions and truth_index not in matched_truth:
+            matched_predictions.add(prediction_index)
+            matched_truth.add(truth_index)
+    return len(matched_truth)
+
+
+def benchmark_precision(clips, backend_name: str, calibration: str, model_path: str, image_size: int,
+                        max_frames: int):
+    """Person precision/recall and per-frame latency of FP32 vs INT8 on the same clips."""
+    print(f"FP32 vs INT8 benchmark - {backend_name} at {image_size}px, {len(clips)} clips, "
+          f"calibrated on {calibration}")
+
+    reference = {}  # FP32 detections per clip, used where a clip has no labels
+    baseline_latency = None
+    for precision in ("fp32", "int8"):
+        config = SystemConfig.create_default()
+        config.model_path = model_path
+        config.inference_backend = backend_name
+        config.inference_image_size = image_size
+        config.model_precision = precision
+        config.calibration_data = calibration
+        detector = PersonDetector(config, queue.Queue(), queue.Queue(), threading.Event())
+        if detector.model is None:
+            print(f"   {precision}: model not available")
+            return
+
+        true_positives = predicted_count = truth_count = 0
+        latencies = []
+        unlabelled = False
+        for clip in clips:
+            labels = _load_clip_labels(clip)
+            unlabelled = unlabelled or labels is None
+            replay = ReplaySource(clip)
+            if not replay.open():
+                continue
+            frame_id = 0
+            while frame_id < max_frames:
+                item = replay.read()
+                if item is None:
+                    break
+                frame_data = FrameData(frame=np.array(item[0]), timestamp=time.time(), frame_id=frame_id,
+                                       camera_id="benchmark")
+                result = detector._process_frame(frame_data)
+                predicted = np.array([detection_to_xyxy(d) for d in result.detections]).reshape(-1, 4) \
+                    if result else np.empty((0, 4))
+                latencies.append(result.processing_time * 1000.0 if result else 0.0)
+
+                if labels is not None:
+                    truth = labels[frame_id] if frame_id < len(labels) else np.empty((0, 4))
+                elif precision == "fp32":
+                    reference[(clip, frame_id)] = truth = predicted
+                else:
+                    truth = reference.get((clip, frame_id), np.empty((0, 4)))
+                true_positives += _count_true_positives(predicted, truth)
+                predicted_count += len(predicted)
+                truth_count += len(truth)
+                frame_id += 1
+            replay.close()
+
+        mean_latency = float(np.mean(latencies)) if latencies else 0.0
+        baseline_latency = baseline_latency or mean_latency
+        print(f"   {precision}: precision {true_positives / max(predicted_count, 1):6.1%}, "
+              f"recall {true_positives / max(truth_count, 1):6.1%}, "
+              f"latency mean {mean_latency:6.1f} ms / p95 {np.percentile(latencies, 95) if latencies else 0.0:6.1f} ms "
+              f"({baseline_latency / mean_latency if mean_latency else 0.0:.2f}x), {len(latencies)} frames")
+    if unlabelled:
+        print("   (clips without labels.json are scored against the FP32 detections)")
+
+
+def main():
+    """Run the selected benchmark"""
+    parser = argparse.ArgumentParser(description="Camera detection system benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    pi_parser = subparsers.add_parser("pi-capture", help="Pi Camera JPEG vs raw capture cost")
+    pi_parser.add_argument("--width", type=int, default=1280)
+    pi_parser.add_argument("--height", type=int, default=720)
+    pi_parser.add_argument("--frames", type=int, default=200)
+
+    mjpeg_parser = subparsers.add_parser("mjpeg", help="JPEG decode cost per backend and DCT scale")
+    mjpeg_parser.add_argument("--input", default=None, help="Recorded MJPEG stream (synthetic if omitted)")
+    mjpeg_parser.add_argument("--width", type=int, default=1920)
+    mjpeg_parser.add_argument("--height", type=int, default=1080)
+    mjpeg_parser.add_argument("--frames", type=int, default=200)
+    mjpeg_parser.add_argument("--target-widths", type=int, nargs="+", default=[0, 960, 640, 320],
+                              help="Decode target widths to compare (0 = full size)")
+
+    batch_parser = subparsers.add_parser("batch", help="Detector throughput vs p99 latency per batch size")
+    batch_parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 2, 4, 8])
+    batch_parser.add_argument("--timeout-ms", type=float, default=10.0)
+    batch_parser.add_argument("--duration", type=float, default=20.0)
+    batch_parser.add_argument("--fps", type=float, default=0.0, help="Input frame rate (0 = saturate)")
+    batch_parser.add_argument("--width", type=int, default=640)
+    batch_parser.add_argument("--height", type=int, default=480)
+
+    extract_parser = subparsers.add_parser("extract", help="Per-frame person-box extraction cost")
+    extract_parser.add_argument("--boxes", type=int, nargs="+", default=[5, 50, 300])
+    extract_parser.add_argument("--iterations", type=int, default=2000)
+
+    post_parser = subparsers.add_parser("postprocess", help="Post-processing cost with and without in-NMS filtering")
+    post_parser.add_argument("--image", required=True, help="Crowded scene image")
+    post_parser.add_argument("--iterations", type=int, default=50)
+
+    backend_parser = subparsers.add_parser("backends", help="Inference latency and resident memory per backend")
+    backend_parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS))
+    backend_parser.add_argument("--model", default="yolov8n.pt")
+    backend_parser.add_argument("--image-size", type=int, default=640)
+    backend_parser.add_argument("--iterations", type=int, default=50)
+    backend_parser.add_argument("--cache-dir", default=None, help="Exported model cache directory")
+
+    pool_parser = subparsers.add_parser("pool", help="Throughput scaling with detector worker processes")
+    pool_parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    pool_parser.add_argument("--duration", type=float, default=20.0)
+    pool_parser.add_argument("--width", type=int, default=640)
+    pool_parser.add_argument("--height", type=int, default=480)
+
+    pipeline_parser = subparsers.add_parser("pipeline", help="Sequential vs pipelined detector throughput")
+    pipeline_parser.add_argument("--duration", type=float, default=20.0)
+    pipeline_parser.add_argument("--width", type=int, default=1280)
+    pipeline_parser.add_argument("--height", type=int, default=720)
+    pipeline_parser.add_argument("--batch-size", type=int, default=1)
+
+    roi_parser = subparsers.add_parser("roi", help="Recall and CPU per frame with track-guided ROI detection")
+    roi_parser.add_argument("--width", type=int, default=1920)
+    roi_parser.add_argument("--height", type=int, default=1080)
+    roi_parser.add_argument("--frames", type=int, default=300)
+    roi_parser.add_argument("--people", type=int, default=4)
+    roi_parser.add_argument("--person-size", type=int, default=40, help="Person height in pixels (far away)")
+
+    preprocess_parser = subparsers.add_parser("preprocess", help="Hot-path allocations with detector-owned preprocessing")
+    preprocess_parser.add_argument("--width", type=int, default=1920)
+    preprocess_parser.add_argument("--height", type=int, default=1080)
+    preprocess_parser.add_argument("--batch-size", type=int, default=1)
+    preprocess_parser.add_argument("--iterations", type=int, default=100)
+
+    mask_parser = subparsers.add_parser("mask", help="Pixels and CPU per frame with a static ROI mask")
+    mask_parser.add_argument("--width", type=int, default=1280)
+    mask_parser.add_argument("--height", type=int, default=720)
+    mask_parser.add_argument("--frames", type=int, default=300)
+    mask_parser.add_argument("--people", type=int, default=5)
+    mask_parser.add_argument("--active-fraction", type=float, default=0.5, help="Active share of the frame height")
+
+    cascade_parser = subparsers.add_parser("cascade", help="Small vs large model vs two-tier cascade")
+    cascade_parser.add_argument("--width", type=int, default=1280)
+    cascade_parser.add_argument("--height", type=int, default=720)
+    cascade_parser.add_argument("--frames", type=int, default=300)
+    cascade_parser.add_argument("--people", type=int, default=5)
+    cascade_parser.add_argument("--small-model", default="yolov8n.pt")
+    cascade_parser.add_argument("--large-model", default="yolov8m.pt")
+    cascade_parser.add_argument("--margin", type=float, default=0.15)
+    cascade_parser.add_argument("--crop-size", type=int, default=320)
+
+    precision_parser = subparsers.add_parser("precision", help="FP32 vs INT8 precision/recall and latency")
+    precision_parser.add_argument("--clips", nargs="+", required=True, help="Packed recordings or video files")
+    precision_parser.add_argument("--calibration", required=True, help="Recording used for INT8 calibration")
+    precision_parser.add_argument("--backend", default="openvino", choices=["onnxruntime", "openvino"])
+    precision_parser.add_argument("--model", default="yolov8n.pt")
+    precision_parser.add_argument("--image-size", type=int, default=640)
+    precision_parser.add_argument("--frames", type=int, default=500, help="Frames per clip")
+
+    args = parser.parse_args()
+
+    if args.benchmark == "pi-capture":
+        benchmark_pi_capture(args.width, args.height, args.frames)
+    elif args.benchmark == "mjpeg":
+        benchmark_mjpeg_decode(args.input, args.width, args.height, args.frames, args.target_widths)
+    elif args.benchmark == "batch":
+        benchmark_batching(args.batch_sizes, args.timeout_ms, args.duration, args.fps, args.width, args.height)
+    elif args.benchmark == "extract":
+        benchmark_extraction(args.boxes, args.iterations)
+    elif args.benchmark == "postprocess":
+        benchmark_postprocess(args.image, args.iterations)
+    elif args.benchmark == "pool":
+        benchmark_worker_pool(args.workers, args.duration, args.width, args.height)
+    elif args.benchmark == "pipeline":
+        benchmark_pipeline(args.duration, args.width, args.height, args.batch_size)
+    elif args.benchmark == "roi":
+        benchmark_roi(args.width, args.height, args.frames, args.people, args.person_size)
+    elif args.benchmark == "preprocess":
+        benchmark_preprocessing(args.width, args.height, args.batch_size, args.iterations)
+    elif args.benchmark == "mask":
+        benchmark_roi_mask(args.width, args.height, args.frames, args.people, args.active_fraction)
+    elif args.benchmark == "cascade":
+        benchmark_cascade(args.width, args.height, args.frames, args.people, args.small_model, args.large_model,
+                          args.margin, args.crop_size)
+    elif args.benchmark == "precision":
+        benchmark_precision(args.clips, args.backend, args.calibration, args.model, args.image_size, args.frames)
+    elif args.benchmark == "backends":
+        benchmark_backends(args.backends, args.model, args.image_size, args.iterations, args.cache_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,11 +8,12 @@ import sys
 import os
 import argparse
 import logging
+import signal
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from models.config import SystemConfig
+from models.config import SystemConfig, SyntheticSceneConfig
 from components.edge_agent import EdgeAgent
 
 
@@ -58,6 +59,12 @@ def main():
         action="store_true",
         help="Use mock camera for development testing (no hardware required)"
     )
+    parser.add_argument(
+        "--mock-people",
+        type=int,
+        default=None,
+        help="Number of people in the synthetic mock camera scene"
+    )
     
     args = parser.parse_args()
     
@@ -72,10 +79,19 @@ def main():
         logger.info(f"Loading configuration from: {config_path}")
         config = SystemConfig.from_json_file(config_path)
         
+        if args.mock_people is not None:
+            for camera_config in config.get_camera_configs():
+                camera_config.mock_scene = camera_config.mock_scene or SyntheticSceneConfig()
+                camera_config.mock_scene.num_people = args.mock_people
+        
         # Create and run EdgeAgent
         logger.info("Creating EdgeAgent...")
         edge_agent = EdgeAgent(config, use_mock_camera=args.mock_camera)
         
+        # SIGHUP re-reads the configuration file, e.g. to hot-swap the detector model
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, lambda signum, frame: edge_agent.reload_config(config_path))
+        
         if args.test_mode:
             logger.info("Running in test mode for 30 seconds...")
             if edge_agent.start():
@@ -3,7 +3,26 @@ Components package for camera detection system
 """
 
 from .camera_manager import CameraManager
+from .frame_buffer_pool import FrameBufferPool
+from .frame_pacer import FramePacer
+from .frame_queue import FrameQueue
+from .replay_source import ReplaySource
+from .synthetic_scene import SyntheticScene
+from .jpeg_decoder import JpegDecoder
+from .motion_gate import MotionGate
+from .adaptive_resolution import AdaptiveResolution
+from .tracker import PersonTracker
+from .roi_detection import RoiScheduler
+from .roi_mask import RoiMask
+from .detection_interval import DetectionInterval
+from .cascade import ModelCascade
+from .model_swap import ModelSwap
+from .frame_deadline import FrameDeadline
+from .inference_backends import InferenceBackend, create_backend
+from .preprocessing import LetterboxPreprocessor
 from .person_detector import PersonDetector
+from .detector_pool import DetectorWorkerPool
+from .detection_pipeline import PipelinedPersonDetector
 from .coordinate_calculator import CoordinateCalculator
 from .coordinate_processor import CoordinateProcessor
 from .telemetry_client import TelemetryClient
@@ -11,7 +30,27 @@ from .edge_agent import EdgeAgent
 
 __all__ = [
     'CameraManager',
+    'FrameBufferPool',
+    'FramePacer',
+    'FrameQueue',
+    'ReplaySource',
+    'SyntheticScene',
+    'JpegDecoder',
+    'MotionGate',
+    'AdaptiveResolution',
+    'PersonTracker',
+    'RoiScheduler',
+    'RoiMask',
+    'DetectionInterval',
+    'ModelCascade',
+    'ModelSwap',
+    'FrameDeadline',
+    'InferenceBackend',
+    'create_backend',
+    'LetterboxPreprocessor',
     'PersonDetector', 
+    'DetectorWorkerPool',
+    'PipelinedPersonDetector',
     'CoordinateCalculator',
     'CoordinateProcessor',
     'TelemetryClient',
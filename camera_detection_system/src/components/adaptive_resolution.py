@@ -0,0 +1,112 @@
+"""
+AdaptiveResolution - Latency-budget control of the inference image size
+Steps the model input size down under load and back up when there is headroom
+"""
+
+import threading
+from typing import List, Dict, Any, Optional
+
+
+class AdaptiveResolution:
+    """
+    Chooses the model input size from a ladder of sizes (e.g. 640, 480, 320)
+    so that smoothed per-frame inference latency stays within a budget.
+    A cooldown after every change stops it from oscillating between sizes.
+    """
+
+    def __init__(self,
+                 image_sizes: List[int],
+                 latency_budget: float,
+                 initial_size: Optional[int] = None,
+                 cooldown_frames: int = 30,
+                 headroom: float = 0.8,
+                 smoothing: float = 0.2):
+        """
+        Initialize the controller.
+
+        Args:
+            image_sizes: Allowed input sizes in pixels
+            latency_budget: Target per-frame inference latency in seconds
+            initial_size: Size to start at (defaults to the largest)
+            cooldown_frames: Frames to measure at a size before changing again
+            headroom: Step up only if the predicted latency at the larger size is below headroom * budget
+            smoothing: Weight of the newest sample in the latency moving average
+        """
+        self.image_sizes = sorted(set(image_sizes), reverse=True)
+        self.latency_budget = latency_budget
+        self.cooldown_frames = cooldown_frames
+        self.headroom = headroom
+        self.smoothing = smoothing
+
+        self.index = self.image_sizes.index(initial_size) if initial_size in self.image_sizes else 0
+        self.smoothed_latency: Optional[float] = None
+        self.frames_at_size = 0
+
+        # Statistics
+        self.step_downs = 0
+        self.step_ups = 0
+
+        self.lock = threading.Lock()
+
+    @property
+    def current_size(self) -> int:
+        return self.image_sizes[self.index]
+
+    def record(self, latency: float) -> bool:
+        """
+        Feed one frame's inference latency and adjust the size if needed.
+
+        Args:
+            latency: Inference time for the frame in seconds
+
+        Returns:
+            bool: True if the image size changed
+        """
+        with self.lock:
+            if self.smoothed_latency is None:
+                self.smoothed_latency = latency
+            else:
+                self.smoothed_latency += self.smoothing * (latency - self.smoothed_latency)
+            self.frames_at_size += 1
+
+            if self.frames_at_size < self.cooldown_frames:
+                return False
+
+            if self.smoothed_latency > self.latency_budget and self.index < len(self.image_sizes) - 1:
+                self.index += 1
+                self.step_downs += 1
+                self._reset()
+                return True
+
+            if self.index > 0:
+                # Inference cost grows roughly with pixel count
+                growth = (self.image_sizes[self.index - 1] / self.current_size) ** 2
+                if self.smoothed_latency * growth < self.latency_budget * self.headroom:
+                    self.index -= 1
+                    self.step_ups += 1
+                    self._reset()
+                    return True
+
+            return False
+
+    def _reset(self):
+        """Start measuring afresh at the new size (caller holds the lock)."""
+        self.smoothed_latency = None
+        self.frames_at_size = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get controller state.
+
+        Returns:
+            dict: Current size, budget, smoothed latency and step counters
+        """
+        with self.lock:
+            return {
+                'image_size': self.current_size,
+                'image_sizes': self.image_sizes,
+                'latency_budget_ms': self.latency_budget * 1000.0,
+                'smoothed_latency_ms': self.smoothed_latency * 1000.0 if self.smoothed_latency is not None else None,
+                'step_downs': self.step_downs,
+                'step_ups': self.step_ups
+            }
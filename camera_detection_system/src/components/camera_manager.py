@@ -4,15 +4,29 @@ Handles camera initialization, frame capture, and thread-safe frame distribution
 """
 
 import cv2
+import io
 import threading
 import queue
 import time
 import logging
-from typing import Optional, Tuple, Any
+from typing import Optional, Tuple, Any, List
 from dataclasses import dataclass
 import numpy as np
 
-from models.config import CameraConfig
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+from models.config import CameraConfig, SyntheticSceneConfig
+from models.telemetry import BoundingBox
+from .frame_buffer_pool import FrameBufferPool
+from .frame_pacer import FramePacer
+from .replay_source import ReplaySource
+from .synthetic_scene import SyntheticScene
+from .jpeg_decoder import JpegDecoder, is_jpeg_buffer
+from .frame_queue import FrameQueue
+from .preprocessing import fit_to_input_size
 
 
 @dataclass
@@ -22,6 +36,48 @@ class FrameData:
     timestamp: float
     frame_id: int
     camera_id: str
+    buffer_slot: Optional[int] = None  # FrameBufferPool slot backing `frame`, if any
+    buffer_pool: Optional[FrameBufferPool] = None
+    source_timestamp: Optional[float] = None  # original recorded timestamp for replayed frames
+    ground_truth: Optional[List[BoundingBox]] = None  # known person boxes for synthetic frames
+    encoded_frame: Optional[Any] = None  # JPEG bytes, decoded on demand into `frame`
+    jpeg_decoder: Optional[JpegDecoder] = None
+    frame_scale: float = 1.0  # `frame` pixels per camera pixel (< 1 after decode-time downscaling)
+
+    def ensure_decoded(self) -> bool:
+        """
+        Decode the compressed frame if it has not been decoded yet.
+        
+        Returns:
+            bool: True if `frame` holds pixels
+        """
+        if self.frame is None and self.encoded_frame is not None and self.jpeg_decoder is not None:
+            decoded = self.jpeg_decoder.decode(self.encoded_frame)
+            if decoded is None:
+                return False
+            self.frame, self.frame_scale = decoded
+            self.encoded_frame = None
+        return self.frame is not None
+
+    def release(self):
+        """Return the backing buffer to its pool once the frame is no longer needed."""
+        if self.buffer_pool is not None and self.buffer_slot is not None:
+            self.buffer_pool.release(self.buffer_slot)
+            self.buffer_slot = None
+
+
+class _StreamOutput:
+    """File-like sink for a picamera recording that hands each written frame to a callback."""
+
+    def __init__(self, on_frame):
+        self.on_frame = on_frame
+
+    def write(self, data) -> int:
+        self.on_frame(data)
+        return len(data)
+
+    def flush(self):
+        pass
 
 
 class CameraManager:
@@ -30,16 +86,19 @@ class CameraManager:
     Implements thread-safe frame capture with configurable frame rate control.
     """
     
-    def __init__(self, camera_config: CameraConfig, frame_queue: queue.Queue, shutdown_event: threading.Event, use_mock: bool = False, max_queue_size: int = 10):
+    def __init__(self, camera_config: CameraConfig, frame_queue: FrameQueue, shutdown_event: threading.Event, use_mock: bool = False, max_queue_size: int = 10,
+                 resize_to: Optional[int] = None):
         """
         Initialize CameraManager with configuration and output queue.
         
         Args:
             camera_config: Camera configuration object
-            frame_queue: Thread-safe queue for frame distribution
+            frame_queue: Thread-safe queue for frame distribution, shared by all cameras
             shutdown_event: Event to signal shutdown
             use_mock: Use mock camera mode for testing
-            max_queue_size: Maximum frames to keep in queue (prevents memory overflow)
+            max_queue_size: Maximum frames of this camera to keep in queue (prevents memory overflow)
+            resize_to: Downscale decoded frames so their longest side is this many pixels
+                (the model input size), None to pass frames at capture resolution
         """
         self.config = camera_config
         self.frame_queue = frame_queue
@@ -52,13 +111,62 @@ class CameraManager:
         
         # Frame tracking
         self.frame_counter = 0
+        self.frames_grabbed = 0
+        self.frames_decoded = 0
         self.last_frame_time = 0
         self.target_frame_interval = 1.0 / camera_config.fps if camera_config.fps > 0 else 0.033  # Default 30 FPS
         
+        # Reusable frame buffers: queued frames + one in the detector + one being captured
+        pool_size = camera_config.frame_pool_size or (max_queue_size + 2)
+        self.frame_pool = FrameBufferPool(pool_size, (camera_config.height, camera_config.width, 3))
+        
+        # Capture-side resize: frames leave the camera thread at model input scale
+        self.resize_to = resize_to
+        self.resize_pool = None
+        if resize_to:
+            resized_shape = fit_to_input_size(camera_config.height, camera_config.width, resize_to)
+            if resized_shape != (camera_config.height, camera_config.width):
+                self.resize_pool = FrameBufferPool(pool_size, resized_shape + (3,))
+        
         # Thread synchronization
         self.stop_event = shutdown_event
         self.lock = threading.Lock()
         
+        # Latest-frame-wins: grab() continuously, retrieve() only when the detector is ready
+        self.latest_frame_mode = (not use_mock
+                                  and camera_config.capture_mode.lower() == 'latest'
+                                  and camera_config.type.lower() == 'usb_camera')
+        
+        # MJPEG: keep compressed frames and let the consumer decode only what it processes
+        self.mjpeg_mode = (not use_mock
+                           and camera_config.capture_mode.lower() == 'mjpeg'
+                           and camera_config.type.lower() == 'usb_camera')
+        self.jpeg_decoder = JpegDecoder(camera_config.width, camera_config.jpeg_decode_width) if self.mjpeg_mode else None
+        
+        # Pi Camera raw video-port capture (JPEG still capture stays available as fallback):
+        # one persistent recording converts each frame into a pooled buffer, newest frame wins
+        self.pi_raw_capture = camera_config.capture_mode.lower() != 'jpeg'
+        self.pi_raw_format = camera_config.pi_raw_format.lower()
+        self.pi_raw_buffer = None
+        self.pi_raw_frames: queue.Queue = queue.Queue(maxsize=1)
+        self.pi_raw_recording = False
+        
+        # Synthetic mock scene, built when first used
+        self.synthetic_scene = None
+        self.mock_ground_truth = None
+        
+        # Recorded replay: paced by recorded timestamps (realtime) or by queue back-pressure (fast)
+        self.replay_mode = not use_mock and camera_config.type.lower() == 'replay'
+        self.replay_realtime = camera_config.replay_speed.lower() != 'fast'
+        self.replay_timestamp = None
+        self.replay_clock_origin = None  # (monotonic time, recorded timestamp) of first replayed frame
+        
+        # Frame pacing: deadline sleeps, or the camera's own blocking read for USB devices
+        source_paced = self.latest_frame_mode or (not use_mock
+                                                  and camera_config.pacing.lower() == 'camera'
+                                                  and camera_config.type.lower() == 'usb_camera')
+        self.pacer = FramePacer(self.target_frame_interval, self.stop_event, source_paced=source_paced)
+        
         # Logging
         self.logger = logging.getLogger(__name__)
     
@@ -86,11 +194,26 @@ class CameraManager:
                     self.logger.error(f"Failed to open USB camera {device_id}")
                     return False
                     
-                # Set camera properties
+                # Set camera properties (pixel format first, some drivers reset size on change)
+                fourcc = self.config.fourcc or ('MJPG' if self.mjpeg_mode else None)
+                if fourcc:
+                    self.camera.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+                if self.mjpeg_mode:
+                    # Hand out compressed bytes instead of decoding in the capture thread
+                    self.camera.set(cv2.CAP_PROP_CONVERT_RGB, 0)
                 self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, self.config.width)
                 self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, self.config.height)
                 self.camera.set(cv2.CAP_PROP_FPS, self.config.fps)
                 
+            elif self.config.type.lower() == 'replay':
+                # Recorded video or packed frame directory
+                if not self.config.replay_path:
+                    self.logger.error("Replay camera requires replay_path")
+                    return False
+                self.camera = ReplaySource(self.config.replay_path, loop=self.config.replay_loop)
+                if not self.camera.open():
+                    return False
+                
             elif self.config.type.lower() == 'pi_camera':
                 # Raspberry Pi Camera
                 try:
@@ -121,6 +244,9 @@ class CameraManager:
         """Main capture loop for the camera manager thread."""
         if self.use_mock:
             self.logger.info("Using mock camera mode")
+            if self.synthetic_scene is None:
+                self.synthetic_scene = SyntheticScene(self.config.mock_scene or SyntheticSceneConfig(),
+                                                      self.config.width, self.config.height)
         else:
             if not self.initialize_camera():
                 self.logger.error("Failed to initialize camera, exiting run loop")
@@ -131,34 +257,68 @@ class CameraManager:
         
         while not self.stop_event.is_set():
             try:
-                current_time = time.time()
-                
-                # Frame rate control
-                if current_time - self.last_frame_time < self.target_frame_interval:
-                    time.sleep(0.001)  # Small sleep to prevent busy waiting
-                    continue
+                # Frame rate control: sleep until the next slot (replay follows recorded time)
+                if not self.replay_mode and not self.pacer.wait_for_next_slot():
+                    break
                 
                 # Capture frame
-                frame = self._capture_frame()
-                if frame is None:
+                captured = self._capture_frame()
+                if captured is None:
+                    if self.replay_mode and self.camera.finished:
+                        self.logger.info("Replay finished")
+                        break
                     continue
+                frame, buffer_slot = captured
+                if self.replay_mode and not self._wait_for_replay_time(self.replay_timestamp):
+                    if buffer_slot is not None:
+                        self.frame_pool.release(buffer_slot)
+                    break
+                self.pacer.record_capture(time.monotonic())
+                current_time = time.time()
+                    
+                # Compressed MJPEG frames stay encoded until a consumer needs the pixels
+                encoded_frame = None
+                if self.mjpeg_mode and is_jpeg_buffer(frame):
+                    encoded_frame, frame = frame, None
+                
+                # Decoded frames can be shrunk to model input scale here, off the detector thread
+                buffer_pool = self.frame_pool
+                frame_scale = 1.0
+                if self.resize_to and frame is not None:
+                    frame, buffer_slot, buffer_pool, frame_scale = self._resize_for_model(frame, buffer_slot)
                     
                 # Create frame data
                 frame_data = FrameData(
                     frame=frame,
                     timestamp=current_time,
                     frame_id=self.frame_counter,
-                    camera_id=self.config.name
+                    camera_id=self.config.effective_id,
+                    buffer_slot=buffer_slot,
+                    buffer_pool=buffer_pool if buffer_slot is not None else None,
+                    source_timestamp=self.replay_timestamp if self.replay_mode else None,
+                    ground_truth=self.mock_ground_truth if self.use_mock else None,
+                    encoded_frame=encoded_frame,
+                    jpeg_decoder=self.jpeg_decoder if encoded_frame is not None else None,
+                    frame_scale=frame_scale
                 )
                 
+                # Fast replay: block on the queue so every recorded frame is processed
+                if self.replay_mode and not self.replay_realtime:
+                    if not self._put_with_backpressure(frame_data):
+                        frame_data.release()
+                        break
+                    self.frame_counter += 1
+                    self.last_frame_time = current_time
+                    continue
+                
                 # Add to queue (non-blocking)
                 try:
-                    # Remove old frames if queue is full
-                    while self.frame_queue.qsize() >= self.max_queue_size:
-                        try:
-                            self.frame_queue.get_nowait()
-                        except queue.Empty:
+                    # Drop this camera's oldest frames once it has its share queued
+                    while self.frame_queue.pending(self.config.effective_id) >= self.max_queue_size:
+                        evicted = self.frame_queue.evict_oldest(self.config.effective_id)
+                        if evicted is None:
                             break
+                        evicted.release()
                     
                     self.frame_queue.put_nowait(frame_data)
                     self.frame_counter += 1
@@ -166,6 +326,7 @@ class CameraManager:
                     
                 except queue.Full:
                     # Queue full, skip this frame
+                    frame_data.release()
                     self.logger.debug("Frame queue full, skipping frame")
                     
             except Exception as e:
@@ -176,63 +337,339 @@ class CameraManager:
         self._cleanup_camera()
         self.logger.info("Camera capture loop ended")
     
-    def _capture_frame(self) -> Optional[Any]:
+    def _acquire_buffer(self) -> Tuple[Optional[int], Optional[np.ndarray]]:
+        """
+        Take a reusable buffer from the frame pool.
+        
+        Returns:
+            Tuple of (slot, buffer), or (None, None) if the pool has run dry
+        """
+        acquired = self.frame_pool.acquire()
+        if acquired is None:
+            self.logger.debug("Frame buffer pool exhausted, allocating a fresh frame")
+            return None, None
+        return acquired
+    
+    def _resize_for_model(self, frame: np.ndarray,
+                          buffer_slot: Optional[int]) -> Tuple[np.ndarray, Optional[int], FrameBufferPool, float]:
+        """
+        Downscale a captured frame so its longest side matches the model input size.
+        
+        Args:
+            frame: Captured BGR frame
+            buffer_slot: Frame pool slot backing the frame, if any (released after resizing)
+            
+        Returns:
+            Tuple of (frame, slot, pool backing the slot, frame pixels per camera pixel)
+        """
+        height, width = frame.shape[:2]
+        new_height, new_width = fit_to_input_size(height, width, self.resize_to)
+        if (new_height, new_width) == (height, width):
+            return frame, buffer_slot, self.frame_pool, 1.0
+        
+        acquired = None
+        if self.resize_pool is not None and self.resize_pool.shape[:2] == (new_height, new_width):
+            acquired = self.resize_pool.acquire()
+        if acquired is not None:
+            slot, resized = acquired
+            cv2.resize(frame, (new_width, new_height), dst=resized, interpolation=cv2.INTER_AREA)
+        else:
+            slot, resized = None, cv2.resize(frame, (new_width, new_height), interpolation=cv2.INTER_AREA)
+        
+        if buffer_slot is not None:
+            self.frame_pool.release(buffer_slot)
+        return resized, slot, self.resize_pool, new_width / width
+    
+    def _capture_frame(self) -> Optional[Tuple[Any, Optional[int]]]:
         """
         Capture a single frame from camera or generate mock frame.
         
         Returns:
-            numpy array: Captured or mock frame, or None if capture failed
+            Tuple of (frame, buffer pool slot or None), or None if capture failed
         """
         try:
             if self.use_mock:
-                # Generate mock frame
-                frame = np.zeros((self.config.height, self.config.width, 3), dtype=np.uint8)
-                # Add some mock 'people' as rectangles
-                num_people = np.random.randint(1, 4)  # 1-3 mock people
-                for _ in range(num_people):
-                    x = np.random.randint(0, self.config.width - 100)
-                    y = np.random.randint(0, self.config.height - 200)
-                    cv2.rectangle(frame, (x, y), (x+80, y+160), (0, 255, 0), 2)
-                return frame
+                # Composite the synthetic frame straight into a pooled buffer when one is available
+                slot, buffer = self._acquire_buffer()
+                frame, self.mock_ground_truth = self.synthetic_scene.next_frame(buffer)
+                return frame, slot
+            
+            if self.replay_mode:
+                return self._read_replay_frame()
             
             if self.config.type.lower() == 'usb_camera':
-                ret, frame = self.camera.read()
+                if self.latest_frame_mode:
+                    return self._grab_latest_frame()
+                
+                if self.mjpeg_mode:
+                    # Compressed bytes vary in size, so they cannot use pooled buffers
+                    ret, encoded = self.camera.read()
+                    self.frames_grabbed += 1
+                    if not ret or encoded is None:
+                        self.logger.debug("Failed to read MJPEG frame from USB camera")
+                        return None
+                    return encoded, None
+                
+                # Decode straight into a pooled buffer when one is available
+                slot, buffer = self._acquire_buffer()
+                if buffer is not None:
+                    ret, frame = self.camera.read(image=buffer)
+                else:
+                    ret, frame = self.camera.read()
+                self.frames_grabbed += 1
                 if not ret or frame is None:
+                    if slot is not None:
+                        self.frame_pool.release(slot)
                     self.logger.debug("Failed to read frame from USB camera")
                     return None
-                return frame
+                if slot is not None and frame is not buffer:
+                    # Driver delivered a different shape than configured; buffer was not used
+                    self.frame_pool.release(slot)
+                    slot = None
+                self.frames_decoded += 1
+                return frame, slot
                 
             elif self.config.type.lower() == 'pi_camera':
-                import io
-                import numpy as np
-                from PIL import Image
-                
-                # Capture to stream
-                stream = io.BytesIO()
-                self.camera.capture(stream, format='jpeg')
-                stream.seek(0)
-                
-                # Convert to numpy array
-                image = Image.open(stream)
-                frame = np.array(image)
+                if self.pi_raw_capture:
+                    try:
+                        return self._capture_pi_raw_frame()
+                    except Exception as e:
+                        self.logger.warning(f"Raw Pi Camera capture failed ({e}), falling back to JPEG capture")
+                        self.pi_raw_capture = False
+                        self._stop_pi_raw_stream()
                 
-                # Convert RGB to BGR (OpenCV format)
-                if len(frame.shape) == 3:
-                    frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-                    
-                return frame
+                return self._capture_pi_jpeg_frame()
                 
         except Exception as e:
             self.logger.error(f"Frame capture failed: {e}")
             return None
     
+    def _read_replay_frame(self) -> Optional[Tuple[Any, Optional[int]]]:
+        """
+        Read the next recorded frame. BGR packed recordings are returned as zero-copy
+        memory-mapped views; video files and grayscale recordings fill a pooled buffer.
+        
+        Returns:
+            Tuple of (frame, buffer pool slot or None), or None at end of recording
+        """
+        zero_copy = self.camera.is_packed and not self.camera.grayscale
+        slot, buffer = (None, None) if zero_copy else self._acquire_buffer()
+        result = self.camera.read(out=buffer)
+        if result is None:
+            if slot is not None:
+                self.frame_pool.release(slot)
+            return None
+        
+        frame, self.replay_timestamp = result
+        if slot is not None and frame is not buffer:
+            self.frame_pool.release(slot)
+            slot = None
+        self.frames_grabbed += 1
+        self.frames_decoded += 1
+        return frame, slot
+    
+    def _wait_for_replay_time(self, recorded_timestamp: float) -> bool:
+        """
+        In realtime replay, sleep until the recorded timestamp is due.
+        
+        Returns:
+            bool: False if shutdown was requested while waiting
+        """
+        if not self.replay_realtime:
+            return not self.stop_event.is_set()
+        
+        now = time.monotonic()
+        if self.replay_clock_origin is None:
+            self.replay_clock_origin = (now, recorded_timestamp)
+            return True
+        
+        start_time, first_timestamp = self.replay_clock_origin
+        delay = start_time + (recorded_timestamp - first_timestamp) - now
+        if delay > 0 and self.stop_event.wait(delay):
+            return False
+        return True
+    
+    def _put_with_backpressure(self, frame_data: FrameData) -> bool:
+        """
+        Block until the frame fits in the queue.
+        
+        Returns:
+            bool: False if shutdown was requested before the frame was queued
+        """
+        while not self.stop_event.is_set():
+            try:
+                self.frame_queue.put(frame_data, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _capture_pi_raw_frame(self) -> Optional[Tuple[Any, Optional[int]]]:
+        """
+        Take the newest raw frame from the Pi Camera video-port recording.
+        
+        The recording is started on first use and runs until cleanup, so the
+        video port is set up once instead of per frame; frames are converted
+        into pooled buffers as the camera delivers them.
+        
+        Returns:
+            Tuple of (frame, buffer pool slot or None)
+            
+        Raises:
+            RuntimeError: If the recording delivers no frame in time
+        """
+        if not self.pi_raw_recording:
+            self._start_pi_raw_stream()
+        
+        # Allow a few frame intervals before treating the stream as broken
+        try:
+            return self.pi_raw_frames.get(timeout=max(1.0, 10 * self.target_frame_interval))
+        except queue.Empty:
+            raise RuntimeError("no frame from the video-port recording")
+    
+    def _start_pi_raw_stream(self):
+        """Start the persistent raw recording on the Pi Camera video port."""
+        self.camera.start_recording(_StreamOutput(self._on_pi_raw_frame), format=self.pi_raw_format)
+        self.pi_raw_recording = True
+    
+    def _stop_pi_raw_stream(self):
+        """Stop the raw recording and return any frame still waiting to its pool."""
+        if self.pi_raw_recording:
+            self.pi_raw_recording = False
+            try:
+                self.camera.stop_recording()
+            except Exception as e:
+                self.logger.debug(f"Stopping Pi Camera recording failed: {e}")
+        try:
+            _, slot = self.pi_raw_frames.get_nowait()
+            if slot is not None:
+                self.frame_pool.release(slot)
+        except queue.Empty:
+            pass
+    
+    def _on_pi_raw_frame(self, data: bytes):
+        """
+        Convert one recorded BGR or YUV frame into a pooled buffer (picamera callback thread).
+        
+        The firmware pads raw frames to a width multiple of 32 and a height
+        multiple of 16. If the configured resolution is already aligned, frames
+        convert directly into the pooled buffer; otherwise the visible region is
+        copied out of the padded frame.
+        
+        Args:
+            data: One unencoded frame as written by the camera
+        """
+        width, height = self.config.width, self.config.height
+        padded_width = (width + 31) // 32 * 32
+        padded_height = (height + 15) // 16 * 16
+        aligned = padded_width == width and padded_height == height
+        
+        raw = np.frombuffer(data, dtype=np.uint8)
+        rows = padded_height * 3 // 2 if self.pi_raw_format == 'yuv' else padded_height
+        if raw.size != rows * padded_width * (1 if self.pi_raw_format == 'yuv' else 3):
+            self.logger.debug(f"Dropping raw Pi Camera frame of unexpected size {raw.size}")
+            return
+        
+        slot, buffer = self._acquire_buffer()
+        if buffer is None:
+            buffer = np.empty((height, width, 3), dtype=np.uint8)
+        
+        if self.pi_raw_format == 'yuv':
+            # I420: full-resolution Y plane followed by quarter-resolution U and V planes
+            yuv = raw.reshape(rows, padded_width)
+            if aligned:
+                cv2.cvtColor(yuv, cv2.COLOR_YUV2BGR_I420, dst=buffer)
+            else:
+                if self.pi_raw_buffer is None:
+                    self.pi_raw_buffer = np.empty((padded_height, padded_width, 3), dtype=np.uint8)
+                cv2.cvtColor(yuv, cv2.COLOR_YUV2BGR_I420, dst=self.pi_raw_buffer)
+                np.copyto(buffer, self.pi_raw_buffer[:height, :width])
+        else:
+            np.copyto(buffer, raw.reshape(padded_height, padded_width, 3)[:height, :width])
+        self.frames_grabbed += 1
+        self.frames_decoded += 1
+        
+        # Newest frame wins: a frame the capture loop has not taken yet is dropped
+        try:
+            _, stale_slot = self.pi_raw_frames.get_nowait()
+            if stale_slot is not None:
+                self.frame_pool.release(stale_slot)
+        except queue.Empty:
+            pass
+        self.pi_raw_frames.put_nowait((buffer, slot))
+    
+    def _capture_pi_jpeg_frame(self) -> Optional[Tuple[Any, Optional[int]]]:
+        """
+        Capture a JPEG still from the Pi Camera and decode it (legacy fallback path).
+        
+        Returns:
+            Tuple of (frame, None), or None if capture failed
+        """
+        if Image is None:
+            self.logger.error("PIL not available. Install pillow for Pi Camera JPEG capture.")
+            return None
+        
+        # Capture to stream
+        stream = io.BytesIO()
+        self.camera.capture(stream, format='jpeg')
+        stream.seek(0)
+        
+        # Convert to numpy array
+        image = Image.open(stream)
+        frame = np.array(image)
+        
+        # Convert RGB to BGR (OpenCV format)
+        if len(frame.shape) == 3:
+            frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+        
+        self.frames_grabbed += 1
+        self.frames_decoded += 1
+        return frame, None
+    
+    def _grab_latest_frame(self) -> Optional[Tuple[Any, Optional[int]]]:
+        """
+        Grab the newest frame from the driver and decode it only if the detector is ready.
+        
+        grab() blocks until the device delivers a frame and keeps the driver
+        buffer fresh; retrieve() decodes the last grabbed frame, so decode work
+        follows inference throughput and queued frames are never stale.
+        
+        Returns:
+            Tuple of (frame, buffer pool slot or None), or None if no frame was decoded
+        """
+        if not self.camera.grab():
+            self.logger.debug("Failed to grab frame from USB camera")
+            return None
+        self.frames_grabbed += 1
+        
+        # Detector still has a pending frame from this camera: skip decoding this one
+        if self.frame_queue.pending(self.config.effective_id) > 0:
+            return None
+        
+        slot, buffer = self._acquire_buffer()
+        if buffer is not None:
+            ret, frame = self.camera.retrieve(image=buffer)
+        else:
+            ret, frame = self.camera.retrieve()
+        if not ret or frame is None:
+            if slot is not None:
+                self.frame_pool.release(slot)
+            self.logger.debug("Failed to retrieve grabbed frame from USB camera")
+            return None
+        if slot is not None and frame is not buffer:
+            self.frame_pool.release(slot)
+            slot = None
+        self.frames_decoded += 1
+        return frame, slot
+    
     def _cleanup_camera(self):
         """Cleanup camera resources."""
         try:
             if self.camera:
                 if self.config.type.lower() == 'usb_camera':
                     self.camera.release()
-                elif self.config.type.lower() == 'pi_camera':
+                elif self.config.type.lower() in ('pi_camera', 'replay'):
+                    self._stop_pi_raw_stream()
                     self.camera.close()
                 self.camera = None
                 
@@ -249,16 +686,42 @@ class CameraManager:
         with self.lock:
             return {
                 'name': self.config.name,
+                'camera_id': self.config.effective_id,
                 'type': self.config.type,
                 'width': self.config.width,
                 'height': self.config.height,
                 'fps': self.config.fps,
                 'is_running': self.is_running,
                 'frame_count': self.frame_counter,
-                'queue_size': self.frame_queue.qsize(),
-                'max_queue_size': self.max_queue_size
+                'queue_size': self.frame_queue.pending(self.config.effective_id),
+                'max_queue_size': self.max_queue_size,
+                'frame_pool': self.frame_pool.get_stats(),
+                'resize_to': self.resize_to,
+                'resize_pool': self.resize_pool.get_stats() if self.resize_pool else None,
+                'pacing': self.pacer.get_stats(),
+                'replay': self.camera.get_stats() if self.replay_mode and self.camera else None,
+                'jpeg_decoder': self.jpeg_decoder.get_stats() if self.jpeg_decoder else None,
+                'capture': {
+                    'mode': self._capture_mode_name(),
+                    'frames_grabbed': self.frames_grabbed,
+                    'frames_decoded': self.frames_decoded
+                }
             }
     
+    def _capture_mode_name(self) -> str:
+        """Describe the capture path currently in use."""
+        if self.use_mock:
+            return 'mock'
+        if self.replay_mode:
+            return f'replay_{self.config.replay_speed.lower()}'
+        if self.latest_frame_mode:
+            return 'latest'
+        if self.mjpeg_mode:
+            return 'mjpeg'
+        if self.config.type.lower() == 'pi_camera':
+            return f'raw_{self.pi_raw_format}' if self.pi_raw_capture else 'jpeg'
+        return 'read'
+    
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -0,0 +1,140 @@
+"""
+ModelCascade - Two-tier person detection
+A small model scans every frame; boxes it is unsure about are re-checked by a larger model on crops
+"""
+
+import threading
+from typing import List, Tuple, Dict, Any, Optional
+import numpy as np
+
+from .roi_detection import CropWindow, crop_windows, merge_duplicate_boxes
+
+
+class ModelCascade:
+    """
+    Tier 1 (the detector's own model) runs with its confidence cut lowered
+    by margin so borderline boxes surface. Boxes within margin of the
+    detection threshold are uncertain: the tier-2 model re-detects in
+    square crops around them and its verdict replaces theirs. Confident
+    tier-1 boxes are kept as they are, and people found by both tiers are
+    merged.
+    """
+
+    def __init__(self, margin: float = 0.15, crop_size: int = 320, crop_margin: float = 0.5):
+        """
+        Initialize the cascade policy.
+
+        Args:
+            margin: Confidence distance from the threshold within which tier 1 is unsure
+            crop_size: Minimum tier-2 crop side in frame pixels (also the tier-2 input size)
+            crop_margin: Context added around each uncertain box, as a fraction of its size
+        """
+        self.margin = margin
+        self.crop_size = crop_size
+        self.crop_margin = crop_margin
+
+        # Statistics
+        self.frames = 0
+        self.tier2_frames = 0
+        self.tier2_crops = 0
+        self.tier2_seconds = 0.0
+        self.uncertain_boxes = 0
+        self.tier2_boxes = 0
+
+        self.lock = threading.Lock()
+
+    def tier1_threshold(self, threshold: float) -> float:
+        """Confidence cut for the tier-1 model call, low enough to surface uncertain boxes."""
+        return max(0.01, threshold - self.margin)
+
+    def split(self, confidences: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sort tier-1 boxes into confident and uncertain ones.
+
+        Args:
+            confidences: Tier-1 box confidences
+            threshold: Detection confidence threshold
+
+        Returns:
+            Tuple of (confident mask, uncertain mask)
+        """
+        confident = confidences >= threshold + self.margin
+        uncertain = ~confident & (confidences >= threshold - self.margin)
+        return confident, uncertain
+
+    def windows(self, boxes: np.ndarray, frame_shape: Tuple[int, ...]) -> List[CropWindow]:
+        """
+        Tier-2 crop windows around uncertain boxes.
+
+        Args:
+            boxes: (n, 4) uncertain boxes as x1, y1, x2, y2 in frame pixels
+            frame_shape: Shape of the frame
+
+        Returns:
+            List of windows (x1, y1, x2, y2) in frame pixels
+        """
+        height, width = frame_shape[:2]
+        return crop_windows(list(boxes), width, height, self.crop_size, self.crop_margin)
+
+    def merge(self, confident_xyxy: np.ndarray, confident_confidences: np.ndarray,
+              tier2_xyxy: np.ndarray, tier2_confidences: np.ndarray,
+              max_detections: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Combine confident tier-1 boxes with tier-2 boxes, dropping duplicates.
+
+        Args:
+            confident_xyxy: (n, 4) confident tier-1 boxes
+            confident_confidences: (n,) their confidences
+            tier2_xyxy: (m, 4) tier-2 boxes in frame pixels
+            tier2_confidences: (m,) their confidences
+            max_detections: Most boxes to keep
+
+        Returns:
+            Tuple of (xyxy, confidences), highest confidence first
+        """
+        xyxy = np.concatenate([confident_xyxy, tier2_xyxy]).reshape(-1, 4)
+        confidences = np.concatenate([confident_confidences, tier2_confidences])
+        keep = merge_duplicate_boxes(xyxy, confidences)[:max_detections]
+        return xyxy[keep], confidences[keep]
+
+    def record(self, uncertain_boxes: int = 0, crops: int = 0, tier2_boxes: int = 0,
+               tier2_seconds: Optional[float] = None):
+        """
+        Account one tier-1 frame and, if it fired, the tier-2 pass.
+
+        Args:
+            uncertain_boxes: Tier-1 boxes sent to tier 2
+            crops: Tier-2 crops run
+            tier2_boxes: Persons tier 2 found in the crops
+            tier2_seconds: Tier-2 time, None if tier 2 did not fire
+        """
+        with self.lock:
+            self.frames += 1
+            if tier2_seconds is None:
+                return
+            self.tier2_frames += 1
+            self.tier2_crops += crops
+            self.tier2_seconds += tier2_seconds
+            self.uncertain_boxes += uncertain_boxes
+            self.tier2_boxes += tier2_boxes
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cascade statistics.
+
+        Returns:
+            dict: Tier-2 fire rate, crops and cost per fired frame and per frame overall
+        """
+        with self.lock:
+            return {
+                'margin': self.margin,
+                'frames': self.frames,
+                'tier2_frames': self.tier2_frames,
+                'tier2_fire_rate': self.tier2_frames / self.frames if self.frames else 0.0,
+                'crops_per_tier2_frame': self.tier2_crops / self.tier2_frames if self.tier2_frames else 0.0,
+                'tier2_ms_per_fired_frame': (self.tier2_seconds / self.tier2_frames * 1000.0
+                                             if self.tier2_frames else 0.0),
+                'tier2_ms_per_frame': self.tier2_seconds / self.frames * 1000.0 if self.frames else 0.0,
+                'uncertain_boxes': self.uncertain_boxes,
+                'tier2_persons': self.tier2_boxes
+            }
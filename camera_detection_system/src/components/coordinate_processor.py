@@ -12,6 +12,7 @@ from dataclasses import dataclass
 
 from .person_detector import DetectionResult
 from .coordinate_calculator import CoordinateCalculator
+from .frame_deadline import FrameDeadline
 from models.telemetry import Detection, SpatialCoordinates
 from models.config import CameraConfig
 
@@ -25,6 +26,8 @@ class CoordinateResult:
     coordinate_calculation_time: float
     successful_calculations: int
     failed_calculations: int
+    inference_image_size: Optional[int] = None  # detector input size for this frame
+    reused: bool = False  # keep-alive: detections carried over from the last inferred frame
 
 
 class CoordinateProcessor:
@@ -37,7 +40,9 @@ class CoordinateProcessor:
                  detection_queue: queue.Queue, 
                  coordinate_queue: queue.Queue,
                  camera_config: CameraConfig,
-                 shutdown_event: threading.Event):
+                 shutdown_event: threading.Event,
+                 camera_configs: Optional[List[CameraConfig]] = None,
+                 max_frame_age_ms: Optional[float] = None):
         """
         Initialize CoordinateProcessor with input/output queues and camera configuration.
         
@@ -46,13 +51,22 @@ class CoordinateProcessor:
             coordinate_queue: Output queue for detection results with coordinates
             camera_config: Camera configuration for coordinate calculations
             shutdown_event: Event to signal shutdown
+            camera_configs: All cameras feeding the detector; each gets its own calculator
+            max_frame_age_ms: Skip detection results whose frame is older than this, None = no deadline
         """
         self.detection_queue = detection_queue
         self.coordinate_queue = coordinate_queue
         self.camera_config = camera_config
         
-        # Initialize coordinate calculator
+        # Initialize coordinate calculators, one per camera
         self.coordinate_calculator = CoordinateCalculator(camera_config)
+        self.coordinate_calculators = {camera_config.effective_id: self.coordinate_calculator}
+        for config in camera_configs or []:
+            if config.effective_id not in self.coordinate_calculators:
+                self.coordinate_calculators[config.effective_id] = CoordinateCalculator(config)
+        
+        # Results whose frame is past its deadline are skipped, not positioned late
+        self.frame_deadline = FrameDeadline("coordinates", max_frame_age_ms) if max_frame_age_ms else None
         
         # Processing state
         self.is_running = False
@@ -123,6 +137,10 @@ class CoordinateProcessor:
                 except queue.Empty:
                     continue
                 
+                if self.frame_deadline and self.frame_deadline.is_stale(detection_result.frame_data.timestamp):
+                    self.detection_queue.task_done()
+                    continue
+                
                 # Process detection result to add coordinates
                 coordinate_result = self._process_detections(detection_result)
                 
@@ -177,7 +195,11 @@ class CoordinateProcessor:
                             object_type=detection.object_type,
                             confidence=detection.confidence,
                             bounding_box=detection.bounding_box,
-                            spatial_coordinates=spatial_coords
+                            spatial_coordinates=spatial_coords,
+                            track_id=detection.track_id,
+                            camera_id=detection.camera_id,
+                            propagated=detection.propagated,
+                            reused=detection.reused
                         )
                         processed_detections.append(updated_detection)
                         successful_calcs += 1
@@ -208,7 +230,9 @@ class CoordinateProcessor:
                 processing_time=total_time,
                 coordinate_calculation_time=coordinate_time,
                 successful_calculations=successful_calcs,
-                failed_calculations=failed_calcs
+                failed_calculations=failed_calcs,
+                inference_image_size=detection_result.inference_image_size,
+                reused=detection_result.reused
             )
             
         except Exception as e:
@@ -226,8 +250,9 @@ class CoordinateProcessor:
             SpatialCoordinates: Calculated spatial coordinates, or None if calculation failed
         """
         try:
-            # Use coordinate calculator with the bounding box
-            spatial_coords = self.coordinate_calculator.calculate_coordinates(detection.bounding_box)
+            # Use the calculator of the camera that produced the detection
+            calculator = self.coordinate_calculators.get(detection.camera_id, self.coordinate_calculator)
+            spatial_coords = calculator.calculate_coordinates(detection.bounding_box)
             return spatial_coords
                 
         except Exception as e:
@@ -259,6 +284,7 @@ class CoordinateProcessor:
                 'failed_calculations': self.failed_calculations,
                 'success_rate': success_rate,
                 'last_processing_time': self.last_processing_time,
+                'stale_results': self.frame_deadline.get_stats() if self.frame_deadline else None,
                 'queue_sizes': {
                     'input_queue': self.detection_queue.qsize(),
                     'output_queue': self.coordinate_queue.qsize()
@@ -278,7 +304,8 @@ class CoordinateProcessor:
             'h_fov': self.coordinate_calculator.h_fov,
             'v_fov': self.coordinate_calculator.v_fov,
             'focal_length_x': getattr(self.coordinate_calculator, 'focal_length_x', 0),
-            'focal_length_y': getattr(self.coordinate_calculator, 'focal_length_y', 0)
+            'focal_length_y': getattr(self.coordinate_calculator, 'focal_length_y', 0),
+            'camera_ids': list(self.coordinate_calculators.keys())
         }
     
     def update_camera_config(self, new_config: CameraConfig):
@@ -290,8 +317,11 @@ class CoordinateProcessor:
         """
         try:
             with self.lock:
-                self.camera_config = new_config
-                self.coordinate_calculator = CoordinateCalculator(new_config)
+                calculator = CoordinateCalculator(new_config)
+                if new_config.effective_id == self.camera_config.effective_id:
+                    self.camera_config = new_config
+                    self.coordinate_calculator = calculator
+                self.coordinate_calculators[new_config.effective_id] = calculator
                 self.logger.info("Camera configuration updated and coordinate calculator reinitialized")
                 
         except Exception as e:
@@ -0,0 +1,98 @@
+"""
+DetectionInterval - Detect-every-N-frames scheduling
+Decides per camera which frames get model inference and which are covered by tracker propagation
+"""
+
+import threading
+from typing import Dict, Any
+
+
+class DetectionInterval:
+    """
+    Runs inference on one frame in N per camera and lets the tracker propagate
+    boxes on the frames in between. In adaptive mode N follows scene motion:
+    it is chosen so that the fastest tracked person drifts at most max_drift
+    of their height between inferences, and drops to 1 whenever people
+    appear or disappear.
+    """
+
+    def __init__(self, max_interval: int, adaptive: bool = True, max_drift: float = 0.25):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_interval: Largest number of frames per inference
+            adaptive: Adapt N to scene motion; otherwise always use max_interval
+            max_drift: Allowed motion between inferences, as a fraction of person height
+        """
+        self.max_interval = max(1, max_interval)
+        self.adaptive = adaptive
+        self.max_drift = max_drift
+
+        self.intervals: Dict[str, int] = {}
+        self.frames_since_detection: Dict[str, int] = {}
+
+        # Statistics
+        self.detected_frames = 0
+        self.propagated_frames = 0
+
+        self.lock = threading.Lock()
+
+    def should_detect(self, camera_id: str) -> bool:
+        """
+        Decide whether a camera's next frame needs model inference.
+
+        Args:
+            camera_id: Camera the frame came from
+
+        Returns:
+            bool: True to run the model, False to propagate tracks instead
+        """
+        with self.lock:
+            since = self.frames_since_detection.get(camera_id)
+            if since is None or since + 1 >= self.intervals.get(camera_id, 1):
+                self.frames_since_detection[camera_id] = 0
+                self.detected_frames += 1
+                return True
+            self.frames_since_detection[camera_id] = since + 1
+            self.propagated_frames += 1
+            return False
+
+    def update(self, camera_id: str, relative_speed: float, tracks_changed: bool):
+        """
+        Pick the interval after an inference pass.
+
+        Args:
+            camera_id: Camera that was just detected
+            relative_speed: Fastest track motion per frame, in person heights
+            tracks_changed: True if people appeared or disappeared in this pass
+        """
+        if not self.adaptive:
+            interval = self.max_interval
+        elif tracks_changed:
+            interval = 1
+        elif relative_speed <= 0:
+            interval = self.max_interval
+        else:
+            interval = int(min(self.max_interval, max(1.0, self.max_drift / relative_speed)))
+
+        with self.lock:
+            self.intervals[camera_id] = interval
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scheduling statistics.
+
+        Returns:
+            dict: Current interval per camera and inferred/propagated frame counts
+        """
+        with self.lock:
+            total = self.detected_frames + self.propagated_frames
+            return {
+                'max_interval': self.max_interval,
+                'adaptive': self.adaptive,
+                'intervals': dict(self.intervals),
+                'detected_frames': self.detected_frames,
+                'propagated_frames': self.propagated_frames,
+                'propagated_ratio': self.propagated_frames / total if total else 0.0
+            }
@@ -0,0 +1,294 @@
+"""
+PipelinedPersonDetector - PersonDetector with overlapping pre/post-processing
+Runs preprocessing, inference and post-processing of consecutive batches on separate threads
+"""
+
+import threading
+import queue
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any, Tuple
+import numpy as np
+
+try:
+    import torch
+except ImportError:
+    torch = None
+
+from .camera_manager import FrameData
+from .person_detector import PersonDetector, DetectionResult
+from .preprocessing import LetterboxPreprocessor, LetterboxGeometry
+from models.config import SystemConfig
+
+
+STAGE_QUEUE_SIZE = 1    # batches waiting between two stages
+STAGES = ('preprocess', 'inference', 'postprocess')
+
+
+@dataclass
+class PipelineBatch:
+    """A batch of frames on its way through the pipeline stages"""
+    frames: List[FrameData]
+    infer: List[int] = field(default_factory=list)     # indices run through the model
+    reuse: List[int] = field(default_factory=list)     # indices skipped by the motion gate
+    inputs: Any = None
+    geometries: Optional[List[LetterboxGeometry]] = None
+    origins: List[Tuple[int, int]] = field(default_factory=list)   # ROI mask crop origin of each inferred frame
+    image_size: int = 0
+    model_results: Any = None
+    model_seconds: float = 0.0      # input preparation plus model call, shared by the inferred frames
+    reuse_seconds: Dict[int, float] = field(default_factory=dict)  # decode and gate time of each reused frame
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+
+
+class PipelinedPersonDetector(PersonDetector):
+    """
+    PersonDetector whose work is split into three threads connected by short
+    FIFO queues: preprocessing (decode, motion gate, letterbox) of batch N+1
+    and post-processing (box extraction, result emission) of batch N-1 run
+    while batch N is in the model. Each stage handles batches strictly in
+    arrival order, so results leave in frame_queue order.
+
+    The tracker-driven modes decide how to detect a frame from the results
+    of the frame before, which a pipeline has not produced yet, so ROI
+    detection and detection intervals are turned off here.
+    """
+
+    def __init__(self,
+                 config: SystemConfig,
+                 frame_queue: queue.Queue,
+                 detection_queue: queue.Queue,
+                 shutdown_event: threading.Event,
+                 model_path: Optional[str] = None,
+                 load_in_background: bool = False):
+        """
+        Initialize the pipelined detector.
+
+        Args:
+            config: System configuration object
+            frame_queue: Input queue for frames from CameraManager
+            detection_queue: Output queue for detection results
+            shutdown_event: Event to signal shutdown
+            model_path: Path to YOLO model file (defaults to config.model_path)
+            load_in_background: Load and warm up the model on a separate thread
+        """
+        self.preprocess_queue: queue.Queue = queue.Queue(maxsize=STAGE_QUEUE_SIZE)
+        self.postprocess_queue: queue.Queue = queue.Queue(maxsize=STAGE_QUEUE_SIZE)
+        self.stage_threads: List[threading.Thread] = []
+
+        # Per-stage timing
+        self.stage_busy = {stage: 0.0 for stage in STAGES}
+        self.stage_batches = {stage: 0 for stage in STAGES}
+        self.stage_samples = {stage: deque(maxlen=1000) for stage in STAGES}
+        self.pipeline_started = None
+
+        super().__init__(config, frame_queue, detection_queue, shutdown_event, model_path, load_in_background)
+
+    def _configure_detection(self):
+        """Turn off the tracker-driven modes and set up the pipeline's preprocessor before the model loads."""
+        if self.tracker:
+            self.logger.warning("ROI detection and detection intervals need sequential detection; "
+                                "the pipelined detector runs the model on every frame")
+            self.tracker = None
+            self.roi_scheduler = None
+            self.detection_interval = None
+
+        # Letterboxing is the bulk of preprocessing, so it moves off the inference thread whenever it can.
+        # A batch holds its buffers from preprocessing until inference returns: one being prepared,
+        # STAGE_QUEUE_SIZE waiting and one in the model.
+        if torch is not None:
+            self.preprocessor = LetterboxPreprocessor(max_batch_size=self.batch_size,
+                                                      buffer_sets=STAGE_QUEUE_SIZE + 2)
+        else:
+            self.logger.warning("PyTorch not available; ultralytics preprocessing stays on the inference thread")
+
+    def run(self):
+        """Inference stage on the detector thread, with the other stages on helper threads."""
+        if not self.wait_until_ready():
+            if not self.stop_event.is_set():
+                self.logger.error("Model not initialized, exiting run loop")
+            return
+
+        self.is_running = True
+        self.pipeline_started = time.monotonic()
+        self.stage_threads = [
+            threading.Thread(target=self._preprocess_loop, name="PersonDetector-Preprocess", daemon=True),
+            threading.Thread(target=self._postprocess_loop, name="PersonDetector-Postprocess", daemon=True)
+        ]
+        for thread in self.stage_threads:
+            thread.start()
+        self.logger.info("Pipelined person detection started")
+
+        while not self.stop_event.is_set():
+            try:
+                item = self.preprocess_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            try:
+                start = time.perf_counter()
+                self._install_pending_model()  # between batches, so each batch sees one model
+                if item.infer:
+                    model_start = time.perf_counter()
+                    item.model_results = self._run_model(item.inputs, item.image_size)
+                    item.model_seconds += time.perf_counter() - model_start
+                    item.inputs = None  # buffers may be reused by the preprocessing stage from here on
+                    self.batch_count += 1
+                self._record_stage(item, 'inference', time.perf_counter() - start)
+            except Exception as e:
+                self.logger.error(f"Inference failed: {e}")
+                item.infer, item.model_results = [], None
+            self._put_stage(self.postprocess_queue, item)
+
+        for thread in self.stage_threads:
+            thread.join(timeout=2.0)
+        self.is_running = False
+        self.logger.info("Pipelined person detection ended")
+
+    def _preprocess_loop(self):
+        """Preprocessing stage: collect, decode, gate and letterbox batches."""
+        while not self.stop_event.is_set():
+            try:
+                frames = self._collect_batch()
+                if not frames:
+                    continue
+
+                start = time.perf_counter()
+                item = PipelineBatch(frames=frames)
+                for index, frame_data in enumerate(frames):
+                    frame_start = time.time()
+                    if not frame_data.ensure_decoded():
+                        self.logger.debug(f"Failed to decode frame {frame_data.frame_id}")
+                        continue
+                    if self.motion_gate and not self.motion_gate.should_detect(frame_data.camera_id,
+                                                                               self._masked_view(frame_data)):
+                        item.reuse.append(index)
+                        item.reuse_seconds[index] = time.time() - frame_start
+                        continue
+                    item.infer.append(index)
+
+                if item.infer:
+                    prepare_start = time.perf_counter()
+                    images, item.origins, item.image_size = self._mask_frames([frames[index] for index in item.infer])
+                    item.inputs, item.geometries = self._prepare_inputs(images, item.image_size)
+                    item.model_seconds += time.perf_counter() - prepare_start
+                self._record_stage(item, 'preprocess', time.perf_counter() - start)
+                self._put_stage(self.preprocess_queue, item)
+
+            except Exception as e:
+                self.logger.error(f"Error in preprocessing stage: {e}")
+                time.sleep(0.1)
+
+    def _postprocess_loop(self):
+        """Post-processing stage: extract detections and emit results in frame order."""
+        while not self.stop_event.is_set():
+            try:
+                item = self.postprocess_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            try:
+                start = time.perf_counter()
+                results = self._build_results(item)
+                self._record_stage(item, 'postprocess', time.perf_counter() - start)
+                self._emit_results(item.frames, results)
+            except Exception as e:
+                self.logger.error(f"Error in post-processing stage: {e}")
+
+    def _build_results(self, item: PipelineBatch) -> List[Optional[DetectionResult]]:
+        """
+        Turn a batch's model output into results, resolving gated frames in frame order.
+
+        Args:
+            item: Batch coming out of the inference stage
+
+        Returns:
+            List of DetectionResult (or None where processing failed), aligned with the batch
+        """
+        results: List[Optional[DetectionResult]] = [None] * len(item.frames)
+        start_time = time.time()
+        inferred = {index: position for position, index in enumerate(item.infer)} if item.model_results else {}
+        reused = set(item.reuse)
+
+        # Time per inferred frame, measured as in PersonDetector: its share of input
+        # preparation and the model call, plus its own box extraction
+        processing_time = item.model_seconds / len(inferred) if inferred else 0.0
+
+        for index, frame_data in enumerate(item.frames):
+            if index in reused:
+                # Keep-alive from whatever the camera's last inferred frame found, in frame order
+                results[index] = self._reuse_last_result(frame_data, time.time() - item.reuse_seconds.get(index, 0.0))
+            elif index in inferred:
+                position = inferred[index]
+                extract_start = time.perf_counter()
+                detections = self._extract_person_detections(item.model_results[position], frame_data,
+                                                             item.geometries[position] if item.geometries else None,
+                                                             item.origins[position])
+                frame_time = processing_time + (time.perf_counter() - extract_start)
+                self.last_detections[frame_data.camera_id] = detections
+                self.total_processing_time += frame_time
+                avg_confidence = np.mean([det.confidence for det in detections]) if detections else 0.0
+                results[index] = DetectionResult(
+                    detections=detections,
+                    frame_data=frame_data,
+                    processing_time=frame_time,
+                    model_confidence=float(avg_confidence),
+                    inference_image_size=item.image_size
+                )
+
+        if inferred:
+            self._adapt_image_size(processing_time)
+            self._record_swap_trial(processing_time)
+        return results
+
+    def _put_stage(self, stage_queue: queue.Queue, item: PipelineBatch):
+        """Hand a batch to the next stage, waiting for room unless shutting down."""
+        while not self.stop_event.is_set():
+            try:
+                stage_queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _record_stage(self, item: PipelineBatch, stage: str, seconds: float):
+        """Account a batch's time in one stage."""
+        item.stage_seconds[stage] = seconds
+        with self.lock:
+            self.stage_busy[stage] += seconds
+            self.stage_batches[stage] += 1
+            self.stage_samples[stage].append(seconds)
+
+    def get_pipeline_stats(self) -> Dict[str, Any]:
+        """
+        Get per-stage timing.
+
+        Returns:
+            dict: Mean milliseconds per batch and busy fraction of each stage
+        """
+        elapsed = time.monotonic() - self.pipeline_started if self.pipeline_started else 0.0
+        with self.lock:
+            return {
+                stage: {
+                    'batches': self.stage_batches[stage],
+                    'mean_ms': (sum(self.stage_samples[stage]) / len(self.stage_samples[stage]) * 1000.0
+                                if self.stage_samples[stage] else 0.0),
+                    'utilisation': min(1.0, self.stage_busy[stage] / elapsed) if elapsed > 0 else 0.0
+                }
+                for stage in STAGES
+            }
+
+    def get_detection_stats(self) -> Dict[str, Any]:
+        """
+        Get detection performance statistics, including the stage breakdown.
+
+        Returns:
+            dict: PersonDetector statistics plus per-stage timing and stage queue depths
+        """
+        stats = super().get_detection_stats()
+        stats['pipeline'] = self.get_pipeline_stats()
+        stats['queue_sizes'].update({
+            'preprocess_queue': self.preprocess_queue.qsize(),
+            'postprocess_queue': self.postprocess_queue.qsize()
+        })
+        return stats
@@ -0,0 +1,577 @@
+"""
+DetectorWorkerPool - Multi-process person detection
+Runs PersonDetector models in worker processes, handing frames over in shared memory
+"""
+
+import os
+import queue
+import threading
+import time
+import multiprocessing
+from multiprocessing import shared_memory
+from collections import deque
+from typing import List, Optional, Dict, Any
+import numpy as np
+
+from .camera_manager import FrameData
+from .person_detector import PersonDetector, DetectionResult
+from .inference_backends import create_backend
+from models.config import SystemConfig
+
+
+SLOTS_PER_WORKER = 2        # one frame being inferred plus one queued per worker
+RESULT_TIMEOUT = 5.0        # seconds an in-flight frame may hold up ordered output
+WORKER_CHECK_INTERVAL = 0.5 # seconds between checks for worker processes that exited
+
+
+def _limit_torch_threads(num_workers: int):
+    """Split the cores between workers so their intra-op thread pools don't oversubscribe."""
+    try:
+        import torch
+    except ImportError:
+        return
+    torch.set_num_threads(max(1, (os.cpu_count() or 1) // num_workers))
+
+
+def _detector_worker(worker_id: int, config_dict: Dict[str, Any], model_path: str,
+                     slot_names: List[str], task_queue, result_queue):
+    """
+    Worker process entry point. Loads its own model, then runs detection on
+    frames read straight out of the shared-memory slots until a None task arrives.
+    """
+    config = SystemConfig.from_dict(config_dict)
+    config.motion_gate_enabled = False  # the gate runs once, in the parent
+    config.detection_batch_size = 1
+    config.roi_detection_enabled = False  # tracks need every frame of a camera in one process
+    config.detection_interval = 1
+    _limit_torch_threads(config.detector_workers)
+
+    slots = [shared_memory.SharedMemory(name=name) for name in slot_names]
+    detector = PersonDetector(config, queue.Queue(), queue.Queue(), threading.Event(), model_path=model_path)
+    result_queue.put(('ready', worker_id, detector.model is not None))
+    if detector.model is None:
+        for slot in slots:
+            slot.close()
+        return
+
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+
+            start = time.perf_counter()
+            if task['slot'] is not None:
+                frame = np.ndarray(task['shape'], dtype=np.uint8, buffer=slots[task['slot']].buf)
+            else:
+                frame = task['frame']
+            frame_data = FrameData(frame=frame, timestamp=task['timestamp'], frame_id=task['frame_id'],
+                                   camera_id=task['camera_id'], frame_scale=task['frame_scale'])
+            detector.confidence_threshold = task['confidence_threshold']
+
+            result = detector._process_frame(frame_data)
+            payload = None
+            if result:
+                payload = (result.detections, result.processing_time, result.model_confidence,
+                           result.inference_image_size)
+
+            # Drop views into the slot before it is handed back to the parent
+            frame = frame_data = None
+            result_queue.put(('result', worker_id, task['seq'], task['slot'], payload,
+                              time.perf_counter() - start))
+    finally:
+        for slot in slots:
+            slot.close()
+
+
+class DetectorWorkerPool(PersonDetector):
+    """
+    Drop-in replacement for the PersonDetector thread that spreads inference
+    over several processes. The dispatcher copies each frame into a free
+    shared-memory slot and queues only its metadata; results are put back in
+    frame_queue arrival order before they reach detection_queue.
+    """
+
+    def __init__(self,
+                 config: SystemConfig,
+                 frame_queue: queue.Queue,
+                 detection_queue: queue.Queue,
+                 shutdown_event: threading.Event,
+                 model_path: Optional[str] = None,
+                 load_in_background: bool = False):
+        """
+        Initialize the pool and start the worker processes.
+
+        Args:
+            config: System configuration object (detector_workers sets the pool size)
+            frame_queue: Input queue for frames from CameraManager
+            detection_queue: Output queue for detection results
+            shutdown_event: Event to signal shutdown
+            model_path: Path to YOLO model file (defaults to config.model_path)
+            load_in_background: Prepare the backend and start the workers on a separate thread
+        """
+        self.num_workers = max(1, config.detector_workers)
+        self.context = multiprocessing.get_context('spawn')
+        # One task queue per worker: the dispatcher knows which worker holds each
+        # slot, and a worker dying inside get() cannot hold a lock the others need
+        self.task_queues = []
+        self.result_queue = self.context.Queue()
+        self.workers = []
+        self.collector_thread = None
+        self.load_started = None
+
+        # Shared-memory frame slots, sized for the largest configured camera
+        self.slot_size = max(c.width * c.height * 3 for c in config.get_camera_configs())
+        self.slots: List[shared_memory.SharedMemory] = []
+        self.free_slots = deque()
+        self.slot_seqs: Dict[int, int] = {}     # slot -> sequence number using it
+        self.slot_condition = threading.Condition()
+
+        # Reorder buffer: sequence number -> frame waiting on a worker / finished result
+        self.order_lock = threading.Lock()
+        self.next_seq = 0
+        self.next_emit_seq = 0
+        self.in_flight: Dict[int, Any] = {}
+        self.completed: Dict[int, Any] = {}
+        self.task_workers: Dict[int, int] = {}  # in-flight sequence number -> worker it was sent to
+        self.results_lost = 0
+        self.oversized_frames = 0
+
+        # Per-worker statistics
+        self.worker_stats: Dict[int, Dict[str, Any]] = {}
+        self.workers_exited = 0
+
+        super().__init__(config, frame_queue, detection_queue, shutdown_event, model_path, load_in_background)
+        if config.roi_detection_enabled or config.detection_interval > 1:
+            self.logger.warning("ROI detection and detection intervals need a single detector process; "
+                                "workers run the model on every frame")
+            self.tracker = None
+            self.roi_scheduler = None
+            self.detection_interval = None
+
+    def load_model(self) -> bool:
+        """
+        Start the workers. ready_event is set by the collector once the first
+        worker has its model, or right away if the workers could not be started.
+
+        Returns:
+            bool: True if the workers were started
+        """
+        self.load_started = time.monotonic()
+        if self.initialize_model():
+            return True
+        self.ready_event.set()
+        return False
+
+    def _model_ready(self) -> bool:
+        return bool(self.workers) and not self._all_workers_failed()
+
+    def swap_model(self, model_path: str, latency_budget_ms: Optional[float] = None) -> bool:
+        """Models live in the worker processes; switching them needs a restart of the pool."""
+        self.logger.warning(f"Cannot hot-swap to {model_path} with detector worker processes; "
+                            f"set model_path and restart to change the model")
+        return False
+
+    def initialize_model(self) -> bool:
+        """
+        Allocate the shared-memory slots, start the worker processes and the result collector.
+        Exported backends are prepared here once so workers don't race to export.
+
+        Returns:
+            bool: True if the workers were started
+        """
+        try:
+            backend = create_backend(self.config.inference_backend, self.model_path, self.config.model_cache_dir,
+                                     self.config.model_precision, self.config.calibration_data)
+            if backend.is_available():
+                backend.prepare(self.image_size)
+
+            for slot in range(self.num_workers * SLOTS_PER_WORKER):
+                self.slots.append(shared_memory.SharedMemory(create=True, size=self.slot_size))
+                self.free_slots.append(slot)
+
+            slot_names = [slot.name for slot in self.slots]
+            config_dict = self.config.to_dict()
+            for worker_id in range(self.num_workers):
+                task_queue = self.context.Queue()
+                worker = self.context.Process(
+                    target=_detector_worker,
+                    args=(worker_id, config_dict, self.model_path, slot_names, task_queue, self.result_queue),
+                    name=f"DetectorWorker-{worker_id}",
+                    daemon=True
+                )
+                worker.start()
+                self.task_queues.append(task_queue)
+                self.workers.append(worker)
+                self.worker_stats[worker_id] = {'ready': None, 'ready_at': None, 'exited': False,
+                                                'frames': 0, 'busy_seconds': 0.0}
+
+            self.collector_thread = threading.Thread(target=self._collect_results, name="DetectorPoolCollector",
+                                                     daemon=True)
+            self.collector_thread.start()
+            self.logger.info(f"Started {self.num_workers} detector worker processes "
+                             f"with {len(self.slots)} shared frame slots")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to start detector workers: {e}")
+            self._shutdown_workers()
+            return False
+
+    def run(self):
+        """Dispatch loop: hand frames to the workers until shutdown."""
+        # Frames queue up while the workers load; start once the first one is ready
+        if not self.wait_until_ready():
+            if not self.stop_event.is_set():
+                self.logger.error("No detector worker could load the model, exiting run loop")
+            self._shutdown_workers()
+            return
+
+        self.is_running = True
+        self.logger.info("Person detection pool started")
+
+        try:
+            while not self.stop_event.is_set():
+                if self._all_workers_failed():
+                    self.logger.error("No detector worker could load the model, exiting run loop")
+                    break
+                try:
+                    frame_data = self.frame_queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+
+                try:
+                    if self.frame_deadline and self.frame_deadline.is_stale(frame_data.timestamp):
+                        frame_data.release()
+                        continue
+                    self._dispatch(frame_data)
+                except Exception as e:
+                    self.logger.error(f"Error dispatching frame: {e}")
+                finally:
+                    self.frame_queue.task_done()
+        finally:
+            self._shutdown_workers()
+            self.is_running = False
+            self.logger.info("Person detection pool ended")
+
+    def _dispatch(self, frame_data: FrameData):
+        """Assign a sequence number and send the frame to a worker (or settle it here)."""
+        with self.order_lock:
+            seq = self.next_seq
+            self.next_seq += 1
+
+        if not frame_data.ensure_decoded():
+            self.logger.debug(f"Failed to decode frame {frame_data.frame_id}")
+            frame_data.release()
+            self._complete(seq, None)
+            return
+
+        # Unchanged scene (inside the camera's ROI mask): skip inference, the last
+        # result is reused when this frame's turn comes
+        if self.motion_gate and not self.motion_gate.should_detect(frame_data.camera_id,
+                                                                   self._masked_view(frame_data)):
+            self._complete(seq, ('reuse', frame_data))
+            frame_data.release()
+            return
+
+        frame = np.ascontiguousarray(frame_data.frame, dtype=np.uint8)
+        slot = self._acquire_slot(seq)
+        if slot is None:
+            frame_data.release()
+            self._complete(seq, None)
+            return
+
+        task = {
+            'seq': seq,
+            'slot': slot,
+            'frame': None,
+            'shape': frame.shape,
+            'timestamp': frame_data.timestamp,
+            'frame_id': frame_data.frame_id,
+            'camera_id': frame_data.camera_id,
+            'frame_scale': frame_data.frame_scale,
+            'confidence_threshold': self.confidence_threshold
+        }
+        if frame.nbytes <= self.slot_size:
+            np.ndarray(frame.shape, dtype=np.uint8, buffer=self.slots[slot].buf)[...] = frame
+        else:
+            # Larger than the configured resolution (e.g. a replay file): send the pixels inline
+            task['frame'] = frame.copy()
+            self.oversized_frames += 1
+
+        # Pixels now live in shared memory; the camera buffer can be reused
+        frame_data.release()
+        with self.order_lock:
+            worker_id = self._pick_worker()
+            if worker_id is not None:
+                self.in_flight[seq] = (frame_data, time.monotonic(), slot)
+                self.task_workers[seq] = worker_id
+        if worker_id is None:
+            self._release_slot(slot, seq)
+            self._complete(seq, None)
+            return
+        self.task_queues[worker_id].put(task)
+
+    def _pick_worker(self) -> Optional[int]:
+        """Ready, running worker with the fewest frames outstanding (order lock held); None if there is none."""
+        outstanding = {}
+        with self.lock:
+            for worker_id, stats in self.worker_stats.items():
+                if stats['ready'] and not stats['exited']:
+                    outstanding[worker_id] = 0
+        if not outstanding:
+            return None
+        for worker_id in self.task_workers.values():
+            if worker_id in outstanding:
+                outstanding[worker_id] += 1
+        return min(outstanding, key=outstanding.get)
+
+    def _acquire_slot(self, seq: int) -> Optional[int]:
+        """Wait for a free shared-memory slot and assign it to a frame; None if shutting down."""
+        with self.slot_condition:
+            while not self.free_slots:
+                if self.stop_event.is_set():
+                    return None
+                self.slot_condition.wait(timeout=0.1)
+            slot = self.free_slots.popleft()
+            self.slot_seqs[slot] = seq
+            return slot
+
+    def _release_slot(self, slot: Optional[int], seq: int):
+        """Return a frame's slot to the free list, unless it was already reclaimed from that frame."""
+        if slot is None:
+            return
+        with self.slot_condition:
+            if self.slot_seqs.get(slot) != seq:
+                return
+            del self.slot_seqs[slot]
+            self.free_slots.append(slot)
+            self.slot_condition.notify()
+
+    def _collect_results(self):
+        """Collector thread: receive worker results and emit them in order."""
+        last_worker_check = time.monotonic()
+        while not self.stop_event.is_set():
+            if time.monotonic() - last_worker_check >= WORKER_CHECK_INTERVAL:
+                self._reclaim_exited_workers()
+                last_worker_check = time.monotonic()
+            try:
+                message = self.result_queue.get(timeout=0.1)
+            except queue.Empty:
+                self._flush_in_order()
+                continue
+            except (EOFError, OSError):
+                break
+
+            kind, worker_id = message[0], message[1]
+            if kind == 'ready':
+                with self.lock:
+                    self.worker_stats[worker_id]['ready'] = message[2]
+                    self.worker_stats[worker_id]['ready_at'] = time.monotonic()
+                if not message[2]:
+                    self.logger.error(f"Detector worker {worker_id} failed to load the model")
+                if message[2] and not self.ready_event.is_set():
+                    self.load_seconds = time.monotonic() - self.load_started
+                    self.logger.info(f"Detector worker {worker_id} ready after {self.load_seconds:.2f}s")
+                    self.ready_event.set()
+                elif self._all_workers_failed():
+                    self.ready_event.set()
+                continue
+
+            _, _, seq, slot, payload, busy_seconds = message
+            self._release_slot(slot, seq)
+            with self.lock:
+                stats = self.worker_stats[worker_id]
+                stats['frames'] += 1
+                stats['busy_seconds'] += busy_seconds
+
+            with self.order_lock:
+                entry = self.in_flight.pop(seq, None)
+                self.task_workers.pop(seq, None)
+            if entry is None:
+                continue  # gave up on this frame already
+            frame_data = entry[0]
+            self._complete(seq, ('result', frame_data, payload) if payload else None)
+
+    def _reclaim_exited_workers(self):
+        """
+        Handle worker processes that exited while the pool is running: free the
+        slots of the frames they had taken and give up on those frames, so the
+        dispatcher does not run out of slots and ordered output moves on.
+        """
+        exited = []
+        with self.lock:
+            for worker_id, worker in enumerate(self.workers):
+                stats = self.worker_stats[worker_id]
+                if not stats['exited'] and not worker.is_alive():
+                    stats['exited'] = True
+                    self.workers_exited += 1
+                    exited.append(worker_id)
+        if not exited:
+            return
+
+        with self.order_lock:
+            lost = {seq: worker_id for seq, worker_id in self.task_workers.items() if worker_id in exited}
+            entries = [(seq, self.in_flight.pop(seq, None)) for seq in lost]
+            for seq in lost:
+                del self.task_workers[seq]
+            self.results_lost += len(lost)
+        for worker_id in exited:
+            if self.worker_stats[worker_id]['ready']:
+                dropped = sum(1 for owner in lost.values() if owner == worker_id)
+                self.logger.error(f"Detector worker {worker_id} exited unexpectedly "
+                                  f"(exit code {self.workers[worker_id].exitcode}), dropping {dropped} frames")
+        for seq, entry in entries:
+            if entry is not None:
+                self._release_slot(entry[2], seq)
+            self._complete(seq, None)
+        if self._all_workers_failed():
+            self.ready_event.set()
+
+    def _complete(self, seq: int, outcome: Optional[tuple]):
+        """Store a finished frame and emit every result that is now next in line."""
+        with self.order_lock:
+            self.completed[seq] = outcome
+        self._flush_in_order()
+
+    def _flush_in_order(self):
+        """Emit completed results in sequence order, skipping frames stuck past RESULT_TIMEOUT."""
+        with self.order_lock:
+            now = time.monotonic()
+            while True:
+                seq = self.next_emit_seq
+                if seq in self.completed:
+                    outcome = self.completed.pop(seq)
+                elif seq in self.in_flight and now - self.in_flight[seq][1] > RESULT_TIMEOUT:
+                    _, _, slot = self.in_flight.pop(seq)
+                    self.task_workers.pop(seq, None)
+                    self._release_slot(slot, seq)
+                    self.results_lost += 1
+                    self.logger.warning(f"No result for frame sequence {seq} after {RESULT_TIMEOUT:.0f}s, skipping")
+                    outcome = None
+                else:
+                    break
+                self.next_emit_seq += 1
+                if outcome is not None:
+                    self._emit(outcome)
+
+    def _emit(self, outcome: tuple):
+        """Turn a finished frame into a DetectionResult on detection_queue (order lock held)."""
+        if outcome[0] == 'reuse':
+            detection_result = self._reuse_last_result(outcome[1], time.time())
+        else:
+            _, frame_data, (detections, processing_time, model_confidence, image_size) = outcome
+            self.last_detections[frame_data.camera_id] = detections
+            self.total_processing_time += processing_time
+            self.batch_count += 1
+            # Each worker adapts its own size; report the one the latest result used
+            self.image_size = image_size
+            detection_result = DetectionResult(
+                detections=detections,
+                frame_data=frame_data,
+                processing_time=processing_time,
+                model_confidence=model_confidence,
+                inference_image_size=image_size
+            )
+
+        try:
+            self.detection_queue.put_nowait(detection_result)
+            self.detection_count += 1
+            self.last_detection_time = time.time()
+            self._record_latency(detection_result.frame_data, self.last_detection_time)
+        except queue.Full:
+            self.logger.debug("Detection queue full, skipping result")
+
+    def _all_workers_failed(self) -> bool:
+        with self.lock:
+            return bool(self.worker_stats) and all(stats['ready'] is False or stats['exited']
+                                                   for stats in self.worker_stats.values())
+
+    def _shutdown_workers(self):
+        """Stop the worker processes and free the shared memory."""
+        for task_queue in self.task_queues:
+            try:
+                task_queue.put(None)
+            except Exception:
+                pass
+        for worker in self.workers:
+            worker.join(timeout=5.0)
+            if worker.is_alive():
+                self.logger.warning(f"{worker.name} did not exit, terminating")
+                worker.terminate()
+                worker.join(timeout=1.0)
+
+        if self.collector_thread and self.collector_thread is not threading.current_thread():
+            self.collector_thread.join(timeout=1.0)
+
+        for slot in self.slots:
+            try:
+                slot.close()
+                slot.unlink()
+            except FileNotFoundError:
+                pass
+        self.slots = []
+        self.free_slots.clear()
+        self.slot_seqs.clear()
+
+    def get_worker_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get per-worker utilisation, measured from the moment each worker had its model loaded.
+
+        Returns:
+            list: One dict per worker with frame count, busy time and utilisation
+        """
+        now = time.monotonic()
+        worker_stats = []
+        with self.lock:
+            for worker_id, stats in sorted(self.worker_stats.items()):
+                elapsed = now - stats['ready_at'] if stats['ready_at'] else 0.0
+                worker_stats.append({
+                    'worker_id': worker_id,
+                    'alive': self.workers[worker_id].is_alive() if worker_id < len(self.workers) else False,
+                    'ready': stats['ready'],
+                    'frames': stats['frames'],
+                    'busy_seconds': stats['busy_seconds'],
+                    'utilisation': min(1.0, stats['busy_seconds'] / elapsed) if elapsed > 0 else 0.0
+                })
+        return worker_stats
+
+    def get_detection_stats(self) -> Dict[str, Any]:
+        """
+        Get detection performance statistics, including the worker pool.
+
+        Returns:
+            dict: PersonDetector statistics plus per-worker utilisation and reorder state
+        """
+        stats = super().get_detection_stats()
+        with self.order_lock:
+            in_flight = len(self.in_flight)
+            reorder_depth = len(self.completed)
+        stats.update({
+            'detector_workers': self.num_workers,
+            'workers': self.get_worker_stats(),
+            'in_flight': in_flight,
+            'reorder_buffer': reorder_depth,
+            'results_lost': self.results_lost,
+            'workers_exited': self.workers_exited,
+            'shared_slots': len(self.slots),
+            'oversized_frames': self.oversized_frames
+        })
+        return stats
+
+    def get_model_info(self) -> Dict[str, Any]:
+        """
+        Get information about the model run by the workers.
+
+        Returns:
+            dict: Model path, backend and worker readiness
+        """
+        return {
+            'model_loaded': any(stats['ready'] for stats in self.worker_stats.values()),
+            'model_path': self.model_path,
+            'backend': self.config.inference_backend,
+            'precision': self.config.model_precision,
+            'input_size': self.image_size,
+            'detector_workers': self.num_workers,
+            'person_class_id': self.PERSON_CLASS_ID
+        }
@@ -2,11 +2,14 @@ import threading
 import time
 import queue
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 
 from components.camera_manager import CameraManager
+from components.frame_queue import FrameQueue
 from components.person_detector import PersonDetector
+from components.detector_pool import DetectorWorkerPool
+from components.detection_pipeline import PipelinedPersonDetector
 from components.coordinate_processor import CoordinateProcessor
 from components.telemetry_client import TelemetryClient
 from models.config import SystemConfig
@@ -37,6 +40,7 @@ class EdgeAgent:
         self.running = False
         self.start_time = None
         self.stats = EdgeAgentStats()
+        self.startup_timeline: List[Tuple[str, float]] = []  # (event, seconds since start)
         
         # Setup logging
         logging.basicConfig(
@@ -49,13 +53,16 @@ class EdgeAgent:
         )
         self.logger = logging.getLogger(__name__)
         
-        # Inter-component queues
-        self.frame_queue = queue.Queue(maxsize=config.frame_queue_size)
+        # Inter-component queues (the frame queue is shared by all cameras)
+        config.check_camera_ids()
+        self.camera_configs = config.get_camera_configs()
+        self.frame_queue = FrameQueue(maxsize=config.frame_queue_size * len(self.camera_configs))
         self.detection_queue = queue.Queue(maxsize=config.detection_queue_size)
         self.coordinate_queue = queue.Queue(maxsize=config.telemetry_queue_size)
         
         # Components
-        self.camera_manager = None
+        self.camera_managers = []
+        self.camera_manager = None  # primary camera
         self.person_detector = None
         self.coordinate_processor = None
         self.telemetry_client = None
@@ -73,28 +80,47 @@ class EdgeAgent:
         try:
             self.logger.info("Initializing EdgeAgent components...")
             
-            # Initialize camera manager
-            self.camera_manager = CameraManager(
-                camera_config=self.config.camera,
-                frame_queue=self.frame_queue,
-                shutdown_event=self.shutdown_event,
-                use_mock=self.use_mock_camera
-            )
-            
-            # Initialize person detector
-            self.person_detector = PersonDetector(
+            # Initialize person detector first so the model loads in the background
+            # while the other stages come up (single model shared by all cameras,
+            # a pool of worker processes when detector_workers > 1, or overlapping
+            # pre/post-processing threads when detection_pipeline is set)
+            if self.config.detector_workers > 1:
+                detector_class = DetectorWorkerPool
+            elif self.config.detection_pipeline:
+                detector_class = PipelinedPersonDetector
+            else:
+                detector_class = PersonDetector
+            self.person_detector = detector_class(
                 config=self.config,
                 frame_queue=self.frame_queue,
                 detection_queue=self.detection_queue,
-                shutdown_event=self.shutdown_event
+                shutdown_event=self.shutdown_event,
+                load_in_background=True
             )
+            self._mark_startup("model loading started")
+            
+            # Initialize one camera manager per camera, all feeding the shared frame queue
+            self.camera_managers = [
+                CameraManager(
+                    camera_config=camera_config,
+                    frame_queue=self.frame_queue,
+                    shutdown_event=self.shutdown_event,
+                    use_mock=self.use_mock_camera,
+                    max_queue_size=self.config.frame_queue_size,
+                    resize_to=self.config.get_capture_resize_size()
+                )
+                for camera_config in self.camera_configs
+            ]
+            self.camera_manager = self.camera_managers[0]
             
             # Initialize coordinate processor
             self.coordinate_processor = CoordinateProcessor(
                 camera_config=self.config.camera,
                 detection_queue=self.detection_queue,
                 coordinate_queue=self.coordinate_queue,
-                shutdown_event=self.shutdown_event
+                shutdown_event=self.shutdown_event,
+                camera_configs=self.camera_configs,
+                max_frame_age_ms=self.config.max_frame_age_ms
             )
             
             # Initialize telemetry client
@@ -104,6 +130,7 @@ class EdgeAgent:
                 shutdown_event=self.shutdown_event
             )
             
+            self._mark_startup("components initialized")
             self.logger.info("All components initialized successfully")
             return True
             
@@ -116,14 +143,15 @@ class EdgeAgent:
         try:
             self.logger.info("Starting component threads...")
             
-            # Start camera manager thread
-            camera_thread = threading.Thread(
-                target=self.camera_manager.run,
-                name="CameraManager",
-                daemon=True
-            )
-            camera_thread.start()
-            self.threads.append(camera_thread)
+            # Start camera manager threads
+            for camera_manager in self.camera_managers:
+                camera_thread = threading.Thread(
+                    target=camera_manager.run,
+                    name=f"CameraManager-{camera_manager.config.effective_id}",
+                    daemon=True
+                )
+                camera_thread.start()
+                self.threads.append(camera_thread)
             
             # Start person detector thread
             detector_thread = threading.Thread(
@@ -153,12 +181,61 @@ class EdgeAgent:
             self.threads.append(telemetry_thread)
             
             self.logger.info(f"Started {len(self.threads)} component threads")
+            self._mark_startup("component threads started")
+            
+            # Log the rest of the cold start as the pipeline comes up
+            monitor_thread = threading.Thread(
+                target=self._monitor_cold_start,
+                name="StartupMonitor",
+                daemon=True
+            )
+            monitor_thread.start()
+            self.threads.append(monitor_thread)
             return True
             
         except Exception as e:
             self.logger.error(f"Failed to start component threads: {e}")
             return False
     
+    def _mark_startup(self, event: str):
+        """Record a cold-start milestone relative to the agent start time."""
+        elapsed = time.time() - self.start_time if self.start_time else 0.0
+        self.startup_timeline.append((event, elapsed))
+        self.logger.info(f"Cold start +{elapsed:.2f}s: {event}")
+    
+    def _monitor_cold_start(self, timeout: float = 300.0):
+        """
+        Log when the camera, model, detection and telemetry stages first become live.
+        
+        Args:
+            timeout: Seconds after which to stop waiting for missing milestones
+        """
+        milestones = {
+            "camera streaming": lambda: any(camera.is_running for camera in self.camera_managers),
+            "first frame captured": lambda: any(camera.frame_counter > 0 for camera in self.camera_managers),
+            "model ready": lambda: self.person_detector.ready_event.is_set(),
+            "first detection result": lambda: self.person_detector.detection_count > 0,
+            "first telemetry sent": lambda: self.telemetry_client.transmitted_count > 0
+        }
+        deadline = time.monotonic() + timeout
+        
+        while milestones and not self.shutdown_event.is_set() and time.monotonic() < deadline:
+            for event, reached in list(milestones.items()):
+                if not reached():
+                    continue
+                del milestones[event]
+                if event == "model ready":
+                    detector = self.person_detector
+                    if not detector.wait_until_ready(timeout=0):
+                        self._mark_startup("model failed to load")
+                        continue
+                    event = f"model ready (load {detector.load_seconds or 0.0:.2f}s"
+                    if detector.warmup_seconds is not None:
+                        event += f", warm-up {detector.warmup_seconds:.2f}s"
+                    event += ")"
+                self._mark_startup(event)
+            self.shutdown_event.wait(0.05)
+    
     def start(self) -> bool:
         """Start the EdgeAgent system"""
         if self.running:
@@ -206,6 +283,62 @@ class EdgeAgent:
         
         self.logger.info("EdgeAgent system stopped")
     
+    def swap_detector_model(self, model_path: str, latency_budget_ms: Optional[float] = None) -> bool:
+        """
+        Switch the detector to another model while the pipeline keeps running.
+
+        Args:
+            model_path: Path of the model to switch to
+            latency_budget_ms: Per-frame budget the new model must meet or be rolled back
+                (defaults to config.latency_budget_ms)
+
+        Returns:
+            bool: True if the swap started
+        """
+        if not self.person_detector:
+            self.logger.warning("No person detector to swap the model of")
+            return False
+        return self.person_detector.swap_model(model_path, latency_budget_ms)
+
+    def reload_config(self, config_path: str) -> bool:
+        """
+        Re-read the configuration file and apply the settings that can change at runtime.
+
+        A new model_path is hot-swapped and a new detection threshold applied on the next
+        frame; other changed settings are reported and take effect on the next restart.
+
+        Args:
+            config_path: Path to the system configuration file
+
+        Returns:
+            bool: True if the file was loaded
+        """
+        try:
+            new_config = SystemConfig.from_json_file(config_path)
+        except Exception as e:
+            self.logger.error(f"Failed to reload configuration from {config_path}: {e}")
+            return False
+
+        self.logger.info(f"Reloading configuration from {config_path}")
+        current, updated = self.config.to_dict(), new_config.to_dict()
+        changed = {key for key in updated if updated[key] != current.get(key)}
+
+        if 'model_path' in changed:
+            # The detector records the new model_path once the swap starts and restores
+            # the serving one if it fails or rolls back
+            if not self.swap_detector_model(new_config.model_path):
+                self.logger.warning(f"Model change to {new_config.model_path} refused, "
+                                    f"still serving {self.config.model_path}")
+            changed.discard('model_path')
+        if 'detection_confidence_threshold' in changed and self.person_detector:
+            self.person_detector.update_confidence_threshold(new_config.detection_confidence_threshold)
+            self.config.detection_confidence_threshold = new_config.detection_confidence_threshold
+            changed.discard('detection_confidence_threshold')
+
+        if changed:
+            self.logger.warning(f"Settings that need a restart to take effect: {', '.join(sorted(changed))}")
+        return True
+
     def _clear_queues(self):
         """Clear all inter-component queues"""
         queues = [self.frame_queue, self.detection_queue, self.coordinate_queue]
@@ -247,9 +380,26 @@ class EdgeAgent:
             processing_fps=stats.fps,
             cpu_usage=None,  # Could be implemented later
             memory_usage=None,  # Could be implemented later
-            temperature=None  # Could be implemented later
+            temperature=None,  # Could be implemented later
+            inference_image_size=self.person_detector.image_size if self.person_detector else None
         )
     
+    def get_stale_frame_stats(self) -> Dict[str, Any]:
+        """
+        Get stale-frame drops at each stage hop.
+        
+        Returns:
+            dict: Deadline statistics per stage (detection, coordinates, telemetry), empty without a max frame age
+        """
+        if not self.config.max_frame_age_ms:
+            return {}
+        stages = [
+            ('detection', self.person_detector.frame_deadline if self.person_detector else None),
+            ('coordinates', self.coordinate_processor.frame_deadline if self.coordinate_processor else None),
+            ('telemetry', self.telemetry_client.frame_deadline if self.telemetry_client else None)
+        ]
+        return {stage: deadline.get_stats() for stage, deadline in stages if deadline}
+    
     def _log_final_stats(self):
         """Log final system statistics"""
         stats = self.get_stats()
@@ -261,6 +411,9 @@ class EdgeAgent:
         self.logger.info(f"  Messages sent: {stats.messages_sent}")
         self.logger.info(f"  Errors encountered: {stats.errors_encountered}")
         self.logger.info(f"  Average FPS: {stats.fps:.2f}")
+        for stage, deadline_stats in self.get_stale_frame_stats().items():
+            self.logger.info(f"  Stale frames dropped at {stage}: {deadline_stats['dropped']} of "
+                             f"{deadline_stats['checked']} (max age {deadline_stats['max_frame_age_ms']:.0f} ms)")
     
     def run_forever(self):
         """Run the EdgeAgent system indefinitely"""
@@ -285,7 +438,7 @@ class EdgeAgent:
                     self.last_stats_time = current_time
                 
                 # Check for queue overflow
-                if self.frame_queue.qsize() > self.config.frame_queue_size * 0.8:
+                if self.frame_queue.qsize() > self.frame_queue.maxsize * 0.8:
                     self.logger.warning(f"Frame queue near capacity: {self.frame_queue.qsize()}")
                 
         except KeyboardInterrupt:
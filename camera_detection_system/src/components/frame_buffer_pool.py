@@ -0,0 +1,91 @@
+"""
+FrameBufferPool - Fixed pool of reusable frame buffers
+Avoids a fresh ndarray allocation per captured frame by recycling buffers
+"""
+
+import threading
+from collections import deque
+from typing import Optional, Tuple, Dict, Any
+import numpy as np
+
+
+class FrameBufferPool:
+    """
+    Thread-safe pool of preallocated frame buffers.
+    The capture thread acquires a slot, fills it in place, and the slot is
+    returned to the pool once the frame has been consumed or dropped.
+    """
+
+    def __init__(self, num_buffers: int, shape: Tuple[int, ...], dtype=np.uint8):
+        """
+        Initialize the pool and preallocate all buffers.
+
+        Args:
+            num_buffers: Number of buffers in the pool
+            shape: Shape of each buffer, e.g. (height, width, 3)
+            dtype: Buffer element type
+        """
+        self.num_buffers = max(1, num_buffers)
+        self.shape = tuple(shape)
+        self.dtype = dtype
+
+        self._buffers = [np.zeros(self.shape, dtype=dtype) for _ in range(self.num_buffers)]
+        self._free = deque(range(self.num_buffers))
+        self._in_use = set()
+
+        # Statistics
+        self.acquired_count = 0
+        self.exhausted_count = 0
+        self.peak_in_use = 0
+
+        self.lock = threading.Lock()
+
+    def acquire(self) -> Optional[Tuple[int, np.ndarray]]:
+        """
+        Take a free buffer from the pool.
+
+        Returns:
+            Tuple of (slot index, buffer), or None if the pool has run dry
+        """
+        with self.lock:
+            if not self._free:
+                self.exhausted_count += 1
+                return None
+
+            slot = self._free.popleft()
+            self._in_use.add(slot)
+            self.acquired_count += 1
+            self.peak_in_use = max(self.peak_in_use, len(self._in_use))
+            return slot, self._buffers[slot]
+
+    def release(self, slot: int):
+        """
+        Return a buffer to the pool. Releasing a slot twice is a no-op.
+
+        Args:
+            slot: Slot index returned by acquire()
+        """
+        with self.lock:
+            if slot in self._in_use:
+                self._in_use.discard(slot)
+                self._free.append(slot)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool occupancy statistics.
+
+        Returns:
+            dict: Pool size, occupancy and exhaustion counters
+        """
+        with self.lock:
+            in_use = len(self._in_use)
+            return {
+                'size': self.num_buffers,
+                'in_use': in_use,
+                'available': self.num_buffers - in_use,
+                'occupancy': in_use / self.num_buffers,
+                'peak_in_use': self.peak_in_use,
+                'acquired_count': self.acquired_count,
+                'exhausted_count': self.exhausted_count,
+                'buffer_shape': self.shape
+            }
@@ -0,0 +1,77 @@
+"""
+FrameDeadline - Age-based stale-frame eviction
+Checks a frame's capture timestamp against the maximum frame age at each pipeline stage
+"""
+
+import threading
+import time
+from typing import Dict, Any, Optional
+
+
+class FrameDeadline:
+    """
+    One per pipeline stage: a frame (or the result derived from it) whose
+    capture timestamp is more than max_age_ms old when the stage picks it up
+    is skipped, so everything reported downstream is at most max_age_ms old
+    at the last hop. Drops are counted per stage.
+    """
+
+    def __init__(self, stage: str, max_age_ms: float):
+        """
+        Initialize the deadline check.
+
+        Args:
+            stage: Name of the stage the check guards, for reporting
+            max_age_ms: Oldest frame age in milliseconds the stage still works on
+        """
+        self.stage = stage
+        self.max_age = max_age_ms / 1000.0
+
+        # Statistics
+        self.checked = 0
+        self.dropped = 0
+        self.oldest_dropped = 0.0   # seconds
+        self.total_age = 0.0        # seconds, over frames let through
+
+        self.lock = threading.Lock()
+
+    def is_stale(self, timestamp: float, now: Optional[float] = None) -> bool:
+        """
+        Check a frame's age and count the outcome.
+
+        Args:
+            timestamp: Capture time of the frame (time.time() seconds)
+            now: Current time, defaults to time.time()
+
+        Returns:
+            bool: True if the frame is past its deadline and should be skipped
+        """
+        age = (now if now is not None else time.time()) - timestamp
+        stale = age > self.max_age
+        with self.lock:
+            self.checked += 1
+            if stale:
+                self.dropped += 1
+                self.oldest_dropped = max(self.oldest_dropped, age)
+            else:
+                self.total_age += age
+        return stale
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get deadline statistics.
+
+        Returns:
+            dict: Frames checked and dropped at this stage, and their ages
+        """
+        with self.lock:
+            passed = self.checked - self.dropped
+            return {
+                'stage': self.stage,
+                'max_frame_age_ms': self.max_age * 1000.0,
+                'checked': self.checked,
+                'dropped': self.dropped,
+                'drop_rate': self.dropped / self.checked if self.checked else 0.0,
+                'mean_age_ms': self.total_age / passed * 1000.0 if passed else 0.0,
+                'oldest_dropped_ms': self.oldest_dropped * 1000.0
+            }
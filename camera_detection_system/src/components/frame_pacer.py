@@ -0,0 +1,113 @@
+"""
+FramePacer - Deadline-based frame pacing for capture loops
+Sleeps until the next frame slot on a monotonic clock and tracks capture jitter
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, Any
+
+
+class FramePacer:
+    """
+    Schedules capture slots at a fixed interval on the monotonic clock.
+    Waiting is done on the shutdown event so a stop request wakes the
+    capture thread immediately instead of after the current sleep.
+    When the frame source blocks on its own frame arrival, the pacer only
+    tracks slots and jitter without sleeping.
+    """
+
+    def __init__(self, frame_interval: float, stop_event: threading.Event,
+                 source_paced: bool = False, jitter_window: int = 300):
+        """
+        Initialize the pacer.
+
+        Args:
+            frame_interval: Target seconds between frames
+            stop_event: Event that interrupts waiting on shutdown
+            source_paced: Frame source blocks until a frame arrives, so never sleep
+            jitter_window: Number of recent captures kept for jitter statistics
+        """
+        self.frame_interval = frame_interval
+        self.stop_event = stop_event
+        self.source_paced = source_paced
+
+        self.next_deadline = None
+        self.last_deadline = None
+
+        # Jitter tracking (seconds between intended and actual capture time)
+        self.jitter_samples = deque(maxlen=jitter_window)
+        self.late_frames = 0
+        self.skipped_slots = 0
+        self.wait_count = 0
+
+    def wait_for_next_slot(self) -> bool:
+        """
+        Block until the next frame deadline.
+
+        Returns:
+            bool: True when the slot has been reached, False if shutdown was requested
+        """
+        now = time.monotonic()
+        if self.next_deadline is None:
+            self.next_deadline = now
+
+        delay = self.next_deadline - now
+        if delay > 0 and not self.source_paced:
+            self.wait_count += 1
+            if self.stop_event.wait(delay):
+                return False
+
+        self.last_deadline = self.next_deadline
+        self.next_deadline += self.frame_interval
+
+        # If we fell more than one interval behind, realign instead of bursting
+        now = time.monotonic()
+        if now - self.next_deadline > self.frame_interval:
+            missed = int((now - self.next_deadline) / self.frame_interval)
+            self.skipped_slots += missed
+            self.next_deadline += missed * self.frame_interval
+
+        return not self.stop_event.is_set()
+
+    def record_capture(self, capture_time: float):
+        """
+        Record when a frame was actually captured for the current slot.
+
+        Args:
+            capture_time: time.monotonic() value at capture
+        """
+        if self.last_deadline is None:
+            return
+        jitter = capture_time - self.last_deadline
+        self.jitter_samples.append(jitter)
+        if jitter > self.frame_interval:
+            self.late_frames += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pacing jitter statistics.
+
+        Returns:
+            dict: Mean, p95 and max jitter in milliseconds plus slot counters
+        """
+        samples = sorted(self.jitter_samples)
+        if samples:
+            mean_jitter = sum(samples) / len(samples)
+            p95_jitter = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+            max_jitter = samples[-1]
+        else:
+            mean_jitter = p95_jitter = max_jitter = 0.0
+
+        return {
+            'target_interval_ms': self.frame_interval * 1000.0,
+            'mean_jitter_ms': mean_jitter * 1000.0,
+            'p95_jitter_ms': p95_jitter * 1000.0,
+            'max_jitter_ms': max_jitter * 1000.0,
+            'late_frames': self.late_frames,
+            'skipped_slots': self.skipped_slots,
+            'wait_count': self.wait_count,
+            'source_paced': self.source_paced,
+            'samples': len(samples)
+        }
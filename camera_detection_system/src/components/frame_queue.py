@@ -0,0 +1,70 @@
+"""
+FrameQueue - Shared frame queue with per-camera accounting
+Lets each camera producer see how many of its own frames are still waiting for the detector
+"""
+
+import queue
+from collections import deque
+from typing import Dict, Any, Optional
+
+
+class FrameQueue(queue.Queue):
+    """
+    FIFO queue of FrameData shared by all camera managers. Alongside the
+    items it keeps a count of queued frames per camera_id, so a producer's
+    decisions (skip decoding while the detector still has one of its frames)
+    depend only on its own frames and not on the other cameras' traffic.
+    """
+
+    def _init(self, maxsize: int):
+        self.queue = deque()
+        self.camera_counts: Dict[str, int] = {}
+
+    def _put(self, item: Any):
+        self.queue.append(item)
+        self.camera_counts[item.camera_id] = self.camera_counts.get(item.camera_id, 0) + 1
+
+    def _get(self) -> Any:
+        item = self.queue.popleft()
+        self.camera_counts[item.camera_id] -= 1
+        return item
+
+    def pending(self, camera_id: str) -> int:
+        """
+        Number of a camera's frames waiting in the queue.
+
+        Args:
+            camera_id: Camera whose frames to count
+
+        Returns:
+            int: Frames from that camera not yet taken by a consumer
+        """
+        with self.mutex:
+            return self.camera_counts.get(camera_id, 0)
+
+    def evict_oldest(self, camera_id: str) -> Optional[Any]:
+        """
+        Remove a camera's oldest queued frame, leaving other cameras' frames in place.
+
+        The frame is removed as if a consumer had taken and finished it, so
+        join() and blocked producers see the freed slot.
+
+        Args:
+            camera_id: Camera whose frame to drop
+
+        Returns:
+            The removed frame, or None if the camera has no queued frames
+        """
+        with self.mutex:
+            if not self.camera_counts.get(camera_id):
+                return None
+            for index, item in enumerate(self.queue):
+                if item.camera_id == camera_id:
+                    del self.queue[index]
+                    break
+            self.camera_counts[camera_id] -= 1
+            self.unfinished_tasks -= 1
+            if self.unfinished_tasks == 0:
+                self.all_tasks_done.notify_all()
+            self.not_full.notify()
+            return item
@@ -0,0 +1,318 @@
+"""
+Inference backends for PersonDetector
+PyTorch, ONNX Runtime and OpenVINO engines behind one loader with an export cache,
+optionally running INT8 models calibrated on local recordings
+"""
+
+import hashlib
+import importlib.util
+import logging
+import os
+import shutil
+import threading
+from typing import Optional, Dict, Any, Type
+
+from .quantization import load_calibration_frames, write_calibration_dataset, quantize_onnx_model
+
+try:
+    from ultralytics import YOLO
+except ImportError:
+    YOLO = None
+
+PRECISIONS = ("fp32", "int8")
+
+
+DEFAULT_MODEL_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "edge_os", "models")
+
+
+def model_file_hash(path: str) -> str:
+    """
+    Hash a model file so exported artifacts are invalidated when the weights change.
+
+    Args:
+        path: Model weights file
+
+    Returns:
+        str: First 16 hex characters of the SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+class InferenceBackend:
+    """
+    Loads the person model on one inference engine.
+    Every backend returns an ultralytics model object, so PersonDetector calls
+    it the same way and gets the same Results regardless of engine.
+    Backends that set supports_int8 implement _quantize(image_size).
+    """
+
+    name = "pytorch"
+    export_format: Optional[str] = None     # ultralytics export format, None = native weights
+    required_module: Optional[str] = None   # runtime package needed by the engine
+    supports_int8 = False
+
+    def __init__(self, model_path: str, cache_dir: Optional[str] = None,
+                 precision: str = "fp32", calibration_data: Optional[str] = None):
+        """
+        Initialize the backend.
+
+        Args:
+            model_path: PyTorch weights (e.g. "yolov8n.pt")
+            cache_dir: Directory for exported artifacts
+            precision: "fp32" or "int8"
+            calibration_data: Local recording used to calibrate INT8 models
+        """
+        self.model_path = model_path
+        self.cache_dir = cache_dir or DEFAULT_MODEL_CACHE_DIR
+        self.precision = precision
+        self.calibration_data = calibration_data
+        self.export_lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Return True if ultralytics and the engine runtime are installed."""
+        if YOLO is None:
+            return False
+        return cls.required_module is None or importlib.util.find_spec(cls.required_module) is not None
+
+    def prepare(self, image_size: int) -> str:
+        """
+        Make sure the model file for this input size exists, exporting it if needed.
+
+        Args:
+            image_size: Square model input size in pixels
+
+        Returns:
+            str: Path of the model file to load
+        """
+        return self.model_path
+
+    def load(self, image_size: int) -> Any:
+        """
+        Load a model ready for inference at the given input size.
+
+        Args:
+            image_size: Square model input size in pixels
+
+        Returns:
+            Callable ultralytics model
+        """
+        return YOLO(self.prepare(image_size))
+
+    def artifact_path(self, image_size: int) -> Optional[str]:
+        """Path of the cached exported model for this input size, if any."""
+        return None
+
+    def get_info(self) -> Dict[str, Any]:
+        """
+        Get backend information.
+
+        Returns:
+            dict: Backend name, model path and cache directory
+        """
+        return {
+            'backend': self.name,
+            'model_path': self.model_path,
+            'precision': self.precision,
+            'export_format': self.export_format,
+            'cache_dir': self.cache_dir if self.export_format else None
+        }
+
+
+class PyTorchBackend(InferenceBackend):
+    """Runs the native weights through PyTorch."""
+
+    name = "pytorch"
+
+
+class ExportedBackend(InferenceBackend):
+    """
+    Backend that runs an exported copy of the model. The export happens on first
+    use and is cached under a key made of the weights hash and the input size.
+    Exports take any batch size: batched frames, partial batches on timeout,
+    ROI crops and cascade crops all go through the same model.
+    """
+
+    def _resolve_weights(self) -> str:
+        """Return a local weights file, letting ultralytics download it if needed."""
+        if os.path.isfile(self.model_path):
+            return self.model_path
+        model = YOLO(self.model_path)
+        return getattr(model, 'ckpt_path', None) or self.model_path
+
+    def _cache_entry(self, weights_path: str, image_size: int, precision: Optional[str] = None) -> str:
+        stem = os.path.splitext(os.path.basename(weights_path))[0]
+        key = f"{stem}-{model_file_hash(weights_path)}-{self.export_format}-{image_size}-dynamic"
+        if (precision or self.precision) == "int8":
+            # Different calibration data gives a different model
+            calibration = os.path.abspath(self.calibration_data)
+            key += f"-int8-{hashlib.sha256(calibration.encode()).hexdigest()[:8]}"
+        return os.path.join(self.cache_dir, key)
+
+    def artifact_path(self, image_size: int, precision: Optional[str] = None) -> Optional[str]:
+        weights_path = self._resolve_weights()
+        entry = self._cache_entry(weights_path, image_size, precision)
+        if not os.path.isdir(entry):
+            return None
+        artifacts = [name for name in os.listdir(entry) if not name.startswith('.')]
+        return os.path.join(entry, artifacts[0]) if artifacts else None
+
+    @staticmethod
+    def _staging_dir(entry: str) -> str:
+        """Create an empty scratch directory next to a cache entry to build it in."""
+        staging = f"{entry}.partial-{os.getpid()}"
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+        return staging
+
+    def _publish(self, staging: str, entry: str, artifact_name: str) -> str:
+        """
+        Rename a finished staging directory into place as the cache entry.
+        The entry only appears once its artifact is complete, so an interrupted
+        export or quantization is never mistaken for a cache hit.
+
+        Returns:
+            str: Path of the artifact inside the entry
+        """
+        if os.path.isdir(entry):
+            shutil.rmtree(entry)
+        os.replace(staging, entry)
+        artifact = os.path.join(entry, artifact_name)
+        self.logger.info(f"Cached exported model at {artifact}")
+        return artifact
+
+    def _export(self, image_size: int, precision: str = "fp32", **export_args) -> str:
+        """Export the model and move the artifact into its cache entry."""
+        weights_path = self._resolve_weights()
+        entry = self._cache_entry(weights_path, image_size, precision)
+
+        self.logger.info(f"Exporting {weights_path} to {self.export_format} at {image_size}px")
+        exported = YOLO(weights_path).export(format=self.export_format, imgsz=image_size, dynamic=True,
+                                             **export_args)
+
+        staging = self._staging_dir(entry)
+        try:
+            artifact_name = os.path.basename(str(exported).rstrip(os.sep))
+            shutil.move(str(exported), os.path.join(staging, artifact_name))
+            return self._publish(staging, entry, artifact_name)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def prepare(self, image_size: int) -> str:
+        with self.export_lock:
+            path = self.artifact_path(image_size)
+            if path:
+                return path
+            if self.precision == "int8":
+                return self._quantize(image_size)
+            return self._export(image_size)
+
+    def load(self, image_size: int) -> Any:
+        path = self.prepare(image_size)
+        self.logger.info(f"Loading {self.name} model: {path}")
+        return YOLO(path, task='detect')
+
+
+class OnnxRuntimeBackend(ExportedBackend):
+    """Runs an ONNX export through ONNX Runtime (CPU execution provider)."""
+
+    name = "onnxruntime"
+    export_format = "onnx"
+    required_module = "onnxruntime"
+    supports_int8 = True
+
+    def _quantize(self, image_size: int) -> str:
+        """Static post-training quantization of the cached FP32 export."""
+        fp32_path = self.artifact_path(image_size, "fp32") or self._export(image_size)
+        entry = self._cache_entry(self._resolve_weights(), image_size)
+
+        frames = load_calibration_frames(self.calibration_data)
+        staging = self._staging_dir(entry)
+        try:
+            int8_name = os.path.basename(fp32_path).replace(".onnx", "_int8.onnx")
+            quantize_onnx_model(fp32_path, os.path.join(staging, int8_name), frames, image_size)
+            return self._publish(staging, entry, int8_name)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+
+class OpenVINOBackend(ExportedBackend):
+    """Runs an OpenVINO IR export through the OpenVINO CPU plugin."""
+
+    name = "openvino"
+    export_format = "openvino"
+    required_module = "openvino"
+    supports_int8 = True
+
+    def _quantize(self, image_size: int) -> str:
+        """Export through ultralytics with NNCF INT8 calibration on the local frames."""
+        weights_path = self._resolve_weights()
+        calibration_dir = self._cache_entry(weights_path, image_size) + "-calibration"
+        data_yaml = write_calibration_dataset(load_calibration_frames(self.calibration_data), calibration_dir)
+        try:
+            return self._export(image_size, precision="int8", int8=True, data=data_yaml)
+        finally:
+            shutil.rmtree(calibration_dir, ignore_errors=True)
+
+
+BACKENDS: Dict[str, Type[InferenceBackend]] = {
+    PyTorchBackend.name: PyTorchBackend,
+    OnnxRuntimeBackend.name: OnnxRuntimeBackend,
+    OpenVINOBackend.name: OpenVINOBackend
+}
+
+
+def check_backend_options(name: str, precision: str = "fp32",
+                          calibration_data: Optional[str] = None) -> Type[InferenceBackend]:
+    """
+    Validate a backend / precision combination from the configuration.
+
+    Args:
+        name: "pytorch", "onnxruntime" or "openvino"
+        precision: "fp32" or "int8"
+        calibration_data: Local recording used to calibrate INT8 models
+
+    Returns:
+        Backend class
+
+    Raises:
+        ValueError: If the backend is unknown, the precision is unknown, or INT8
+            is requested from a backend without INT8 support or without calibration data
+    """
+    backend_class = BACKENDS.get(name.lower())
+    if backend_class is None:
+        raise ValueError(f"Unknown inference backend: {name}. Choose from {', '.join(BACKENDS)}")
+    precision = precision.lower()
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown model precision: {precision}. Choose from {', '.join(PRECISIONS)}")
+    if precision == "int8":
+        if not backend_class.supports_int8:
+            supported = ', '.join(backend.name for backend in BACKENDS.values() if backend.supports_int8)
+            raise ValueError(f"model_precision int8 is not supported by the {name} backend (use {supported})")
+        if not calibration_data:
+            raise ValueError("INT8 models need calibration_data (a local recording)")
+    return backend_class
+
+
+def create_backend(name: str, model_path: str, cache_dir: Optional[str] = None,
+                   precision: str = "fp32", calibration_data: Optional[str] = None) -> InferenceBackend:
+    """
+    Create an inference backend by name.
+
+    Args:
+        name: "pytorch", "onnxruntime" or "openvino"
+        model_path: PyTorch weights file
+        cache_dir: Directory for exported artifacts
+        precision: "fp32" or "int8"
+        calibration_data: Local recording used to calibrate INT8 models
+
+    Returns:
+        InferenceBackend: Backend instance
+    """
+    backend_class = check_backend_options(name, precision, calibration_data)
+    return backend_class(model_path, cache_dir, precision.lower(), calibration_data)
@@ -0,0 +1,146 @@
+"""
+JpegDecoder - Fast JPEG decoding with decode-time downscaling
+Decodes MJPEG frames on demand, using libjpeg-turbo when available
+"""
+
+import logging
+from typing import Optional, Tuple, List, Dict, Any
+import cv2
+import numpy as np
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+except ImportError:
+    TurboJPEG = None
+    TJPF_BGR = None
+
+
+# OpenCV flags for DCT-domain reduction by 1/2, 1/4 and 1/8
+_REDUCED_COLOR_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8
+}
+
+
+def split_mjpeg_stream(data: bytes) -> List[bytes]:
+    """
+    Split a recorded MJPEG stream (concatenated JPEG images) into frames.
+
+    Args:
+        data: Raw stream bytes
+
+    Returns:
+        List[bytes]: One encoded JPEG per frame
+    """
+    frames = []
+    position = 0
+    while True:
+        start = data.find(b'\xff\xd8', position)
+        if start < 0:
+            break
+        end = data.find(b'\xff\xd9', start + 2)
+        if end < 0:
+            break
+        frames.append(data[start:end + 2])
+        position = end + 2
+    return frames
+
+
+def is_jpeg_buffer(buffer: Any) -> bool:
+    """Return True if the array holds JPEG-compressed bytes rather than pixels."""
+    return (isinstance(buffer, np.ndarray)
+            and (buffer.ndim == 1 or (buffer.ndim == 2 and buffer.shape[0] == 1))
+            and buffer.size > 2
+            and buffer.flat[0] == 0xFF and buffer.flat[1] == 0xD8)
+
+
+class JpegDecoder:
+    """
+    Decodes JPEG frames to BGR, optionally shrinking by 1/2, 1/4 or 1/8 during
+    the DCT so frames come out close to the detector's input resolution.
+    """
+
+    def __init__(self, source_width: int, target_width: Optional[int] = None, use_turbojpeg: bool = True):
+        """
+        Initialize the decoder.
+
+        Args:
+            source_width: Width of the encoded frames
+            target_width: Smallest acceptable decoded width; None decodes at full size
+            use_turbojpeg: Use PyTurboJPEG when installed, otherwise OpenCV
+        """
+        self.source_width = source_width
+        self.target_width = target_width
+        self.turbo = None
+        if use_turbojpeg and TurboJPEG is not None:
+            try:
+                self.turbo = TurboJPEG()
+            except Exception as e:
+                logging.getLogger(__name__).warning(f"libjpeg-turbo unavailable, using OpenCV decoder: {e}")
+
+        self.frames_decoded = 0
+        self.decode_failures = 0
+
+    @property
+    def backend(self) -> str:
+        return 'turbojpeg' if self.turbo is not None else 'opencv'
+
+    def choose_scale_denominator(self) -> int:
+        """
+        Pick the largest DCT reduction that keeps the frame at least target_width wide.
+
+        Returns:
+            int: 1, 2, 4 or 8
+        """
+        if not self.target_width:
+            return 1
+        for denominator in (8, 4, 2):
+            if self.source_width // denominator >= self.target_width:
+                return denominator
+        return 1
+
+    def decode(self, encoded: Any) -> Optional[Tuple[np.ndarray, float]]:
+        """
+        Decode a JPEG frame.
+
+        Args:
+            encoded: JPEG bytes or uint8 array
+
+        Returns:
+            Tuple of (BGR frame, decoded width / source width), or None on failure
+        """
+        denominator = self.choose_scale_denominator()
+        try:
+            if self.turbo is not None:
+                data = encoded.tobytes() if isinstance(encoded, np.ndarray) else encoded
+                frame = self.turbo.decode(data, pixel_format=TJPF_BGR, scaling_factor=(1, denominator))
+            else:
+                buffer = encoded if isinstance(encoded, np.ndarray) else np.frombuffer(encoded, dtype=np.uint8)
+                frame = cv2.imdecode(buffer.reshape(-1), _REDUCED_COLOR_FLAGS[denominator])
+        except Exception:
+            frame = None
+
+        if frame is None:
+            self.decode_failures += 1
+            return None
+
+        self.frames_decoded += 1
+        return frame, frame.shape[1] / self.source_width
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get decoder statistics.
+
+        Returns:
+            dict: Backend, target width and decode counters
+        """
+        return {
+            'backend': self.backend,
+            'source_width': self.source_width,
+            'target_width': self.target_width,
+            'scale_denominator': self.choose_scale_denominator(),
+            'frames_decoded': self.frames_decoded,
+            'decode_failures': self.decode_failures
+        }
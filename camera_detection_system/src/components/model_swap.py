@@ -0,0 +1,161 @@
+"""
+ModelSwap - Runtime model replacement bookkeeping
+Tracks a hot-swap from background load through the latency trial to keep or roll back
+"""
+
+import threading
+import time
+from typing import Dict, Any, Optional, List
+
+
+# Swap states
+IDLE = 'idle'
+LOADING = 'loading'        # new model loading and warming up off the detector thread
+PENDING = 'pending'        # loaded, switched in before the next batch
+TRIAL = 'trial'            # serving, latency checked against the budget
+ACTIVE = 'active'          # kept
+ROLLED_BACK = 'rolled_back'
+FAILED = 'failed'
+
+
+class ModelSwap:
+    """
+    State of the detector's model hot-swap. A swap loads in the background,
+    is switched in between batches, then serves trial_frames frames while
+    their latency is averaged; if the mean is over the budget the previous
+    model is switched back in. Without a budget the new model is kept as
+    soon as it serves.
+    """
+
+    def __init__(self, trial_frames: int = 30):
+        """
+        Initialize swap tracking.
+
+        Args:
+            trial_frames: Frames the new model serves before its latency is judged
+        """
+        self.trial_frames = max(1, trial_frames)
+
+        self.status = IDLE
+        self.from_path: Optional[str] = None
+        self.to_path: Optional[str] = None
+        self.latency_budget: Optional[float] = None   # seconds per frame
+        self.trial_samples: List[float] = []
+        self.load_seconds: Optional[float] = None
+        self.warmup_seconds: Optional[float] = None
+        self.trial_ms: Optional[float] = None
+        self.error: Optional[str] = None
+        self.started_at: Optional[float] = None
+
+        # Statistics
+        self.swaps = 0
+        self.rollbacks = 0
+        self.failures = 0
+
+        self.lock = threading.Lock()
+
+    @property
+    def in_progress(self) -> bool:
+        """Whether a swap is loading, waiting to switch in or on trial."""
+        return self.status in (LOADING, PENDING, TRIAL)
+
+    def begin(self, from_path: str, to_path: str, latency_budget: Optional[float]) -> bool:
+        """
+        Start a swap unless one is already in progress.
+
+        Args:
+            from_path: Model serving now
+            to_path: Model to switch to
+            latency_budget: Mean seconds per frame the new model must stay within, None to skip the trial
+
+        Returns:
+            bool: True if the swap may start
+        """
+        with self.lock:
+            if self.in_progress:
+                return False
+            self.status = LOADING
+            self.from_path, self.to_path = from_path, to_path
+            self.latency_budget = latency_budget
+            self.trial_samples = []
+            self.load_seconds = self.warmup_seconds = self.trial_ms = None
+            self.error = None
+            self.started_at = time.time()
+            return True
+
+    def loaded(self, load_seconds: float, warmup_seconds: float):
+        """Record that the new model is loaded and warm, waiting to be switched in."""
+        with self.lock:
+            self.status = PENDING
+            self.load_seconds = load_seconds
+            self.warmup_seconds = warmup_seconds
+
+    def fail(self, error: str):
+        """Record that the new model could not be loaded; the old one keeps serving."""
+        with self.lock:
+            self.status = FAILED
+            self.error = error
+            self.failures += 1
+
+    def installed(self) -> bool:
+        """
+        Record that the new model now serves, starting its trial if there is a budget.
+
+        Returns:
+            bool: True if the model is on trial, False if it was kept right away
+        """
+        with self.lock:
+            self.swaps += 1
+            self.status = TRIAL if self.latency_budget else ACTIVE
+            return self.status == TRIAL
+
+    def record(self, processing_time: float) -> Optional[str]:
+        """
+        Account the latency of a frame served by the model on trial.
+
+        Args:
+            processing_time: Seconds the frame took
+
+        Returns:
+            ACTIVE when this frame ended the trial within budget (the new model is kept),
+            ROLLED_BACK when it ended over budget (the previous model should return),
+            None while the trial goes on or when no model is on trial
+        """
+        with self.lock:
+            if self.status != TRIAL:
+                return None
+            self.trial_samples.append(processing_time)
+            if len(self.trial_samples) < self.trial_frames:
+                return None
+
+            mean = sum(self.trial_samples) / len(self.trial_samples)
+            self.trial_ms = mean * 1000.0
+            if mean <= self.latency_budget:
+                self.status = ACTIVE
+            else:
+                self.status = ROLLED_BACK
+                self.rollbacks += 1
+            return self.status
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get swap statistics.
+
+        Returns:
+            dict: State of the latest swap and swap/rollback/failure counts
+        """
+        with self.lock:
+            return {
+                'status': self.status,
+                'from_model': self.from_path,
+                'to_model': self.to_path,
+                'latency_budget_ms': self.latency_budget * 1000.0 if self.latency_budget else None,
+                'trial_frames_served': len(self.trial_samples),
+                'trial_ms': self.trial_ms,
+                'load_seconds': self.load_seconds,
+                'warmup_seconds': self.warmup_seconds,
+                'error': self.error,
+                'swaps': self.swaps,
+                'rollbacks': self.rollbacks,
+                'failures': self.failures
+            }
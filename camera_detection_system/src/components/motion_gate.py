@@ -0,0 +1,109 @@
+"""
+MotionGate - Cheap change detection in front of person detection
+Compares downscaled grayscale frames to decide whether inference is needed
+"""
+
+import threading
+import time
+from typing import Dict, Any, Optional
+import cv2
+import numpy as np
+
+
+class MotionGate:
+    """
+    Admits a frame for detection only when it differs enough from the last
+    admitted frame of the same camera, or when a forced refresh is due.
+    """
+
+    def __init__(self,
+                 pixel_threshold: int = 25,
+                 min_changed_fraction: float = 0.002,
+                 refresh_interval: float = 5.0,
+                 downscale_width: int = 64):
+        """
+        Initialize the motion gate.
+
+        Args:
+            pixel_threshold: Grayscale difference (0-255) for a pixel to count as changed
+            min_changed_fraction: Fraction of changed pixels that admits a frame
+            refresh_interval: Seconds after which a frame is admitted regardless of change
+            downscale_width: Width of the comparison image (height keeps aspect ratio)
+        """
+        self.pixel_threshold = pixel_threshold
+        self.min_changed_fraction = min_changed_fraction
+        self.refresh_interval = refresh_interval
+        self.downscale_width = downscale_width
+
+        # Per-camera reference image and time of last admitted frame
+        self.references: Dict[str, np.ndarray] = {}
+        self.last_admitted: Dict[str, float] = {}
+
+        # Statistics
+        self.frames_admitted = 0
+        self.frames_skipped = 0
+        self.forced_refreshes = 0
+        self.last_changed_fraction = 0.0
+
+        self.lock = threading.Lock()
+
+    def _downscale(self, frame: np.ndarray) -> np.ndarray:
+        """Shrink first, then convert to grayscale, to keep the per-frame cost tiny."""
+        height, width = frame.shape[:2]
+        small_height = max(1, int(height * self.downscale_width / width))
+        small = cv2.resize(frame, (self.downscale_width, small_height), interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        return small
+
+    def should_detect(self, camera_id: str, frame: np.ndarray, now: Optional[float] = None) -> bool:
+        """
+        Decide whether a frame is worth running detection on.
+
+        Args:
+            camera_id: Camera the frame came from
+            frame: BGR frame
+            now: Current time in seconds (defaults to time.monotonic())
+
+        Returns:
+            bool: True if the frame should go through inference
+        """
+        now = time.monotonic() if now is None else now
+        small = self._downscale(frame)
+
+        with self.lock:
+            reference = self.references.get(camera_id)
+            if reference is None or reference.shape != small.shape:
+                admit = True
+            else:
+                changed = np.count_nonzero(cv2.absdiff(small, reference) > self.pixel_threshold)
+                self.last_changed_fraction = float(changed / small.size)
+                admit = self.last_changed_fraction >= self.min_changed_fraction
+                if not admit and now - self.last_admitted.get(camera_id, 0.0) >= self.refresh_interval:
+                    admit = True
+                    self.forced_refreshes += 1
+
+            if admit:
+                self.references[camera_id] = small
+                self.last_admitted[camera_id] = now
+                self.frames_admitted += 1
+            else:
+                self.frames_skipped += 1
+            return admit
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get gate statistics.
+
+        Returns:
+            dict: Admitted and skipped frame counts and the skip ratio
+        """
+        with self.lock:
+            total = self.frames_admitted + self.frames_skipped
+            return {
+                'frames_admitted': self.frames_admitted,
+                'frames_skipped': self.frames_skipped,
+                'forced_refreshes': self.forced_refreshes,
+                'skip_ratio': self.frames_skipped / total if total > 0 else 0.0,
+                'last_changed_fraction': self.last_changed_fraction
+            }
@@ -8,8 +8,9 @@ import threading
 import queue
 import time
 import logging
+from collections import deque
 from typing import List, Optional, Tuple, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import numpy as np
 
 try:
@@ -17,11 +18,35 @@ try:
 except ImportError:
     YOLO = None
 
+try:
+    import torch
+except ImportError:
+    torch = None
+
 from .camera_manager import FrameData
+from .jpeg_decoder import JpegDecoder
+from .motion_gate import MotionGate
+from .adaptive_resolution import AdaptiveResolution
+from .tracker import PersonTracker
+from .roi_detection import RoiScheduler, merge_duplicate_boxes
+from .roi_mask import RoiMask
+from .detection_interval import DetectionInterval
+from .cascade import ModelCascade
+from .model_swap import ModelSwap, ACTIVE as SWAP_ACTIVE
+from .frame_deadline import FrameDeadline
+from .inference_backends import create_backend, check_backend_options, PyTorchBackend
+from .preprocessing import LetterboxPreprocessor, LetterboxGeometry, fit_to_input_size
 from models.telemetry import Detection, BoundingBox
 from models.config import SystemConfig
 
 
+def _to_numpy(values: Any) -> np.ndarray:
+    """Copy a (possibly GPU) tensor to a host numpy array in one transfer."""
+    if hasattr(values, 'cpu'):
+        values = values.cpu().numpy()
+    return np.asarray(values)
+
+
 @dataclass
 class DetectionResult:
     """Container for detection results with metadata"""
@@ -29,6 +54,8 @@ class DetectionResult:
     frame_data: FrameData
     processing_time: float
     model_confidence: float
+    reused: bool = False  # keep-alive: detections carried over from the last inferred frame
+    inference_image_size: Optional[int] = None  # model input size the frame was inferred at
 
 
 class PersonDetector:
@@ -42,7 +69,8 @@ class PersonDetector:
                  frame_queue: queue.Queue, 
                  detection_queue: queue.Queue,
                  shutdown_event: threading.Event,
-                 model_path: str = "yolov8n.pt"):
+                 model_path: Optional[str] = None,
+                 load_in_background: bool = False):
         """
         Initialize PersonDetector with input/output queues and configuration.
         
@@ -51,24 +79,112 @@ class PersonDetector:
             frame_queue: Input queue for frames from CameraManager
             detection_queue: Output queue for detection results
             shutdown_event: Event to signal shutdown
-            model_path: Path to YOLO model file
+            model_path: Path to YOLO model file (defaults to config.model_path)
+            load_in_background: Load and warm up the model on a separate thread;
+                ready_event is set when it is done
+                
+        Raises:
+            ValueError: If the configured backend does not support the model precision
         """
+        # Reject unsupported backend/precision combinations before anything starts loading
+        check_backend_options(config.inference_backend, config.model_precision, config.calibration_data)
+        
         self.config = config
         self.frame_queue = frame_queue
         self.detection_queue = detection_queue
-        self.model_path = model_path
+        self.model_path = model_path or config.model_path
+        self.image_size = config.inference_image_size
         self.confidence_threshold = config.detection_confidence_threshold
         self.max_detections = config.max_detections_per_frame
+        self.batch_size = max(1, config.detection_batch_size)
+        self.batch_timeout = config.detection_batch_timeout_ms / 1000.0
+        
+        # Adaptive resolution: trade input size for latency when a budget is set
+        self.resolution_controller = None
+        if config.latency_budget_ms:
+            self.resolution_controller = AdaptiveResolution(
+                image_sizes=config.adaptive_image_sizes,
+                latency_budget=config.latency_budget_ms / 1000.0,
+                initial_size=self.image_size,
+                cooldown_frames=config.adaptive_cooldown_frames
+            )
+            self.image_size = self.resolution_controller.current_size
+        
+        # Track-guided ROI detection: native-resolution crops around tracks between full passes
+        # Detect-every-N: the tracker propagates boxes on frames between inferences
+        self.tracker = None
+        self.roi_scheduler = None
+        self.detection_interval = None
+        if config.roi_detection_enabled or config.detection_interval > 1:
+            self.tracker = PersonTracker(
+                iou_threshold=config.tracker_iou_threshold,
+                max_missed=config.tracker_max_missed
+            )
+        if config.detection_interval > 1:
+            self.detection_interval = DetectionInterval(
+                max_interval=config.detection_interval,
+                adaptive=config.detection_interval_adaptive
+            )
+        if config.roi_detection_enabled:
+            self.roi_scheduler = RoiScheduler(
+                full_frame_interval=config.roi_full_frame_interval,
+                crop_size=config.roi_crop_size,
+                margin=config.roi_crop_margin
+            )
+        
+        # Static ROI masks: inference only where people can appear in each camera's view
+        self.roi_masks: Dict[str, RoiMask] = {}
+        for camera_config in config.get_camera_configs():
+            roi_mask = RoiMask.from_camera_config(camera_config)
+            if roi_mask:
+                self.roi_masks[camera_config.effective_id] = roi_mask
+        
+        # Two-tier cascade: a larger model re-checks boxes the main model is unsure about
+        self.cascade = None
+        self.cascade_model = None
+        self.cascade_backend = None
+        if config.cascade_model_path:
+            self.cascade = ModelCascade(
+                margin=config.cascade_margin,
+                crop_size=config.cascade_image_size,
+                crop_margin=config.roi_crop_margin
+            )
         
         # Detection state
         self.model = None
+        self.models: Dict[int, Any] = {}  # per input size, for backends exported at a fixed size
+        self.backend = None
         self.is_running = False
         self.detection_thread = None
         
+        # Hot-swap: a replacement model loads beside the serving one and is switched in between batches
+        self.model_swap = ModelSwap(trial_frames=config.model_swap_trial_frames)
+        self.pending_model: Optional[Tuple[Tuple[str, Any, Dict[int, Any]], bool]] = None  # (state, is rollback)
+        self.previous_model: Optional[Tuple[str, Any, Dict[int, Any]]] = None
+        self.swap_thread = None
+        
+        # Motion gate: skip inference on unchanged frames and reuse the last result
+        self.motion_gate = None
+        if config.motion_gate_enabled:
+            self.motion_gate = MotionGate(
+                pixel_threshold=config.motion_gate_pixel_threshold,
+                min_changed_fraction=config.motion_gate_min_changed_fraction,
+                refresh_interval=config.motion_gate_refresh_interval
+            )
+        self.last_detections: Dict[str, List[Detection]] = {}
+        
+        # Frames older than max_frame_age_ms are skipped rather than detected late
+        self.frame_deadline = None
+        if config.max_frame_age_ms:
+            self.frame_deadline = FrameDeadline("detection", config.max_frame_age_ms)
+        
         # Performance tracking
         self.detection_count = 0
         self.total_processing_time = 0.0
         self.last_detection_time = 0
+        self.batch_count = 0
+        self.latency_samples = deque(maxlen=1000)     # capture-to-result seconds per frame
+        self.completion_times = deque(maxlen=1000)    # result timestamps for windowed throughput
         
         # Thread synchronization
         self.stop_event = shutdown_event
@@ -80,9 +196,64 @@ class PersonDetector:
         # YOLO class ID for person (COCO dataset)
         self.PERSON_CLASS_ID = 0
         
-        # Initialize model in __init__
-        self.initialize_model()
+        # Detector-owned preprocessing: letterbox into reused buffers instead of per-call allocations
+        self.preprocessor = None
+        if config.detector_preprocessing:
+            if torch is None:
+                self.logger.warning("Detector preprocessing needs PyTorch, letting ultralytics preprocess frames")
+            else:
+                self.preprocessor = LetterboxPreprocessor(max_batch_size=self.batch_size)
+        if config.capture_resize and self.roi_scheduler:
+            self.logger.warning("capture_resize downscales frames before ROI crops; crops lose native resolution")
         
+        # Readiness: set once the model has loaded and warmed up (or failed to)
+        self.ready_event = threading.Event()
+        self.load_seconds = None
+        self.warmup_seconds = None
+        self.loader_thread = None
+        
+        # Everything the load and warm-up depend on must be settled before they start
+        self._configure_detection()
+        if load_in_background:
+            self.loader_thread = threading.Thread(target=self.load_model, name="PersonDetectorLoader", daemon=True)
+            self.loader_thread.start()
+        else:
+            self.load_model()
+    
+    def _configure_detection(self):
+        """Hook for subclasses to adjust detection modes and preprocessing before the model loads."""
+        
+    def load_model(self) -> bool:
+        """
+        Load and warm up the model, then set ready_event whether or not it succeeded.
+        
+        Returns:
+            bool: True if the model is ready for inference
+        """
+        try:
+            return self.initialize_model()
+        finally:
+            self.ready_event.set()
+    
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the model has finished loading, shutdown is requested or the timeout expires.
+        
+        Args:
+            timeout: Seconds to wait at most (None waits indefinitely)
+            
+        Returns:
+            bool: True if a model is ready for inference
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while not self.ready_event.wait(0.1):
+            if self.stop_event.is_set() or (deadline is not None and time.monotonic() >= deadline):
+                return False
+        return self._model_ready()
+    
+    def _model_ready(self) -> bool:
+        return self.model is not None
+    
     def initialize_model(self) -> bool:
         """
         Initialize YOLO model for person detection.
@@ -95,24 +266,279 @@ class PersonDetector:
             return False
             
         try:
-            self.logger.info(f"Loading YOLO model: {self.model_path}")
-            self.model = YOLO(self.model_path)
+            load_start = time.monotonic()
+            self.backend = self._create_backend(self.model_path)
+            self.logger.info(f"Loading YOLO model: {self.model_path} "
+                             f"({self.backend.name} backend, {self.backend.precision.upper()})")
+            self.models = self._load_models(self.backend)
+            self.model = self._model_for_size(self.image_size)
             
-            # Warm up model with dummy inference
-            dummy_frame = np.zeros((640, 640, 3), dtype=np.uint8)
-            _ = self.model(dummy_frame, verbose=False)
+            if self.cascade:
+                self._load_cascade_model()
+            self.load_seconds = time.monotonic() - load_start
             
-            self.logger.info("YOLO model loaded and warmed up successfully")
+            warmup_start = time.monotonic()
+            self._warm_up()
+            if self.cascade:
+                crop_size = self.cascade.crop_size
+                self.cascade_model(np.zeros((crop_size, crop_size, 3), dtype=np.uint8),
+                                   **{**self._inference_kwargs(), 'imgsz': crop_size, 'conf': self.confidence_threshold})
+            self.warmup_seconds = time.monotonic() - warmup_start
+            
+            self.logger.info(f"YOLO model loaded in {self.load_seconds:.2f}s "
+                             f"and warmed up in {self.warmup_seconds:.2f}s")
             return True
             
         except Exception as e:
             self.logger.error(f"Failed to load YOLO model: {e}")
             return False
     
+    def _create_backend(self, model_path: str):
+        """Create the configured inference backend for a model, falling back to PyTorch if it is not installed."""
+        backend = create_backend(self.config.inference_backend, model_path, self.config.model_cache_dir,
+                                 self.config.model_precision, self.config.calibration_data)
+        if not backend.is_available():
+            self.logger.warning(f"Inference backend '{backend.name}' not installed, falling back to PyTorch FP32")
+            backend = PyTorchBackend(model_path)
+        return backend
+    
+    def _load_models(self, backend) -> Dict[int, Any]:
+        """
+        Load a backend's model for the current input size.
+        
+        Exported models have a fixed input size, so every size in use is exported up front.
+        
+        Args:
+            backend: Inference backend of the model
+            
+        Returns:
+            dict: Model per input size
+        """
+        models = {self.image_size: backend.load(self.image_size)}
+        if backend.export_format:
+            image_sizes = list(self.resolution_controller.image_sizes) if self.resolution_controller else []
+            if self.roi_scheduler:
+                image_sizes.append(self.roi_scheduler.crop_size)
+            for image_size in image_sizes:
+                if image_size not in models:
+                    models[image_size] = backend.load(image_size)
+        return models
+    
+    def _load_cascade_model(self):
+        """Load the tier-2 model with the same backend; without it the detector runs single-tier."""
+        try:
+            self.cascade_backend = self._create_backend(self.config.cascade_model_path)
+            self.logger.info(f"Loading cascade tier-2 model: {self.config.cascade_model_path}")
+            self.cascade_model = self.cascade_backend.load(self.cascade.crop_size)
+        except Exception as e:
+            self.logger.error(f"Failed to load cascade model, running single-tier: {e}")
+            self.cascade = None
+            self.cascade_model = None
+    
+    def _warm_up(self, infer=None):
+        """
+        Run dummy inferences with the frame and batch shapes real frames will have,
+        so shape-dependent setup is done before the first camera frame arrives.
+        
+        Args:
+            infer: Callable(images, image_size) running the model to warm (defaults to _infer)
+        """
+        infer = infer or self._infer
+        for shape, image_size in self._expected_model_inputs():
+            frame = np.zeros(shape, dtype=np.uint8)
+            # Partial batches go out on timeout, so warm up single frames as well
+            for batch_size in sorted({1, self.batch_size}):
+                infer([frame] * batch_size, image_size)
+        
+        if self.roi_scheduler:
+            crop_size = self.roi_scheduler.crop_size
+            infer([np.zeros((crop_size, crop_size, 3), dtype=np.uint8)], crop_size)
+    
+    def _expected_model_inputs(self) -> List[Tuple[Tuple[int, int, int], int]]:
+        """
+        Image shapes and input sizes the configured cameras feed the model, after any
+        decode-time downscaling and ROI mask cropping.
+        
+        Returns:
+            List of distinct ((height, width, 3) shape, input size) pairs
+        """
+        inputs = []
+        for camera_config in self.config.get_camera_configs():
+            denominator = 1
+            if camera_config.capture_mode.lower() == 'mjpeg' and camera_config.type.lower() == 'usb_camera':
+                denominator = JpegDecoder(camera_config.width, camera_config.jpeg_decode_width,
+                                          use_turbojpeg=False).choose_scale_denominator()
+            # JPEG scaled decoding rounds partial blocks up
+            height, width = -(-camera_config.height // denominator), -(-camera_config.width // denominator)
+            resize_to = self.config.get_capture_resize_size()
+            if resize_to and denominator == 1:
+                height, width = fit_to_input_size(height, width, resize_to)
+            shape, image_size = (height, width, 3), self.image_size
+            roi_mask = self.roi_masks.get(camera_config.effective_id)
+            if roi_mask:
+                x1, y1, x2, y2 = roi_mask.crop_window(shape)
+                shape, image_size = (y2 - y1, x2 - x1, 3), self._masked_input_size(roi_mask, shape)
+            if (shape, image_size) not in inputs:
+                inputs.append((shape, image_size))
+        return inputs
+    
+    def _model_for_size(self, image_size: int, backend=None, models: Optional[Dict[int, Any]] = None) -> Any:
+        """
+        Return a model that runs at the given input size, loading it on first use.
+        
+        Args:
+            image_size: Square model input size in pixels
+            backend: Backend to load with (defaults to the serving one)
+            models: Model per input size of that backend (defaults to the serving ones)
+            
+        Returns:
+            Callable ultralytics model
+        """
+        if backend is None:
+            backend, models = self.backend, self.models
+        if backend.export_format is None and models:
+            # Native weights accept any input size through the imgsz argument
+            return next(iter(models.values()))
+        
+        model = models.get(image_size)
+        if model is None:
+            model = backend.load(image_size)
+            models[image_size] = model
+        return model
+    
+    def swap_model(self, model_path: str, latency_budget_ms: Optional[float] = None) -> bool:
+        """
+        Replace the model without stopping detection.
+        
+        The new model loads and warms up on a background thread while the current
+        one keeps serving, then is switched in between two batches. If a latency
+        budget applies (latency_budget_ms, else config.latency_budget_ms), the new
+        model serves model_swap_trial_frames frames on trial and the previous model
+        is switched back in if their mean latency is over the budget.
+        
+        config.model_path follows the swap: it is set to the new model when the
+        swap starts and back to the serving model if loading fails or the trial
+        rolls back, so a reloaded config file retries a model that was not kept.
+        
+        Args:
+            model_path: Path of the model to switch to
+            latency_budget_ms: Per-frame budget for the trial (defaults to config.latency_budget_ms)
+            
+        Returns:
+            bool: True if the swap started, False if the detector is not ready or a swap is in progress
+        """
+        if not self._model_ready():
+            self.logger.warning(f"Cannot swap to {model_path}: no model serving yet")
+            return False
+        if model_path == self.model_path:
+            self.logger.info(f"Model {model_path} is already serving")
+            return False
+        
+        budget_ms = latency_budget_ms if latency_budget_ms is not None else self.config.latency_budget_ms
+        with self.lock:
+            if self.pending_model is not None or not self.model_swap.begin(
+                    self.model_path, model_path, budget_ms / 1000.0 if budget_ms else None):
+                self.logger.warning(f"Cannot swap to {model_path}: a model swap is already in progress")
+                return False
+            self.config.model_path = model_path
+        
+        self.logger.info(f"Loading replacement model {model_path} while {self.model_path} keeps serving")
+        self.swap_thread = threading.Thread(target=self._load_swap_model, args=(model_path,),
+                                            name="PersonDetectorSwap", daemon=True)
+        self.swap_thread.start()
+        return True
+    
+    def _load_swap_model(self, model_path: str):
+        """Load and warm a replacement model off the detector thread, then queue it to be switched in."""
+        try:
+            load_start = time.monotonic()
+            backend = self._create_backend(model_path)
+            models = self._load_models(backend)
+            load_seconds = time.monotonic() - load_start
+            
+            # Warm with its own buffers: the serving model's preprocessor is in use on the detector thread
+            warmup_start = time.monotonic()
+            preprocessor = LetterboxPreprocessor(max_batch_size=self.batch_size) if self.preprocessor else None
+            
+            def infer(images: List[np.ndarray], image_size: int) -> List[Any]:
+                inputs, _ = self._prepare_inputs(images, image_size, preprocessor)
+                return self._run_model(inputs, image_size, self._model_for_size(image_size, backend, models))
+            
+            self._warm_up(infer)
+            warmup_seconds = time.monotonic() - warmup_start
+            
+        except Exception as e:
+            self.logger.error(f"Failed to load replacement model {model_path}, keeping {self.model_path}: {e}")
+            with self.lock:
+                self.config.model_path = self.model_path
+            self.model_swap.fail(str(e))
+            return
+        
+        self.logger.info(f"Replacement model {model_path} loaded in {load_seconds:.2f}s "
+                         f"and warmed up in {warmup_seconds:.2f}s")
+        self.model_swap.loaded(load_seconds, warmup_seconds)
+        with self.lock:
+            self.pending_model = ((model_path, backend, models), False)
+        if not self.is_running:
+            self._install_pending_model()
+    
+    def _install_pending_model(self):
+        """Switch in a loaded replacement (or the rolled-back model); called between batches."""
+        with self.lock:
+            pending, self.pending_model = self.pending_model, None
+        if pending is None:
+            return
+        
+        (model_path, backend, models), rollback = pending
+        serving = (self.model_path, self.backend, self.models)
+        self.model_path, self.backend, self.models = model_path, backend, models
+        self.model = self._model_for_size(self.image_size)
+        
+        if rollback:
+            self.previous_model = None
+            with self.lock:
+                self.config.model_path = model_path
+            self.logger.warning(f"Rolled back to model {model_path}")
+        else:
+            # The old model is only kept in memory while the new one is on trial
+            self.previous_model = serving if self.model_swap.installed() else None
+            self.logger.info(f"Switched model {serving[0]} -> {model_path}")
+    
+    def _record_swap_trial(self, processing_time: float):
+        """Feed frame latency to a swapped-in model's trial; release the old model or roll back when it ends."""
+        outcome = self.model_swap.record(processing_time)
+        if outcome is None:
+            return
+        if outcome == SWAP_ACTIVE:
+            with self.lock:
+                self.previous_model = None
+            self.logger.info(f"Model {self.model_path} kept after its latency trial, previous model released")
+            return
+        
+        stats = self.model_swap.get_stats()
+        self.logger.warning(f"Model {stats['to_model']} averaged {stats['trial_ms']:.1f} ms per frame, "
+                            f"over the {stats['latency_budget_ms']:.0f} ms budget")
+        with self.lock:
+            if self.previous_model is not None:
+                self.pending_model = (self.previous_model, True)
+    
+    def _adapt_image_size(self, processing_time: float):
+        """Feed the frame latency to the resolution controller and switch size if it asks to."""
+        if not self.resolution_controller or not self.resolution_controller.record(processing_time):
+            return
+        
+        new_size = self.resolution_controller.current_size
+        self.logger.info(f"Inference image size {self.image_size} -> {new_size} "
+                         f"(latency budget {self.resolution_controller.latency_budget * 1000.0:.0f} ms)")
+        self.model = self._model_for_size(new_size)
+        self.image_size = new_size
+    
     def run(self):
         """Main detection loop for the person detector thread."""
-        if self.model is None:
-            self.logger.error("Model not initialized, exiting run loop")
+        # Frames queue up while the model loads; start as soon as inference is ready
+        if not self.wait_until_ready():
+            if not self.stop_event.is_set():
+                self.logger.error("Model not initialized, exiting run loop")
             return
         
         self.is_running = True
@@ -120,28 +546,13 @@ class PersonDetector:
         
         while not self.stop_event.is_set():
             try:
-                # Get frame from queue (with timeout)
-                try:
-                    frame_data = self.frame_queue.get(timeout=0.1)
-                except queue.Empty:
+                # Get up to batch_size frames from queue (with timeout)
+                batch = self._collect_batch()
+                if not batch:
                     continue
                 
-                # Process frame for person detection
-                detection_result = self._process_frame(frame_data)
-                
-                if detection_result:
-                    # Add result to output queue
-                    try:
-                        self.detection_queue.put_nowait(detection_result)
-                        self.detection_count += 1
-                        self.last_detection_time = time.time()
-                        
-                    except queue.Full:
-                        # Queue full, skip this result
-                        self.logger.debug("Detection queue full, skipping result")
-                
-                # Mark frame as processed
-                self.frame_queue.task_done()
+                # Process frames for person detection
+                self._emit_results(batch, self._process_batch(batch))
                 
             except Exception as e:
                 self.logger.error(f"Error in detection loop: {e}")
@@ -150,6 +561,79 @@ class PersonDetector:
         self.is_running = False
         self.logger.info("Person detection loop ended")
     
+    def _emit_results(self, batch: List[FrameData], detection_results: List[Optional[DetectionResult]]):
+        """
+        Queue the results of a batch in frame order and hand the frames back to the camera.
+        
+        Args:
+            batch: Frames taken from the frame queue
+            detection_results: Result per frame (None where processing failed)
+        """
+        for frame_data, detection_result in zip(batch, detection_results):
+            if detection_result:
+                # Add result to output queue
+                try:
+                    self.detection_queue.put_nowait(detection_result)
+                    self.detection_count += 1
+                    self.last_detection_time = time.time()
+                    self._record_latency(frame_data, self.last_detection_time)
+                    
+                except queue.Full:
+                    # Queue full, skip this result
+                    self.logger.debug("Detection queue full, skipping result")
+            
+            # Pixels are no longer needed; hand the buffer back to the camera pool
+            frame_data.release()
+            
+            # Mark frame as processed
+            self.frame_queue.task_done()
+    
+    def _collect_batch(self) -> List[FrameData]:
+        """
+        Gather up to batch_size frames, waiting at most batch_timeout after the first.
+        
+        Returns:
+            List[FrameData]: Frames to process, empty if none arrived
+        """
+        try:
+            batch = [self.frame_queue.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+        
+        deadline = time.monotonic() + self.batch_timeout
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.frame_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        
+        if self.frame_deadline:
+            batch = self._drop_stale_frames(batch)
+        return batch
+    
+    def _drop_stale_frames(self, batch: List[FrameData]) -> List[FrameData]:
+        """
+        Skip frames past their deadline, handing their buffers straight back to the camera.
+        
+        Args:
+            batch: Frames taken from the frame queue
+            
+        Returns:
+            List[FrameData]: The frames still fresh enough to detect in
+        """
+        now = time.time()
+        fresh = []
+        for frame_data in batch:
+            if self.frame_deadline.is_stale(frame_data.timestamp, now):
+                frame_data.release()
+                self.frame_queue.task_done()
+            else:
+                fresh.append(frame_data)
+        return fresh
+    
     def _process_frame(self, frame_data: FrameData) -> Optional[DetectionResult]:
         """
         Process a single frame for person detection.
@@ -160,40 +644,430 @@ class PersonDetector:
         Returns:
             DetectionResult: Detection results, or None if processing failed
         """
+        return self._process_batch([frame_data])[0]
+    
+    def _process_batch(self, batch: List[FrameData]) -> List[Optional[DetectionResult]]:
+        """
+        Process a batch of frames with a single model call.
+        
+        Args:
+            batch: Frames from CameraManager, in queue order
+            
+        Returns:
+            List of DetectionResult (or None where processing failed), aligned with batch
+        """
+        results: List[Optional[DetectionResult]] = [None] * len(batch)
+        
+        # A replacement model only ever switches in between batches
+        self._install_pending_model()
+        
+        try:
+            # Frames that need a full-frame pass wait here so they share one model call
+            to_infer: List[int] = []
+            for index, frame_data in enumerate(batch):
+                # Frames answered without the model are charged only their own work
+                frame_start = time.time()
+                
+                # Compressed frames are decoded only now that they are about to be used
+                if not frame_data.ensure_decoded():
+                    self.logger.debug(f"Failed to decode frame {frame_data.frame_id}")
+                    continue
+                
+                # Reuse, interval and ROI decisions build on this camera's latest results,
+                # so its earlier frames still waiting for the model go first
+                waiting = any(batch[pending].camera_id == frame_data.camera_id for pending in to_infer)
+                
+                # Unchanged scene: skip inference and send the last result as a keep-alive
+                if self.motion_gate and not self.motion_gate.should_detect(frame_data.camera_id,
+                                                                           self._masked_view(frame_data)):
+                    if waiting:
+                        frame_start += self._flush_full_frames(batch, to_infer, results)
+                    results[index] = self._reuse_last_result(frame_data, frame_start)
+                    continue
+                
+                if self.tracker and waiting:
+                    frame_start += self._flush_full_frames(batch, to_infer, results)
+                
+                # Between inferences the tracker stands in for the model
+                if self.detection_interval and not self.detection_interval.should_detect(frame_data.camera_id):
+                    results[index] = self._propagate_tracks(frame_data, frame_start)
+                    continue
+                
+                # Between full-frame passes, ROI mode detects only in crops around tracked people
+                if self.roi_scheduler:
+                    crops = self._plan_crops(frame_data)
+                    if crops is not None:
+                        results[index] = self._detect_in_crops(frame_data, crops)
+                        continue
+                
+                to_infer.append(index)
+            
+            self._infer_full_frames(batch, to_infer, results)
+            
+        except Exception as e:
+            self.logger.error(f"Frame processing failed: {e}")
+            
+        return results
+    
+    def _flush_full_frames(self, batch: List[FrameData], to_infer: List[int],
+                           results: List[Optional[DetectionResult]]) -> float:
+        """
+        Infer and track the frames waiting for a full-frame pass, emptying to_infer.
+        
+        Returns:
+            float: Seconds it took, so the frame that forced the flush is not charged for it
+        """
+        flush_start = time.time()
+        self._infer_full_frames(batch, to_infer, results)
+        to_infer.clear()
+        return time.time() - flush_start
+    
+    def _infer_full_frames(self, batch: List[FrameData], to_infer: List[int],
+                           results: List[Optional[DetectionResult]]):
+        """
+        Run one model call over whole frames of a batch and track the detections in frame order.
+        
+        Only this call is timed: decoding, gating, ROI crops and tracker work for the
+        other frames of the batch are not charged to these frames.
+        
+        Args:
+            batch: Frames being processed
+            to_infer: Indices into batch of the frames to run, in queue order
+            results: Per-frame results of the batch, filled in for to_infer
+        """
+        if not to_infer:
+            return
+        
+        # Run YOLO inference, one call for all the frames, on the masked regions
         start_time = time.time()
+        images, origins, image_size = self._mask_frames([batch[index] for index in to_infer])
+        model_results, geometries = self._infer(images, image_size)
+        self.batch_count += 1
         
+        # Input preparation and inference are shared by the frames; charge each frame its
+        # share (the pipelined detector accounts its stages the same way)
+        processing_time = (time.time() - start_time) / len(to_infer)
+        
+        for position, (index, model_result) in enumerate(zip(to_infer, model_results)):
+            frame_data = batch[index]
+            
+            # Extract person detections (and run cascade tier 2 where tier 1 is unsure)
+            extract_start = time.time()
+            detections = self._extract_person_detections(model_result, frame_data,
+                                                         geometries[position] if geometries else None,
+                                                         origins[position])
+            frame_time = processing_time + (time.time() - extract_start)
+            self._track(frame_data, detections)
+            self.last_detections[frame_data.camera_id] = detections
+            self.total_processing_time += frame_time
+            
+            # Get model confidence (average of all detections)
+            avg_confidence = np.mean([det.confidence for det in detections]) if detections else 0.0
+            
+            results[index] = DetectionResult(
+                detections=detections,
+                frame_data=frame_data,
+                processing_time=frame_time,
+                model_confidence=float(avg_confidence),
+                inference_image_size=image_size
+            )
+        
+        self._adapt_image_size(processing_time)
+        self._record_swap_trial(processing_time)
+    
+    def _track(self, frame_data: FrameData, detections: List[Detection]):
+        """Feed freshly inferred detections to the tracker and retune the detection interval."""
+        if not self.tracker:
+            return
+        
+        camera_id = frame_data.camera_id
+        previous_ids = {track.track_id for track, _ in self.tracker.predict(camera_id, frame_data.frame_id)
+                        if track.misses == 0}
+        self.tracker.update(camera_id, frame_data.frame_id, detections)
+        
+        if self.detection_interval:
+            # People appearing or disappearing means the next frames need the model
+            tracks_changed = previous_ids != {detection.track_id for detection in detections}
+            self.detection_interval.update(camera_id, self.tracker.relative_speed(camera_id), tracks_changed)
+    
+    def _propagate_tracks(self, frame_data: FrameData, start_time: float) -> DetectionResult:
+        """
+        Build a result for a frame skipped by the detection interval from tracker predictions.
+        
+        Args:
+            frame_data: Frame that gets no inference
+            start_time: Time processing of the frame started
+            
+        Returns:
+            DetectionResult: Detections flagged as propagated
+        """
+        detections = self.tracker.propagate(frame_data.camera_id, frame_data.frame_id)
+        processing_time = time.time() - start_time
+        self.total_processing_time += processing_time
+        avg_confidence = np.mean([det.confidence for det in detections]) if detections else 0.0
+        
+        return DetectionResult(
+            detections=detections,
+            frame_data=frame_data,
+            processing_time=processing_time,
+            model_confidence=float(avg_confidence),
+            inference_image_size=None
+        )
+    
+    def _masked_view(self, frame_data: FrameData) -> np.ndarray:
+        """The part of a frame inside its camera's ROI mask bounds (the whole frame without a mask)."""
+        roi_mask = self.roi_masks.get(frame_data.camera_id)
+        if roi_mask is None:
+            return frame_data.frame
+        x1, y1, x2, y2 = roi_mask.crop_window(frame_data.frame.shape)
+        return frame_data.frame[y1:y2, x1:x2]
+    
+    def _mask_frames(self, frames: List[FrameData]) -> Tuple[List[np.ndarray], List[Tuple[int, int]], int]:
+        """
+        Crop frames to their cameras' ROI mask bounds for inference.
+        
+        Args:
+            frames: Decoded frames about to be detected in one model call
+            
+        Returns:
+            Tuple of (images for the model, (x, y) origin of each image in its frame,
+            input size for the call)
+        """
+        images, origins, image_sizes = [], [], []
+        for frame_data in frames:
+            roi_mask = self.roi_masks.get(frame_data.camera_id)
+            if roi_mask is None:
+                images.append(frame_data.frame)
+                origins.append((0, 0))
+                image_sizes.append(self.image_size)
+                continue
+            image_sizes.append(self._masked_input_size(roi_mask, frame_data.frame.shape))
+            image, origin = roi_mask.crop(frame_data.frame)
+            images.append(image)
+            origins.append(origin)
+        return images, origins, max(image_sizes)
+    
+    def _masked_input_size(self, roi_mask: RoiMask, frame_shape: Tuple[int, ...]) -> int:
+        """Input size for a masked crop: smaller with the crop, except for models exported at a fixed size."""
+        if self.backend is not None and self.backend.export_format:
+            return self.image_size
+        return roi_mask.input_size(self.image_size, frame_shape)
+    
+    def _drop_masked(self, frame_data: FrameData, indices: np.ndarray, xyxy: np.ndarray,
+                     confidences: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Drop boxes whose centre lies outside the camera's ROI mask.
+        
+        Args:
+            frame_data: Frame the boxes were found in
+            indices: Original YOLO box index of each box
+            xyxy: Boxes in frame pixels
+            confidences: Confidence of each box
+            
+        Returns:
+            Tuple of (indices, xyxy, confidences) of the boxes inside the mask
+        """
+        roi_mask = self.roi_masks.get(frame_data.camera_id)
+        if roi_mask is None or len(xyxy) == 0:
+            return indices, xyxy, confidences
+        keep = roi_mask.contains(xyxy, frame_data.frame.shape)
+        return indices[keep], xyxy[keep], confidences[keep]
+    
+    def _plan_crops(self, frame_data: FrameData) -> Optional[List[Tuple[int, int, int, int]]]:
+        """
+        Ask the ROI scheduler how to detect in a frame, given the predicted track positions.
+        
+        Args:
+            frame_data: Decoded frame about to be processed
+            
+        Returns:
+            Crop windows in frame pixels, or None for a full-frame pass
+        """
+        predicted = [box * frame_data.frame_scale
+                     for _, box in self.tracker.predict(frame_data.camera_id, frame_data.frame_id)]
+        return self.roi_scheduler.plan(frame_data.camera_id, frame_data.frame.shape, predicted)
+    
+    def _detect_in_crops(self, frame_data: FrameData,
+                         windows: List[Tuple[int, int, int, int]]) -> Optional[DetectionResult]:
+        """
+        Detect persons in native-resolution crops and map them back to the full frame.
+        
+        Args:
+            frame_data: Decoded frame
+            windows: Crop windows (x1, y1, x2, y2) in frame pixels
+            
+        Returns:
+            DetectionResult: Detections in full-frame camera coordinates, or None on failure
+        """
+        start_time = time.time()
         try:
-            # Run YOLO inference
-            results = self.model(frame_data.frame, verbose=False)
+            crop_size = self.roi_scheduler.crop_size
+            crops = [frame_data.frame[y1:y2, x1:x2] for x1, y1, x2, y2 in windows]
+            model_results, geometries = self._infer(crops, crop_size)
+            self.batch_count += 1
             
-            # Extract person detections
-            detections = self._extract_person_detections(results[0], frame_data)
+            # Shift each crop's boxes by the crop origin, then merge people seen in two crops
+            all_xyxy, all_confidences = [], []
+            for position, ((x1, y1, _, _), model_result) in enumerate(zip(windows, model_results)):
+                _, xyxy, confidences = self._select_person_boxes(model_result)
+                if geometries:
+                    xyxy = geometries[position].boxes_to_frame(xyxy)
+                all_xyxy.append(xyxy + np.array([x1, y1, x1, y1], dtype=xyxy.dtype))
+                all_confidences.append(confidences)
+            xyxy = np.concatenate(all_xyxy)
+            confidences = np.concatenate(all_confidences)
+            _, xyxy, confidences = self._drop_masked(frame_data, np.arange(len(xyxy)), xyxy, confidences)
+            keep = merge_duplicate_boxes(xyxy, confidences)[:self.max_detections]
+            
+            detections = self._build_detections(keep, xyxy[keep], confidences[keep], frame_data)
+            self._track(frame_data, detections)
+            self.last_detections[frame_data.camera_id] = detections
             
-            # Calculate processing time
             processing_time = time.time() - start_time
             self.total_processing_time += processing_time
-            
-            # Get model confidence (average of all detections)
             avg_confidence = np.mean([det.confidence for det in detections]) if detections else 0.0
             
             return DetectionResult(
                 detections=detections,
                 frame_data=frame_data,
                 processing_time=processing_time,
-                model_confidence=float(avg_confidence)
+                model_confidence=float(avg_confidence),
+                inference_image_size=crop_size
             )
             
         except Exception as e:
-            self.logger.error(f"Frame processing failed: {e}")
+            self.logger.error(f"ROI detection failed: {e}")
             return None
     
-    def _extract_person_detections(self, result: Any, frame_data: FrameData) -> List[Detection]:
+    def _infer(self, images: List[np.ndarray], image_size: int) -> Tuple[List[Any], Optional[List[LetterboxGeometry]]]:
+        """
+        Run the model at an input size on a list of frames or crops in one call.
+        
+        With detector preprocessing the images are letterboxed into reused buffers
+        and handed over as a tensor; otherwise ultralytics preprocesses them.
+        
+        Args:
+            images: BGR frames or crops
+            image_size: Square model input size in pixels
+            
+        Returns:
+            Tuple of (one result per image, letterbox geometries to map boxes back, or None
+            when boxes are already in image pixels)
+        """
+        inputs, geometries = self._prepare_inputs(images, image_size)
+        return self._run_model(inputs, image_size), geometries
+    
+    def _prepare_inputs(self, images: List[np.ndarray], image_size: int,
+                        preprocessor: Optional[LetterboxPreprocessor] = None
+                        ) -> Tuple[Any, Optional[List[LetterboxGeometry]]]:
+        """
+        Turn frames or crops into model input, letterboxing them here when detector preprocessing is on.
+        
+        Args:
+            images: BGR frames or crops
+            image_size: Square model input size in pixels
+            preprocessor: Preprocessor to letterbox with (defaults to the detector's)
+            
+        Returns:
+            Tuple of (model input, letterbox geometries or None)
+        """
+        preprocessor = preprocessor or self.preprocessor
+        if preprocessor:
+            inputs, geometries = preprocessor.prepare(images, image_size)
+            return torch.from_numpy(inputs), geometries
+        return (images if len(images) > 1 else images[0]), None
+    
+    def _run_model(self, inputs: Any, image_size: int, model: Any = None) -> List[Any]:
+        """
+        Call the model for an input size.
+        
+        Args:
+            inputs: Model input from _prepare_inputs()
+            image_size: Square model input size in pixels
+            model: Model to call (defaults to the serving model for the size)
+            
+        Returns:
+            One ultralytics result per image
+        """
+        kwargs = self._inference_kwargs()
+        kwargs['imgsz'] = image_size
+        return (model or self._model_for_size(image_size))(inputs, **kwargs)
+    
+    def _inference_kwargs(self) -> Dict[str, Any]:
+        """
+        Build model call arguments that prune non-person and low-confidence boxes inside NMS.
+        
+        Read on every call so update_confidence_threshold() takes effect on the next frame.
+        
+        Returns:
+            dict: Keyword arguments for the YOLO model call
+        """
+        # A cascade lets borderline boxes through tier 1 so tier 2 can rule on them
+        conf = self.cascade.tier1_threshold(self.confidence_threshold) if self.cascade else self.confidence_threshold
+        return {
+            'classes': [self.PERSON_CLASS_ID],
+            'conf': conf,
+            'max_det': self.max_detections,
+            'imgsz': self.image_size,
+            'verbose': False
+        }
+    
+    def _record_latency(self, frame_data: FrameData, completed_at: float):
+        """Track capture-to-result latency and completion times for throughput."""
+        with self.lock:
+            self.latency_samples.append(completed_at - frame_data.timestamp)
+            self.completion_times.append(completed_at)
+    
+    def _latency_stats(self) -> Dict[str, float]:
+        """Windowed throughput and latency percentiles (caller holds the lock)."""
+        samples = sorted(self.latency_samples)
+        if not samples:
+            return {'throughput_fps': 0.0, 'latency_p50_ms': 0.0, 'latency_p99_ms': 0.0}
+        
+        window = self.completion_times[-1] - self.completion_times[0]
+        throughput = (len(self.completion_times) - 1) / window if window > 0 else 0.0
+        return {
+            'throughput_fps': throughput,
+            'latency_p50_ms': samples[len(samples) // 2] * 1000.0,
+            'latency_p99_ms': samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000.0
+        }
+    
+    def _reuse_last_result(self, frame_data: FrameData, start_time: float) -> DetectionResult:
+        """
+        Build a keep-alive result from the camera's last inferred detections.
+        
+        Args:
+            frame_data: Frame skipped by the motion gate
+            start_time: Time processing of the frame started
+            
+        Returns:
+            DetectionResult: Result and its detections flagged as reused
+        """
+        detections = [replace(det, reused=True) for det in self.last_detections.get(frame_data.camera_id, [])]
+        processing_time = time.time() - start_time
+        self.total_processing_time += processing_time
+        avg_confidence = np.mean([det.confidence for det in detections]) if detections else 0.0
+        
+        return DetectionResult(
+            detections=detections,
+            frame_data=frame_data,
+            processing_time=processing_time,
+            model_confidence=float(avg_confidence),
+            reused=True,
+            inference_image_size=self.image_size
+        )
+    
+    def _extract_person_detections(self, result: Any, frame_data: FrameData,
+                                   geometry: Optional[LetterboxGeometry] = None,
+                                   origin: Tuple[int, int] = (0, 0)) -> List[Detection]:
         """
         Extract person detections from YOLO results.
         
         Args:
             result: YOLO detection result
             frame_data: Original frame data
+            geometry: Letterbox placement of the frame when the detector preprocessed it
+            origin: (x, y) of the image the model saw inside the frame, when it was an ROI mask crop
             
         Returns:
             List[Detection]: List of person detections
@@ -201,48 +1075,17 @@ class PersonDetector:
         detections = []
         
         try:
-            # Get detection data
-            boxes = result.boxes
-            if boxes is None or len(boxes) == 0:
-                return detections
-            
-            # Filter for person class and confidence threshold
-            for i, box in enumerate(boxes):
-                # Check if detection is a person
-                class_id = int(box.cls[0])
-                if class_id != self.PERSON_CLASS_ID:
-                    continue
-                
-                # Check confidence threshold
-                confidence = float(box.conf[0])
-                if confidence < self.confidence_threshold:
-                    continue
-                
-                # Extract bounding box coordinates (x1, y1, x2, y2)
-                x1, y1, x2, y2 = box.xyxy[0].tolist()
-                
-                # Create bounding box
-                bbox = BoundingBox(
-                    x=int(x1),
-                    y=int(y1),
-                    width=int(x2 - x1),
-                    height=int(y2 - y1)
-                )
-                
-                # Create detection
-                detection = Detection(
-                    object_id=f"person_{frame_data.frame_id}_{i}",
-                    object_type="person",
-                    confidence=confidence,
-                    bounding_box=bbox,
-                    spatial_coordinates=None  # Will be calculated later by CoordinateCalculator
-                )
-                
-                detections.append(detection)
-                
-                # Limit number of detections
-                if len(detections) >= self.max_detections:
-                    break
+            min_confidence = self.cascade.tier1_threshold(self.confidence_threshold) if self.cascade else None
+            indices, xyxy, confidences = self._select_person_boxes(result, min_confidence)
+            if geometry is not None:
+                xyxy = geometry.boxes_to_frame(xyxy)
+            if origin != (0, 0):
+                xyxy = xyxy + np.array([origin[0], origin[1], origin[0], origin[1]], dtype=xyxy.dtype)
+            indices, xyxy, confidences = self._drop_masked(frame_data, indices, xyxy, confidences)
+            if self.cascade:
+                xyxy, confidences = self._run_cascade(frame_data, xyxy, confidences)
+                indices = np.arange(len(xyxy))
+            detections = self._build_detections(indices, xyxy, confidences, frame_data)
             
             self.logger.debug(f"Found {len(detections)} person detections in frame {frame_data.frame_id}")
             
@@ -251,6 +1094,117 @@ class PersonDetector:
             
         return detections
     
+    def _run_cascade(self, frame_data: FrameData, xyxy: np.ndarray,
+                     confidences: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Re-detect uncertain tier-1 boxes with the tier-2 model on crops and merge both tiers.
+        
+        Args:
+            frame_data: Decoded frame the boxes were found in
+            xyxy: Tier-1 boxes in frame pixels, down to the lowered tier-1 threshold
+            confidences: Tier-1 confidences
+            
+        Returns:
+            Tuple of (xyxy, confidences) above the detection threshold, highest confidence first
+        """
+        confident, uncertain = self.cascade.split(confidences, self.confidence_threshold)
+        if not uncertain.any():
+            self.cascade.record()
+            return xyxy[confident], confidences[confident]
+        
+        start = time.perf_counter()
+        windows = self.cascade.windows(xyxy[uncertain], frame_data.frame.shape)
+        crops = [frame_data.frame[y1:y2, x1:x2] for x1, y1, x2, y2 in windows]
+        kwargs = self._inference_kwargs()
+        kwargs.update(imgsz=self.cascade.crop_size, conf=self.confidence_threshold)
+        model_results = self.cascade_model(crops if len(crops) > 1 else crops[0], **kwargs)
+        
+        tier2_xyxy, tier2_confidences = [], []
+        for (x1, y1, _, _), model_result in zip(windows, model_results):
+            _, crop_xyxy, crop_confidences = self._select_person_boxes(model_result)
+            tier2_xyxy.append(crop_xyxy + np.array([x1, y1, x1, y1], dtype=crop_xyxy.dtype))
+            tier2_confidences.append(crop_confidences)
+        tier2_xyxy = np.concatenate(tier2_xyxy)
+        tier2_confidences = np.concatenate(tier2_confidences)
+        _, tier2_xyxy, tier2_confidences = self._drop_masked(frame_data, np.arange(len(tier2_xyxy)),
+                                                             tier2_xyxy, tier2_confidences)
+        
+        merged = self.cascade.merge(xyxy[confident], confidences[confident], tier2_xyxy, tier2_confidences,
+                                    self.max_detections)
+        self.cascade.record(uncertain_boxes=int(uncertain.sum()), crops=len(windows),
+                            tier2_boxes=len(tier2_xyxy), tier2_seconds=time.perf_counter() - start)
+        return merged
+    
+    def _select_person_boxes(self, result: Any,
+                             min_confidence: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Filter YOLO boxes to confident persons and keep the top-k by confidence.
+        
+        The whole box tensor is copied to host memory once and filtered with
+        array operations instead of per-box tensor round-trips.
+        
+        Args:
+            result: YOLO detection result
+            min_confidence: Confidence cut (defaults to the detection threshold)
+            
+        Returns:
+            Tuple of (original box indices, xyxy boxes, confidences), highest confidence first
+        """
+        boxes = result.boxes
+        if boxes is None or len(boxes) == 0:
+            return np.empty(0, dtype=np.int64), np.empty((0, 4), dtype=np.float32), np.empty(0, dtype=np.float32)
+        
+        # Rows are [x1, y1, x2, y2, (track_id,) confidence, class]
+        data = _to_numpy(boxes.data)
+        confidences = data[:, -2]
+        class_ids = data[:, -1]
+        
+        # Filter for person class and confidence threshold
+        if min_confidence is None:
+            min_confidence = self.confidence_threshold
+        indices = np.flatnonzero((class_ids == self.PERSON_CLASS_ID) & (confidences >= min_confidence))
+        
+        # Limit number of detections, keeping the most confident
+        if len(indices) > self.max_detections:
+            indices = indices[np.argpartition(-confidences[indices], self.max_detections - 1)[:self.max_detections]]
+        indices = indices[np.argsort(-confidences[indices], kind='stable')]
+        
+        return indices, data[indices, :4], confidences[indices]
+    
+    def _build_detections(self, indices: np.ndarray, xyxy: np.ndarray, confidences: np.ndarray,
+                          frame_data: FrameData) -> List[Detection]:
+        """
+        Create Detection objects from selected boxes.
+        
+        Args:
+            indices: Original YOLO box index of each box (used in object ids)
+            xyxy: Boxes as (x1, y1, x2, y2) in frame pixels
+            confidences: Confidence of each box
+            frame_data: Frame the boxes were detected in
+            
+        Returns:
+            List[Detection]: Person detections in camera pixel coordinates
+        """
+        if len(indices) == 0:
+            return []
+        
+        # Bounding box coordinates in camera pixels (x, y, width, height)
+        xyxy = xyxy / frame_data.frame_scale
+        boxes = np.column_stack([xyxy[:, :2], xyxy[:, 2:] - xyxy[:, :2]]).astype(np.int64).tolist()
+        
+        return [
+            Detection(
+                object_id=f"person_{frame_data.camera_id}_{frame_data.frame_id}_{index}",
+                object_type="person",
+                confidence=confidence,
+                bounding_box=BoundingBox(x=x, y=y, width=width, height=height),
+                spatial_coordinates=None,  # Will be calculated later by CoordinateCalculator
+                camera_id=frame_data.camera_id
+            )
+            for index, confidence, (x, y, width, height)
+            in zip(indices.tolist(), confidences.tolist(), boxes)
+        ]
+    
     def get_detection_stats(self) -> Dict[str, Any]:
         """
         Get detection performance statistics.
@@ -269,7 +1223,28 @@ class PersonDetector:
                 'confidence_threshold': self.confidence_threshold,
                 'max_detections': self.max_detections,
                 'model_path': self.model_path,
+                'inference_backend': self.backend.name if self.backend else None,
+                'model_precision': self.backend.precision if self.backend else None,
+                'model_ready': self.ready_event.is_set(),
+                'load_seconds': self.load_seconds,
+                'warmup_seconds': self.warmup_seconds,
                 'last_detection_time': self.last_detection_time,
+                'motion_gate': self.motion_gate.get_stats() if self.motion_gate else None,
+                'batch_size': self.batch_size,
+                'batch_timeout_ms': self.batch_timeout * 1000.0,
+                'batch_count': self.batch_count,
+                'preprocessing': self.preprocessor.get_stats() if self.preprocessor else None,
+                'inference_image_size': self.image_size,
+                'adaptive_resolution': self.resolution_controller.get_stats() if self.resolution_controller else None,
+                'roi_detection': self.roi_scheduler.get_stats() if self.roi_scheduler else None,
+                'tracker': self.tracker.get_stats() if self.tracker else None,
+                'detection_interval': self.detection_interval.get_stats() if self.detection_interval else None,
+                'cascade': self.cascade.get_stats() if self.cascade else None,
+                'stale_frames': self.frame_deadline.get_stats() if self.frame_deadline else None,
+                'roi_masks': {camera_id: roi_mask.get_stats()
+                              for camera_id, roi_mask in self.roi_masks.items()} or None,
+                'model_swap': self.model_swap.get_stats(),
+                **self._latency_stats(),
                 'queue_sizes': {
                     'input_queue': self.frame_queue.qsize(),
                     'output_queue': self.detection_queue.qsize()
@@ -305,7 +1280,8 @@ class PersonDetector:
                 'model_loaded': True,
                 'model_path': self.model_path,
                 'model_type': str(type(self.model)),
-                'input_size': getattr(self.model, 'imgsz', 'Unknown'),
+                'backend': self.backend.get_info() if self.backend else None,
+                'input_size': self.image_size,
                 'classes': getattr(self.model, 'names', {}),
                 'person_class_id': self.PERSON_CLASS_ID
             }
@@ -0,0 +1,193 @@
+"""
+LetterboxPreprocessor - Detector-owned model input preparation
+Letterboxes frames into reused buffers and maps model boxes back to frame pixels
+"""
+
+from dataclasses import dataclass
+from typing import List, Tuple, Dict, Any
+import cv2
+import numpy as np
+
+
+PAD_VALUE = 114  # ultralytics letterbox grey
+
+
+def fit_to_input_size(height: int, width: int, input_size: int) -> Tuple[int, int]:
+    """
+    Size of a frame downscaled so its longest side fits the model input.
+
+    Args:
+        height: Frame height in pixels
+        width: Frame width in pixels
+        input_size: Square model input size in pixels
+
+    Returns:
+        Tuple of (height, width); unchanged if the frame already fits
+    """
+    scale = input_size / max(height, width)
+    if scale >= 1.0:
+        return height, width
+    return max(1, int(round(height * scale))), max(1, int(round(width * scale)))
+
+
+@dataclass(frozen=True)
+class LetterboxGeometry:
+    """Placement of a frame inside the square model input"""
+    scale: float        # input pixels per frame pixel
+    left: int
+    top: int
+    width: int          # size of the resized frame inside the input
+    height: int
+    frame_width: int
+    frame_height: int
+
+    def boxes_to_frame(self, xyxy: np.ndarray) -> np.ndarray:
+        """
+        Map boxes from model input pixels back to frame pixels.
+
+        Args:
+            xyxy: (n, 4) boxes as x1, y1, x2, y2 in model input pixels
+
+        Returns:
+            np.ndarray: (n, 4) boxes in frame pixels, clipped to the frame
+        """
+        boxes = (xyxy - np.array([self.left, self.top, self.left, self.top], dtype=xyxy.dtype)) / self.scale
+        np.clip(boxes[:, 0::2], 0, self.frame_width, out=boxes[:, 0::2])
+        np.clip(boxes[:, 1::2], 0, self.frame_height, out=boxes[:, 1::2])
+        return boxes
+
+
+class LetterboxPreprocessor:
+    """
+    Builds (batch, 3, size, size) float32 RGB model inputs in [0, 1] the way
+    the ultralytics predictor does, but into canvas and tensor buffers that
+    are allocated once per input size and reused on every call. Padding is
+    repainted only when a batch slot's letterbox geometry changes.
+
+    Returned tensors are views into the shared buffers. With one buffer set
+    they stay valid until the next prepare() call; with n sets, calls rotate
+    through the sets, so a tensor stays valid for the next n - 1 calls
+    (enough for frames queued between pipeline stages).
+    """
+
+    def __init__(self, max_batch_size: int = 1, buffer_sets: int = 1):
+        """
+        Initialize the preprocessor. Buffers are allocated on first use per input size.
+
+        Args:
+            max_batch_size: Frames per call the buffers are sized for (grown if exceeded)
+            buffer_sets: Independent buffer sets that prepare() calls rotate through
+        """
+        self.max_batch_size = max(1, max_batch_size)
+        self.buffer_sets = max(1, buffer_sets)
+        self.next_set = 0
+
+        # Keyed by (input size, buffer set)
+        self.canvases: Dict[Tuple[int, int], np.ndarray] = {}   # (batch, size, size, 3) uint8 BGR
+        self.tensors: Dict[Tuple[int, int], np.ndarray] = {}    # (batch, 3, size, size) float32 RGB
+        self.painted: Dict[Tuple[int, int, int], LetterboxGeometry] = {}     # (size, set, slot) -> geometry
+        self.geometries: Dict[Tuple[int, int, int], LetterboxGeometry] = {}
+
+        # Statistics
+        self.frames_prepared = 0
+        self.buffers_allocated = 0
+        self.padding_repaints = 0
+
+    def geometry(self, frame_shape: Tuple[int, ...], input_size: int) -> LetterboxGeometry:
+        """
+        Letterbox placement of a frame shape, matching ultralytics rounding.
+
+        Args:
+            frame_shape: Shape of the frame
+            input_size: Square model input size in pixels
+
+        Returns:
+            LetterboxGeometry: Scale and offsets of the frame inside the input
+        """
+        frame_height, frame_width = frame_shape[:2]
+        key = (frame_height, frame_width, input_size)
+        geometry = self.geometries.get(key)
+        if geometry is None:
+            scale = min(input_size / frame_height, input_size / frame_width)
+            width, height = int(round(frame_width * scale)), int(round(frame_height * scale))
+            geometry = LetterboxGeometry(
+                scale=scale,
+                left=int(round((input_size - width) / 2 - 0.1)),
+                top=int(round((input_size - height) / 2 - 0.1)),
+                width=width,
+                height=height,
+                frame_width=frame_width,
+                frame_height=frame_height
+            )
+            self.geometries[key] = geometry
+        return geometry
+
+    def prepare(self, frames: List[np.ndarray], input_size: int) -> Tuple[np.ndarray, List[LetterboxGeometry]]:
+        """
+        Letterbox BGR frames into the model input tensor.
+
+        Args:
+            frames: BGR frames (or crops) of any size
+            input_size: Square model input size in pixels
+
+        Returns:
+            Tuple of ((len(frames), 3, size, size) float32 view into the reused
+            tensor buffer, letterbox geometry of each frame)
+        """
+        buffer_set = self.next_set
+        self.next_set = (self.next_set + 1) % self.buffer_sets
+        canvas, tensor = self._buffers(input_size, buffer_set, len(frames))
+        geometries = []
+        for slot, frame in enumerate(frames):
+            geometry = self.geometry(frame.shape, input_size)
+            target = canvas[slot]
+            if self.painted.get((input_size, buffer_set, slot)) != geometry:
+                target[...] = PAD_VALUE
+                self.painted[(input_size, buffer_set, slot)] = geometry
+                self.padding_repaints += 1
+
+            # Resize straight into the canvas; frames already at input scale are just copied
+            region = target[geometry.top:geometry.top + geometry.height, geometry.left:geometry.left + geometry.width]
+            if frame.shape[:2] == region.shape[:2]:
+                np.copyto(region, frame)
+            else:
+                cv2.resize(frame, (geometry.width, geometry.height), dst=region, interpolation=cv2.INTER_LINEAR)
+            geometries.append(geometry)
+
+        # BGR HWC uint8 -> RGB CHW float32 in [0, 1], written straight into the tensor buffer
+        batch = len(frames)
+        np.multiply(canvas[:batch, :, :, ::-1].transpose(0, 3, 1, 2), np.float32(1.0 / 255.0), out=tensor[:batch])
+        self.frames_prepared += batch
+        return tensor[:batch], geometries
+
+    def _buffers(self, input_size: int, buffer_set: int, batch: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the canvas and tensor buffers of a set for an input size, allocating or growing them."""
+        key = (input_size, buffer_set)
+        canvas = self.canvases.get(key)
+        if canvas is None or len(canvas) < batch:
+            self.max_batch_size = max(self.max_batch_size, batch)
+            canvas = np.empty((self.max_batch_size, input_size, input_size, 3), dtype=np.uint8)
+            self.canvases[key] = canvas
+            self.tensors[key] = np.empty((self.max_batch_size, 3, input_size, input_size), dtype=np.float32)
+            self.painted = {painted_key: geometry for painted_key, geometry in self.painted.items()
+                            if painted_key[:2] != key}
+            self.buffers_allocated += 1
+        return canvas, self.tensors[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get preprocessing statistics.
+
+        Returns:
+            dict: Frames prepared, buffer allocations, padding repaints and buffer memory
+        """
+        buffer_bytes = sum(buffer.nbytes for buffer in self.canvases.values())
+        buffer_bytes += sum(buffer.nbytes for buffer in self.tensors.values())
+        return {
+            'frames_prepared': self.frames_prepared,
+            'buffers_allocated': self.buffers_allocated,
+            'padding_repaints': self.padding_repaints,
+            'input_sizes': sorted({input_size for input_size, _ in self.canvases}),
+            'buffer_sets': self.buffer_sets,
+            'buffer_mb': buffer_bytes / (1024 * 1024)
+        }
@@ -0,0 +1,162 @@
+"""
+INT8 calibration and quantization helpers for the exported person model
+Builds calibration sets from local recordings and quantizes ONNX models statically
+"""
+
+import os
+import logging
+from typing import List, Optional
+import cv2
+import numpy as np
+
+from .replay_source import ReplaySource, PACKED_INDEX_FILE
+
+try:
+    from onnxruntime.quantization import CalibrationDataReader, QuantFormat, QuantType, quantize_static
+    import onnxruntime
+except ImportError:
+    onnxruntime = None
+    CalibrationDataReader = object
+
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+
+def load_calibration_frames(source: str, num_frames: int = 200) -> List[np.ndarray]:
+    """
+    Sample frames evenly from a local recording for INT8 calibration.
+
+    Args:
+        source: Packed recording directory, directory of images, or video file
+        num_frames: Number of frames to sample
+
+    Returns:
+        List[np.ndarray]: BGR frames
+    """
+    if os.path.isdir(source) and not os.path.exists(os.path.join(source, PACKED_INDEX_FILE)):
+        paths = sorted(os.path.join(source, name) for name in os.listdir(source)
+                       if name.lower().endswith(IMAGE_EXTENSIONS))
+        stride = max(1, len(paths) // num_frames)
+        frames = [cv2.imread(path) for path in paths[::stride][:num_frames]]
+        return [frame for frame in frames if frame is not None]
+
+    replay = ReplaySource(source)
+    if not replay.open():
+        raise IOError(f"Failed to open calibration source: {source}")
+    try:
+        if replay.is_packed:
+            total = len(replay.timestamps)
+        else:
+            total = int(replay.capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        stride = max(1, total // num_frames) if total > 0 else 1
+
+        frames = []
+        index = 0
+        while len(frames) < num_frames:
+            item = replay.read()
+            if item is None:
+                break
+            if index % stride == 0:
+                frames.append(np.array(item[0]))  # copy out of the memory map
+            index += 1
+        return frames
+    finally:
+        replay.close()
+
+
+def letterbox(frame: np.ndarray, image_size: int) -> np.ndarray:
+    """
+    Resize a frame to fit a square model input, padding with grey like ultralytics.
+
+    Args:
+        frame: BGR frame
+        image_size: Square model input size in pixels
+
+    Returns:
+        np.ndarray: (image_size, image_size, 3) BGR image
+    """
+    height, width = frame.shape[:2]
+    scale = min(image_size / height, image_size / width)
+    new_width, new_height = int(round(width * scale)), int(round(height * scale))
+    resized = cv2.resize(frame, (new_width, new_height), interpolation=cv2.INTER_LINEAR)
+
+    canvas = np.full((image_size, image_size, 3), 114, dtype=np.uint8)
+    top, left = (image_size - new_height) // 2, (image_size - new_width) // 2
+    canvas[top:top + new_height, left:left + new_width] = resized
+    return canvas
+
+
+def write_calibration_dataset(frames: List[np.ndarray], directory: str) -> str:
+    """
+    Write frames as an unlabeled YOLO dataset, the calibration input ultralytics expects.
+
+    Args:
+        frames: BGR calibration frames
+        directory: Output directory (created if missing)
+
+    Returns:
+        str: Path of the dataset YAML file
+    """
+    image_dir = os.path.join(directory, "images")
+    label_dir = os.path.join(directory, "labels")
+    os.makedirs(image_dir, exist_ok=True)
+    os.makedirs(label_dir, exist_ok=True)
+
+    for index, frame in enumerate(frames):
+        cv2.imwrite(os.path.join(image_dir, f"{index:05d}.jpg"), frame)
+        # Empty label files: frames count as background, which is all calibration needs
+        open(os.path.join(label_dir, f"{index:05d}.txt"), 'w').close()
+
+    yaml_path = os.path.join(directory, "data.yaml")
+    with open(yaml_path, 'w') as f:
+        f.write(f"path: {os.path.abspath(directory)}\ntrain: images\nval: images\nnames:\n  0: person\n")
+    return yaml_path
+
+
+class FrameCalibrationReader(CalibrationDataReader):
+    """Feeds letterboxed calibration frames to ONNX Runtime static quantization."""
+
+    def __init__(self, frames: List[np.ndarray], input_name: str, image_size: int):
+        self.input_name = input_name
+        self.image_size = image_size
+        self.frames = iter(frames)
+
+    def get_next(self) -> Optional[dict]:
+        frame = next(self.frames, None)
+        if frame is None:
+            return None
+        image = letterbox(frame, self.image_size)[:, :, ::-1].transpose(2, 0, 1)
+        tensor = np.ascontiguousarray(image, dtype=np.float32)[None] / 255.0
+        return {self.input_name: tensor}
+
+
+def quantize_onnx_model(fp32_path: str, int8_path: str, frames: List[np.ndarray], image_size: int) -> str:
+    """
+    Statically quantize an ONNX model to INT8 (QDQ, per-channel weights).
+
+    Args:
+        fp32_path: FP32 ONNX model
+        int8_path: Output path for the INT8 model
+        frames: Calibration frames
+        image_size: Model input size in pixels
+
+    Returns:
+        str: int8_path
+    """
+    if onnxruntime is None:
+        raise RuntimeError("onnxruntime is required for INT8 quantization")
+    if not frames:
+        raise ValueError("No calibration frames")
+
+    input_name = onnxruntime.InferenceSession(fp32_path, providers=['CPUExecutionProvider']).get_inputs()[0].name
+    logging.getLogger(__name__).info(f"Quantizing {fp32_path} to INT8 with {len(frames)} calibration frames")
+    quantize_static(
+        fp32_path,
+        int8_path,
+        FrameCalibrationReader(frames, input_name, image_size),
+        quant_format=QuantFormat.QDQ,
+        activation_type=QuantType.QUInt8,
+        weight_type=QuantType.QInt8,
+        per_channel=True
+    )
+    return int8_path
@@ -0,0 +1,246 @@
+"""
+ReplaySource - Recorded-video and packed-frame replay for CameraManager
+Reproduces a recorded scene with its original timestamps on any dev box
+"""
+
+import json
+import os
+import logging
+from typing import Optional, Tuple, Iterable, List, Dict, Any
+import cv2
+import numpy as np
+
+
+PACKED_FRAMES_FILE = "frames.raw"
+PACKED_INDEX_FILE = "index.json"
+
+
+def write_packed_recording(directory: str, frames: Iterable[Tuple[np.ndarray, float]]) -> int:
+    """
+    Write frames into a packed recording directory readable by ReplaySource.
+
+    The recording is a single raw file of back-to-back uint8 BGR frames plus
+    an index.json holding the frame shape and per-frame timestamps. Grayscale
+    frames are converted to BGR so replay always yields 3-channel frames.
+
+    Args:
+        directory: Output directory (created if missing)
+        frames: (BGR or grayscale frame, capture timestamp in seconds) pairs, all frames the same shape
+
+    Returns:
+        int: Number of frames written
+    """
+    os.makedirs(directory, exist_ok=True)
+    shape = None
+    written_timestamps: List[float] = []
+
+    with open(os.path.join(directory, PACKED_FRAMES_FILE), 'wb') as f:
+        for frame, timestamp in frames:
+            frame = np.ascontiguousarray(frame, dtype=np.uint8)
+            if frame.ndim == 2 or frame.shape[2] == 1:
+                frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+            if shape is None:
+                shape = frame.shape
+            elif frame.shape != shape:
+                raise ValueError(f"Frame shape {frame.shape} does not match recording shape {shape}")
+            f.write(frame.tobytes())
+            written_timestamps.append(float(timestamp))
+
+    if shape is None:
+        raise ValueError("No frames to write")
+
+    with open(os.path.join(directory, PACKED_INDEX_FILE), 'w') as f:
+        json.dump({
+            "height": shape[0],
+            "width": shape[1],
+            "channels": shape[2],
+            "timestamps": written_timestamps
+        }, f)
+
+    return len(written_timestamps)
+
+
+def pack_video(video_path: str, directory: str) -> int:
+    """
+    Convert a video file into a packed recording so replay skips decoding.
+
+    Args:
+        video_path: Source video file
+        directory: Output directory for the packed recording
+
+    Returns:
+        int: Number of frames written
+    """
+    capture = cv2.VideoCapture(video_path)
+    if not capture.isOpened():
+        raise IOError(f"Failed to open video file: {video_path}")
+
+    def frames_and_timestamps():
+        while True:
+            ret, frame = capture.read()
+            if not ret:
+                break
+            yield frame, capture.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+
+    try:
+        return write_packed_recording(directory, frames_and_timestamps())
+    finally:
+        capture.release()
+
+
+class ReplaySource:
+    """
+    Frame source that plays back a video file or a packed frame directory.
+    Packed frames are memory-mapped, so reading a frame is a zero-copy view.
+    """
+
+    def __init__(self, path: str, loop: bool = False):
+        """
+        Initialize the replay source.
+
+        Args:
+            path: Video file, or directory containing a packed recording
+            loop: Restart from the first frame when the recording ends
+        """
+        self.path = path
+        self.loop = loop
+
+        self.frames = None          # np.memmap for packed recordings
+        self.grayscale = False      # single-channel packed recording, expanded to BGR on read
+        self.timestamps: List[float] = []
+        self.capture = None         # cv2.VideoCapture for video files
+
+        self.position = 0
+        self.loop_count = 0
+        self.loop_offset = 0.0
+        self.last_timestamp = 0.0
+        self.frames_read = 0
+        self.finished = False
+
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def is_packed(self) -> bool:
+        return self.frames is not None
+
+    def open(self) -> bool:
+        """
+        Open the recording.
+
+        Returns:
+            bool: True if the recording was opened successfully
+        """
+        try:
+            if os.path.isdir(self.path):
+                with open(os.path.join(self.path, PACKED_INDEX_FILE), 'r') as f:
+                    index = json.load(f)
+                channels = index["channels"]
+                if channels not in (1, 3):
+                    self.logger.error(f"Unsupported packed recording {self.path}: {channels} channels")
+                    return False
+                self.grayscale = channels == 1
+                shape = (index["height"], index["width"]) if self.grayscale else \
+                    (index["height"], index["width"], channels)
+                self.timestamps = index["timestamps"]
+                self.frames = np.memmap(os.path.join(self.path, PACKED_FRAMES_FILE), dtype=np.uint8,
+                                        mode='r', shape=(len(self.timestamps),) + shape)
+                self.logger.info(f"Replaying packed recording {self.path}: {len(self.timestamps)} frames "
+                                 f"at {shape[1]}x{shape[0]}"
+                                 f"{' (grayscale, converted to BGR on read)' if self.grayscale else ''}")
+            else:
+                self.capture = cv2.VideoCapture(self.path)
+                if not self.capture.isOpened():
+                    self.logger.error(f"Failed to open replay video: {self.path}")
+                    return False
+                self.logger.info(f"Replaying video file {self.path}")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to open replay source {self.path}: {e}")
+            return False
+
+    def read(self, out: Optional[np.ndarray] = None) -> Optional[Tuple[np.ndarray, float]]:
+        """
+        Read the next frame and its recorded timestamp.
+
+        Args:
+            out: Optional buffer for video decoding or grayscale expansion; ignored
+                for BGR packed recordings
+
+        Returns:
+            Tuple of (frame, timestamp in seconds), or None at end of recording
+        """
+        if self.finished:
+            return None
+
+        if self.is_packed:
+            if self.position >= len(self.timestamps) and not self._rewind():
+                return None
+            frame = self.frames[self.position]
+            if self.grayscale:
+                frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR, dst=out) if out is not None else \
+                    cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+            timestamp = self.timestamps[self.position]
+        else:
+            ret, frame = self.capture.read(image=out) if out is not None else self.capture.read()
+            if not ret:
+                if not self._rewind():
+                    return None
+                ret, frame = self.capture.read(image=out) if out is not None else self.capture.read()
+                if not ret:
+                    self.finished = True
+                    return None
+            timestamp = self.capture.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+
+        self.position += 1
+        self.frames_read += 1
+        self.last_timestamp = timestamp + self.loop_offset
+        return frame, self.last_timestamp
+
+    def _rewind(self) -> bool:
+        """Restart the recording if looping, keeping timestamps monotonic."""
+        if not self.loop or self.position == 0:
+            self.finished = True
+            return False
+
+        # Continue the timeline one average frame interval after the last frame
+        frame_interval = 0.0
+        first_timestamp = 0.0
+        if self.is_packed:
+            first_timestamp = self.timestamps[0]
+            if len(self.timestamps) > 1:
+                frame_interval = (self.timestamps[-1] - self.timestamps[0]) / (len(self.timestamps) - 1)
+        elif self.capture is not None:
+            fps = self.capture.get(cv2.CAP_PROP_FPS)
+            frame_interval = 1.0 / fps if fps > 0 else 0.0
+        self.loop_offset = self.last_timestamp + frame_interval - first_timestamp
+
+        if self.capture is not None:
+            self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        self.position = 0
+        self.loop_count += 1
+        return True
+
+    def close(self):
+        """Release the recording."""
+        if self.capture is not None:
+            self.capture.release()
+            self.capture = None
+        self.frames = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get replay progress.
+
+        Returns:
+            dict: Source path, position and loop counters
+        """
+        return {
+            'path': self.path,
+            'packed': self.is_packed,
+            'frame_count': len(self.timestamps) if self.is_packed else None,
+            'position': self.position,
+            'frames_read': self.frames_read,
+            'loop_count': self.loop_count,
+            'finished': self.finished
+        }
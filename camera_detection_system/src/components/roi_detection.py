@@ -0,0 +1,149 @@
+"""
+RoiScheduler - Track-guided region-of-interest detection planning
+Decides between full-frame passes and native-resolution crops around predicted tracks
+"""
+
+import threading
+from typing import List, Tuple, Dict, Any, Optional
+import cv2
+import numpy as np
+
+
+CropWindow = Tuple[int, int, int, int]  # x1, y1, x2, y2 in frame pixels
+
+
+def merge_duplicate_boxes(xyxy: np.ndarray, confidences: np.ndarray, iou_threshold: float = 0.5) -> np.ndarray:
+    """
+    Suppress duplicate boxes, e.g. the same person seen in two overlapping crops.
+
+    Args:
+        xyxy: (n, 4) boxes as x1, y1, x2, y2
+        confidences: (n,) box confidences
+        iou_threshold: Overlap above which the less confident box is dropped
+
+    Returns:
+        np.ndarray: Indices of the boxes to keep, highest confidence first
+    """
+    if len(xyxy) == 0:
+        return np.empty(0, dtype=np.int64)
+    xywh = np.column_stack([xyxy[:, :2], xyxy[:, 2:] - xyxy[:, :2]])
+    keep = cv2.dnn.NMSBoxes(xywh.tolist(), confidences.tolist(), 0.0, iou_threshold)
+    keep = np.asarray(keep, dtype=np.int64).reshape(-1)
+    return keep[np.argsort(-confidences[keep], kind='stable')]
+
+
+def crop_windows(boxes: List[np.ndarray], width: int, height: int, crop_size: int,
+                 margin: float) -> List[CropWindow]:
+    """
+    Square windows of at least crop_size around boxes, skipping boxes an earlier window already covers.
+
+    Args:
+        boxes: Boxes (x1, y1, x2, y2) in frame pixels
+        width: Frame width in pixels
+        height: Frame height in pixels
+        crop_size: Minimum window side in pixels
+        margin: Context added around each box, as a fraction of its size
+
+    Returns:
+        List of windows (x1, y1, x2, y2) inside the frame
+    """
+    windows: List[CropWindow] = []
+    for x1, y1, x2, y2 in boxes:
+        x1, y1 = max(0.0, x1), max(0.0, y1)
+        x2, y2 = min(float(width), x2), min(float(height), y2)
+        if x2 <= x1 or y2 <= y1:
+            continue  # off-frame
+        if any(wx1 <= x1 and wy1 <= y1 and x2 <= wx2 and y2 <= wy2 for wx1, wy1, wx2, wy2 in windows):
+            continue
+
+        side = int(max(crop_size, (x2 - x1) * (1 + margin), (y2 - y1) * (1 + margin)))
+        crop_width, crop_height = min(side, width), min(side, height)
+        left = int(np.clip((x1 + x2 - crop_width) / 2, 0, width - crop_width))
+        top = int(np.clip((y1 + y2 - crop_height) / 2, 0, height - crop_height))
+        windows.append((left, top, left + crop_width, top + crop_height))
+    return windows
+
+
+class RoiScheduler:
+    """
+    Per camera, schedules a downscaled full-frame pass every full_frame_interval
+    frames and, in between, native-resolution crops around the predicted
+    positions of existing tracks. Falls back to a full pass when there is
+    nothing to track or the crops would cover most of the frame anyway.
+    """
+
+    def __init__(self,
+                 full_frame_interval: int = 10,
+                 crop_size: int = 320,
+                 margin: float = 0.5,
+                 max_crop_coverage: float = 0.6):
+        """
+        Initialize the scheduler.
+
+        Args:
+            full_frame_interval: Frames between full-frame passes per camera
+            crop_size: Minimum crop side in frame pixels (also the model input size for crops)
+            margin: Context added around each predicted box, as a fraction of its size
+            max_crop_coverage: Crop area, as a fraction of the frame, above which a full pass is cheaper
+        """
+        self.full_frame_interval = max(1, full_frame_interval)
+        self.crop_size = crop_size
+        self.margin = margin
+        self.max_crop_coverage = max_crop_coverage
+
+        self.frames_since_full: Dict[str, int] = {}
+
+        # Statistics
+        self.full_passes = 0
+        self.roi_passes = 0
+        self.crops_run = 0
+        self.crop_pixel_fraction_sum = 0.0
+
+        self.lock = threading.Lock()
+
+    def plan(self, camera_id: str, frame_shape: Tuple[int, ...],
+             predicted_boxes: List[np.ndarray]) -> Optional[List[CropWindow]]:
+        """
+        Decide how to detect in the next frame of a camera.
+
+        Args:
+            camera_id: Camera the frame came from
+            frame_shape: Shape of the frame to detect in
+            predicted_boxes: Predicted track boxes (x1, y1, x2, y2) in frame pixels
+
+        Returns:
+            List of crop windows, or None for a full-frame pass
+        """
+        height, width = frame_shape[:2]
+        with self.lock:
+            since_full = self.frames_since_full.get(camera_id, self.full_frame_interval)
+            windows = crop_windows(predicted_boxes, width, height, self.crop_size, self.margin)
+            coverage = sum((x2 - x1) * (y2 - y1) for x1, y1, x2, y2 in windows) / float(width * height)
+
+            if since_full >= self.full_frame_interval or not windows or coverage > self.max_crop_coverage:
+                self.frames_since_full[camera_id] = 1
+                self.full_passes += 1
+                return None
+
+            self.frames_since_full[camera_id] = since_full + 1
+            self.roi_passes += 1
+            self.crops_run += len(windows)
+            self.crop_pixel_fraction_sum += coverage
+            return windows
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scheduling statistics.
+
+        Returns:
+            dict: Full and ROI pass counts, crops per ROI pass and frame coverage
+        """
+        with self.lock:
+            return {
+                'full_frame_interval': self.full_frame_interval,
+                'crop_size': self.crop_size,
+                'full_passes': self.full_passes,
+                'roi_passes': self.roi_passes,
+                'crops_per_roi_pass': self.crops_run / self.roi_passes if self.roi_passes else 0.0,
+                'mean_crop_coverage': self.crop_pixel_fraction_sum / self.roi_passes if self.roi_passes else 0.0
+            }
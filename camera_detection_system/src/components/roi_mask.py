@@ -0,0 +1,184 @@
+"""
+RoiMask - Static per-camera region-of-interest masks
+Restricts inference to the part of the frame where people can appear and drops boxes outside it
+"""
+
+import math
+import threading
+from typing import List, Tuple, Dict, Any, Optional
+import cv2
+import numpy as np
+
+from .roi_detection import CropWindow
+from models.config import CameraConfig
+
+
+MODEL_STRIDE = 32  # YOLO input sizes are multiples of the largest stride
+
+Polygon = List[List[float]]  # [x, y] vertices in camera pixels
+
+
+class RoiMask:
+    """
+    Mask built from include and exclude polygons in camera pixels: the active
+    region is the union of the include polygons (the whole frame if there are
+    none) minus the exclude polygons. Frames are cropped to the bounding
+    rectangle of the active region before inference, and boxes whose centre
+    (the point CoordinateCalculator projects) falls outside it are dropped.
+
+    Frames may arrive smaller than the camera resolution (decode-time or
+    capture downscaling); the mask is mapped onto each frame's shape.
+    """
+
+    def __init__(self, width: int, height: int,
+                 include: Optional[List[Polygon]] = None,
+                 exclude: Optional[List[Polygon]] = None):
+        """
+        Rasterize the mask.
+
+        Args:
+            width: Camera frame width in pixels
+            height: Camera frame height in pixels
+            include: Polygons where people can appear, None = whole frame
+            exclude: Polygons removed from the included area
+
+        Raises:
+            ValueError: If the polygons leave no active area
+        """
+        self.width = width
+        self.height = height
+
+        if include:
+            self.mask = np.zeros((height, width), dtype=np.uint8)
+            cv2.fillPoly(self.mask, [self._points(polygon) for polygon in include], 255)
+        else:
+            self.mask = np.full((height, width), 255, dtype=np.uint8)
+        if exclude:
+            cv2.fillPoly(self.mask, [self._points(polygon) for polygon in exclude], 0)
+
+        active = cv2.findNonZero(self.mask)
+        if active is None:
+            raise ValueError("ROI mask polygons leave no active area")
+        x, y, w, h = cv2.boundingRect(active)
+        self.bounds: CropWindow = (x, y, x + w, y + h)
+        self.active_fraction = cv2.countNonZero(self.mask) / float(width * height)
+        self.crop_fraction = w * h / float(width * height)
+
+        # Statistics
+        self.frames = 0
+        self.frame_pixels = 0
+        self.inference_pixels = 0
+        self.boxes_checked = 0
+        self.boxes_dropped = 0
+
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _points(polygon: Polygon) -> np.ndarray:
+        """Polygon vertices as the int32 point array cv2.fillPoly expects."""
+        return np.round(np.asarray(polygon, dtype=np.float64)).astype(np.int32).reshape(-1, 1, 2)
+
+    @classmethod
+    def from_camera_config(cls, camera_config: CameraConfig) -> Optional['RoiMask']:
+        """
+        Build the mask of a camera.
+
+        Args:
+            camera_config: Camera configuration with roi_include / roi_exclude polygons
+
+        Returns:
+            RoiMask, or None if the camera has no polygons
+        """
+        if not camera_config.roi_include and not camera_config.roi_exclude:
+            return None
+        return cls(camera_config.width, camera_config.height, camera_config.roi_include, camera_config.roi_exclude)
+
+    def crop_window(self, frame_shape: Tuple[int, ...]) -> CropWindow:
+        """
+        Bounding rectangle of the active region in a frame's pixels.
+
+        Args:
+            frame_shape: Shape of the frame
+
+        Returns:
+            Window (x1, y1, x2, y2) inside the frame
+        """
+        frame_height, frame_width = frame_shape[:2]
+        scale_x, scale_y = frame_width / self.width, frame_height / self.height
+        x1, y1, x2, y2 = self.bounds
+        return (int(x1 * scale_x), int(y1 * scale_y),
+                min(frame_width, math.ceil(x2 * scale_x)), min(frame_height, math.ceil(y2 * scale_y)))
+
+    def crop(self, frame: np.ndarray) -> Tuple[np.ndarray, Tuple[int, int]]:
+        """
+        Crop a frame to the active region, counting the pixels saved.
+
+        Args:
+            frame: Full frame
+
+        Returns:
+            Tuple of (view of the crop, (x, y) origin of the crop in the frame)
+        """
+        x1, y1, x2, y2 = self.crop_window(frame.shape)
+        with self.lock:
+            self.frames += 1
+            self.frame_pixels += frame.shape[0] * frame.shape[1]
+            self.inference_pixels += (x2 - x1) * (y2 - y1)
+        return frame[y1:y2, x1:x2], (x1, y1)
+
+    def input_size(self, image_size: int, frame_shape: Tuple[int, ...]) -> int:
+        """
+        Model input size for the crop that keeps the full-frame pixel scale.
+
+        Args:
+            image_size: Input size the full frame would be detected at
+            frame_shape: Shape of the full frame
+
+        Returns:
+            int: Input size for the crop, rounded up to the model stride
+        """
+        x1, y1, x2, y2 = self.crop_window(frame_shape)
+        fraction = max(x2 - x1, y2 - y1) / max(frame_shape[:2])
+        return min(image_size, max(MODEL_STRIDE, math.ceil(image_size * fraction / MODEL_STRIDE) * MODEL_STRIDE))
+
+    def contains(self, xyxy: np.ndarray, frame_shape: Tuple[int, ...]) -> np.ndarray:
+        """
+        Which boxes have their centre inside the active region.
+
+        Args:
+            xyxy: (n, 4) boxes as x1, y1, x2, y2 in frame pixels
+            frame_shape: Shape of the frame the boxes are in
+
+        Returns:
+            np.ndarray: (n,) bool mask of boxes to keep
+        """
+        frame_height, frame_width = frame_shape[:2]
+        centre_x = ((xyxy[:, 0] + xyxy[:, 2]) / 2 * (self.width / frame_width)).astype(np.int64)
+        centre_y = ((xyxy[:, 1] + xyxy[:, 3]) / 2 * (self.height / frame_height)).astype(np.int64)
+        np.clip(centre_x, 0, self.width - 1, out=centre_x)
+        np.clip(centre_y, 0, self.height - 1, out=centre_y)
+        keep = self.mask[centre_y, centre_x] > 0
+
+        with self.lock:
+            self.boxes_checked += len(keep)
+            self.boxes_dropped += int(len(keep) - np.count_nonzero(keep))
+        return keep
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get mask statistics.
+
+        Returns:
+            dict: Active and cropped area, pixels per inference and boxes dropped
+        """
+        with self.lock:
+            return {
+                'active_fraction': self.active_fraction,
+                'crop_fraction': self.crop_fraction,
+                'bounds': self.bounds,
+                'frames': self.frames,
+                'pixels_per_inference': self.inference_pixels / self.frames if self.frames else 0.0,
+                'pixel_reduction': 1.0 - self.inference_pixels / self.frame_pixels if self.frame_pixels else 0.0,
+                'boxes_checked': self.boxes_checked,
+                'boxes_dropped': self.boxes_dropped
+            }
@@ -0,0 +1,133 @@
+"""
+SyntheticScene - Scripted mock camera scene
+Generates people moving along looping trajectories with ground-truth boxes
+"""
+
+import logging
+from typing import List, Optional, Tuple
+import cv2
+import numpy as np
+
+from models.config import SyntheticSceneConfig
+from models.telemetry import BoundingBox
+
+
+class SyntheticScene:
+    """
+    Mock frame source with motion continuity and a known crowd size.
+    Every person follows a closed trajectory that repeats each cycle, so the
+    box positions of the whole cycle are computed once up front. Only one
+    static background is kept in memory; each frame is composited from it
+    and the person sprites on demand, into a caller-supplied buffer when one
+    is given.
+    """
+
+    def __init__(self, scene_config: SyntheticSceneConfig, width: int, height: int):
+        """
+        Initialize the scene, render the background and plan one full cycle.
+
+        Args:
+            scene_config: Crowd size, trajectories and cycle length
+            width: Frame width in pixels
+            height: Frame height in pixels
+        """
+        self.config = scene_config
+        self.width = width
+        self.height = height
+        self.cycle_frames = max(1, scene_config.cycle_frames)
+        self.position = 0
+
+        self.logger = logging.getLogger(__name__)
+
+        self.trajectories = self._build_trajectories()
+        self.background = self._render_background()
+        self.ground_truth = self._plan_cycle()
+
+        self.logger.info(f"Synthetic scene ready: {len(self.trajectories)} people, "
+                         f"{self.cycle_frames}-frame cycle at {width}x{height}")
+
+    def _build_trajectories(self) -> List[np.ndarray]:
+        """Return one closed waypoint loop (top-left box corners) per person."""
+        max_x = max(0, self.width - self.config.person_width)
+        max_y = max(0, self.height - self.config.person_height)
+
+        trajectories = []
+        if self.config.trajectories:
+            for waypoints in self.config.trajectories:
+                points = np.clip(np.array(waypoints, dtype=np.float64), [0, 0], [max_x, max_y])
+                trajectories.append(points)
+            return trajectories
+
+        # Random walkers pacing back and forth between two points
+        rng = np.random.default_rng(self.config.seed)
+        for _ in range(self.config.num_people):
+            start = rng.uniform([0, 0], [max_x, max_y])
+            end = rng.uniform([0, 0], [max_x, max_y])
+            trajectories.append(np.array([start, end]))
+        return trajectories
+
+    def _position_at(self, waypoints: np.ndarray, phase: float) -> Tuple[float, float]:
+        """Interpolate along a closed waypoint loop at phase in [0, 1)."""
+        if len(waypoints) == 1:
+            return tuple(waypoints[0])
+
+        loop = np.vstack([waypoints, waypoints[:1]])
+        segment_lengths = np.linalg.norm(np.diff(loop, axis=0), axis=1)
+        total_length = segment_lengths.sum()
+        if total_length == 0:
+            return tuple(waypoints[0])
+
+        distance = phase * total_length
+        cumulative = np.concatenate([[0.0], np.cumsum(segment_lengths)])
+        segment = min(int(np.searchsorted(cumulative, distance, side='right')) - 1, len(segment_lengths) - 1)
+        t = (distance - cumulative[segment]) / segment_lengths[segment] if segment_lengths[segment] > 0 else 0.0
+        point = loop[segment] + t * (loop[segment + 1] - loop[segment])
+        return float(point[0]), float(point[1])
+
+    def _render_background(self) -> np.ndarray:
+        """Render the static background, a horizontal gradient so frames are not uniform."""
+        background = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        background[:] = np.linspace(20, 60, self.width, dtype=np.uint8)[None, :, None]
+        background.flags.writeable = False
+        return background
+
+    def _plan_cycle(self) -> List[List[BoundingBox]]:
+        """Compute every person's ground-truth box for each frame of the cycle."""
+        person_width = self.config.person_width
+        person_height = self.config.person_height
+        ground_truth = []
+        for index in range(self.cycle_frames):
+            phase = index / self.cycle_frames
+            boxes = []
+            for waypoints in self.trajectories:
+                x, y = self._position_at(waypoints, phase)
+                boxes.append(BoundingBox(x=int(round(x)), y=int(round(y)),
+                                         width=person_width, height=person_height))
+            ground_truth.append(boxes)
+        return ground_truth
+
+    def next_frame(self, out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, List[BoundingBox]]:
+        """
+        Composite the next frame of the cycle and return its ground-truth boxes.
+
+        Args:
+            out: Buffer of shape (height, width, 3) to draw into, e.g. a pooled
+                frame buffer; a new array is allocated when omitted
+
+        Returns:
+            Tuple of (frame, ground-truth bounding boxes)
+        """
+        index = self.position
+        self.position = (self.position + 1) % self.cycle_frames
+
+        if out is None:
+            frame = self.background.copy()
+        else:
+            frame = out
+            np.copyto(frame, self.background)
+
+        boxes = self.ground_truth[index]
+        for person, box in enumerate(boxes):
+            color = (0, 255 - (person * 40) % 200, 60 + (person * 70) % 190)
+            cv2.rectangle(frame, (box.x, box.y), (box.x + box.width, box.y + box.height), color, -1)
+        return frame, boxes
@@ -14,6 +14,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from .coordinate_processor import CoordinateResult
+from .frame_deadline import FrameDeadline
 from models.telemetry import TelemetryMessage, SystemStatus
 from models.config import SystemConfig
 
@@ -83,6 +84,15 @@ class TelemetryClient:
         # Logging
         self.logger = logging.getLogger(__name__)
         
+        # Results whose frame is past its deadline are not reported, including on retry
+        self.frame_deadline = None
+        if system_config.max_frame_age_ms:
+            self.frame_deadline = FrameDeadline("telemetry", system_config.max_frame_age_ms)
+            if system_config.max_frame_age_ms < transmission_interval * 1000.0:
+                self.logger.warning(f"max_frame_age_ms ({system_config.max_frame_age_ms:.0f}) is shorter than the "
+                                    f"telemetry interval ({transmission_interval * 1000.0:.0f} ms); "
+                                    f"results waiting for the next transmission will be dropped")
+        
         # HTTP session for connection reuse
         self.session = requests.Session()
         self.session.headers.update({
@@ -165,7 +175,23 @@ class TelemetryClient:
             except queue.Empty:
                 break
         
-        return results
+        return self._drop_stale_results(results)
+    
+    def _drop_stale_results(self, coordinate_results: List[CoordinateResult]) -> List[CoordinateResult]:
+        """
+        Skip results whose frame is past its deadline.
+        
+        Args:
+            coordinate_results: Results about to be sent
+            
+        Returns:
+            List[CoordinateResult]: The results still fresh enough to report
+        """
+        if not self.frame_deadline:
+            return coordinate_results
+        now = time.time()
+        return [result for result in coordinate_results
+                if not self.frame_deadline.is_stale(result.frame_data.timestamp, now)]
     
     def _send_telemetry(self, coordinate_results: List[CoordinateResult]) -> TelemetryResult:
         """
@@ -268,6 +294,10 @@ class TelemetryClient:
             all_detections.extend(result.detections)
             total_processing_time += result.processing_time
         
+        # Detector input size of the most recent frame (changes under adaptive resolution)
+        image_sizes = [result.inference_image_size for result in coordinate_results
+                       if result.inference_image_size is not None]
+        
         # Calculate system performance metrics
         avg_processing_time = total_processing_time / len(coordinate_results) if coordinate_results else 0.0
         processing_fps = 1.0 / avg_processing_time if avg_processing_time > 0 else 0.0
@@ -278,7 +308,8 @@ class TelemetryClient:
             processing_fps=processing_fps,
             cpu_usage=None,  # Could be added with psutil
             memory_usage=None,  # Could be added with psutil
-            temperature=None  # Could be added with hardware monitoring
+            temperature=None,  # Could be added with hardware monitoring
+            inference_image_size=image_sizes[-1] if image_sizes else None
         )
         
         # Create telemetry message
@@ -304,6 +335,9 @@ class TelemetryClient:
         
         # Process retry items
         for coordinate_results, attempt_count in retry_items:
+            coordinate_results = self._drop_stale_results(coordinate_results)
+            if not coordinate_results:
+                continue
             if attempt_count <= self.max_retry_attempts:
                 self.logger.info(f"Retrying telemetry transmission (attempt {attempt_count})")
                 
@@ -348,6 +382,7 @@ class TelemetryClient:
                 'last_successful_transmission': self.last_successful_transmission,
                 'retry_queue_size': self.retry_queue.qsize(),
                 'coordinate_queue_size': self.coordinate_queue.qsize(),
+                'stale_results': self.frame_deadline.get_stats() if self.frame_deadline else None,
                 'atlas_api_url': self.system_config.atlas_api_url
             }
     
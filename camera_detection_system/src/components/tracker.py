@@ -0,0 +1,245 @@
+"""
+PersonTracker - Lightweight multi-object tracker for person detections
+Associates detections across frames by IoU and predicts motion at constant velocity
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import List, Dict, Any, Tuple
+import numpy as np
+
+from models.telemetry import Detection, BoundingBox
+
+
+def box_iou(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """
+    Pairwise intersection-over-union of two sets of boxes.
+
+    Args:
+        boxes_a: (n, 4) boxes as x1, y1, x2, y2
+        boxes_b: (m, 4) boxes as x1, y1, x2, y2
+
+    Returns:
+        np.ndarray: (n, m) IoU matrix
+    """
+    top_left = np.maximum(boxes_a[:, None, :2], boxes_b[None, :, :2])
+    bottom_right = np.minimum(boxes_a[:, None, 2:], boxes_b[None, :, 2:])
+    intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+    area_a = np.prod(boxes_a[:, 2:] - boxes_a[:, :2], axis=1)
+    area_b = np.prod(boxes_b[:, 2:] - boxes_b[:, :2], axis=1)
+    union = area_a[:, None] + area_b[None, :] - intersection
+    return np.where(union > 0, intersection / np.maximum(union, 1e-9), 0.0)
+
+
+def detection_to_xyxy(detection: Detection) -> np.ndarray:
+    """Return a detection's bounding box as a float x1, y1, x2, y2 array."""
+    box = detection.bounding_box
+    return np.array([box.x, box.y, box.x + box.width, box.y + box.height], dtype=np.float64)
+
+
+@dataclass
+class Track:
+    """One tracked person in camera pixel coordinates"""
+    track_id: str
+    box: np.ndarray             # x1, y1, x2, y2 at last_frame_id
+    velocity: np.ndarray        # change of box per frame
+    last_frame_id: int
+    confidence: float
+    hits: int = 1
+    misses: int = 0
+
+    def predict(self, frame_id: int) -> np.ndarray:
+        """Constant-velocity position of the box at frame_id."""
+        return self.box + self.velocity * (frame_id - self.last_frame_id)
+
+
+class PersonTracker:
+    """
+    Per-camera tracker: greedy IoU matching between detections and the
+    constant-velocity prediction of each track, then nearest-centre matching
+    for what is left (small, fast people often don't overlap their own
+    prediction). Matched detections get the track's id; unmatched ones start
+    new tracks; tracks unseen for more than max_missed detection passes are
+    dropped.
+    """
+
+    def __init__(self, iou_threshold: float = 0.3, max_missed: int = 5, velocity_smoothing: float = 0.5,
+                 distance_gate: float = 1.5):
+        """
+        Initialize the tracker.
+
+        Args:
+            iou_threshold: Minimum IoU between prediction and detection to match them
+            max_missed: Detection passes a track may go unmatched before it is dropped
+            velocity_smoothing: Weight of the newest velocity measurement
+            distance_gate: Largest centre distance, in predicted box heights, for a non-overlapping match
+        """
+        self.iou_threshold = iou_threshold
+        self.max_missed = max_missed
+        self.velocity_smoothing = velocity_smoothing
+        self.distance_gate = distance_gate
+
+        self.tracks: Dict[str, List[Track]] = {}
+        self.next_track_number = 0
+
+        # Statistics
+        self.tracks_started = 0
+        self.tracks_dropped = 0
+
+        self.lock = threading.Lock()
+
+    def predict(self, camera_id: str, frame_id: int) -> List[Tuple[Track, np.ndarray]]:
+        """
+        Predict where each live track of a camera is in a frame.
+
+        Args:
+            camera_id: Camera to predict for
+            frame_id: Frame to predict positions at
+
+        Returns:
+            List of (track, predicted x1, y1, x2, y2 box)
+        """
+        with self.lock:
+            return [(track, track.predict(frame_id)) for track in self.tracks.get(camera_id, [])]
+
+    def propagate(self, camera_id: str, frame_id: int) -> List[Detection]:
+        """
+        Build detections for a frame from the predicted positions of the camera's tracks.
+
+        Only tracks matched in the latest detection pass are propagated.
+
+        Args:
+            camera_id: Camera the frame came from
+            frame_id: Frame to predict positions at
+
+        Returns:
+            List[Detection]: Detections flagged as propagated, in camera pixel coordinates
+        """
+        detections = []
+        with self.lock:
+            for index, track in enumerate(self.tracks.get(camera_id, [])):
+                if track.misses > 0:
+                    continue
+                x1, y1, x2, y2 = track.predict(frame_id)
+                detections.append(Detection(
+                    object_id=f"person_{camera_id}_{frame_id}_{index}",
+                    object_type="person",
+                    confidence=track.confidence,
+                    bounding_box=BoundingBox(x=int(x1), y=int(y1), width=int(x2 - x1), height=int(y2 - y1)),
+                    track_id=track.track_id,
+                    camera_id=camera_id,
+                    propagated=True
+                ))
+        return detections
+
+    def relative_speed(self, camera_id: str) -> float:
+        """
+        Fastest motion among the camera's tracks, in box heights per frame.
+
+        Args:
+            camera_id: Camera to inspect
+
+        Returns:
+            float: Largest centre speed divided by box height, 0.0 without tracks
+        """
+        with self.lock:
+            speeds = [
+                np.linalg.norm((track.velocity[:2] + track.velocity[2:]) / 2) / max(track.box[3] - track.box[1], 1.0)
+                for track in self.tracks.get(camera_id, []) if track.misses == 0
+            ]
+        return float(max(speeds)) if speeds else 0.0
+
+    def update(self, camera_id: str, frame_id: int, detections: List[Detection]) -> List[Detection]:
+        """
+        Associate a frame's detections with the camera's tracks and set their track_id.
+
+        Args:
+            camera_id: Camera the detections came from
+            frame_id: Frame the detections were made in
+            detections: Detections in camera pixel coordinates
+
+        Returns:
+            List[Detection]: The same detections, with track_id filled in
+        """
+        with self.lock:
+            tracks = self.tracks.setdefault(camera_id, [])
+            boxes = np.array([detection_to_xyxy(d) for d in detections]).reshape(-1, 4)
+            matched_tracks = set()
+            matched_detections = set()
+
+            if tracks and len(detections):
+                predicted = np.array([track.predict(frame_id) for track in tracks])
+                iou = box_iou(predicted, boxes)
+                predicted_centres = (predicted[:, :2] + predicted[:, 2:]) / 2
+                detection_centres = (boxes[:, :2] + boxes[:, 2:]) / 2
+                centre_distance = np.linalg.norm(predicted_centres[:, None] - detection_centres[None, :], axis=2)
+                gate = self.distance_gate * (predicted[:, 3] - predicted[:, 1])[:, None]
+
+                # Greedy assignment: best overlaps first, then closest centres within the gate
+                pairs = [(track_index, detection_index) for track_index, detection_index
+                         in zip(*np.unravel_index(np.argsort(-iou, axis=None), iou.shape))
+                         if iou[track_index, detection_index] >= self.iou_threshold]
+                pairs += [(track_index, detection_index) for track_index, detection_index
+                          in zip(*np.unravel_index(np.argsort(centre_distance, axis=None), iou.shape))
+                          if centre_distance[track_index, detection_index] <= gate[track_index, 0]]
+                for track_index, detection_index in pairs:
+                    if track_index in matched_tracks or detection_index in matched_detections:
+                        continue
+                    matched_tracks.add(track_index)
+                    matched_detections.add(detection_index)
+                    self._update_track(tracks[track_index], boxes[detection_index],
+                                       detections[detection_index], frame_id)
+
+            for track_index, track in enumerate(tracks):
+                if track_index not in matched_tracks:
+                    track.misses += 1
+
+            for detection_index, detection in enumerate(detections):
+                if detection_index not in matched_detections:
+                    track = Track(
+                        track_id=f"track_{camera_id}_{self.next_track_number}",
+                        box=boxes[detection_index],
+                        velocity=np.zeros(4),
+                        last_frame_id=frame_id,
+                        confidence=detection.confidence
+                    )
+                    self.next_track_number += 1
+                    self.tracks_started += 1
+                    tracks.append(track)
+                    detection.track_id = track.track_id
+
+            live_tracks = [track for track in tracks if track.misses <= self.max_missed]
+            self.tracks_dropped += len(tracks) - len(live_tracks)
+            self.tracks[camera_id] = live_tracks
+
+        return detections
+
+    def _update_track(self, track: Track, box: np.ndarray, detection: Detection, frame_id: int):
+        """Move a track to its matched detection and refresh its velocity (caller holds the lock)."""
+        elapsed_frames = frame_id - track.last_frame_id
+        if elapsed_frames > 0:
+            measured = (box - track.box) / elapsed_frames
+            if track.hits == 1:
+                track.velocity = measured  # first measurement, nothing to smooth against
+            else:
+                track.velocity += self.velocity_smoothing * (measured - track.velocity)
+        track.box = box
+        track.last_frame_id = frame_id
+        track.confidence = detection.confidence
+        track.hits += 1
+        track.misses = 0
+        detection.track_id = track.track_id
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get tracker statistics.
+
+        Returns:
+            dict: Live track counts per camera and lifetime counters
+        """
+        with self.lock:
+            return {
+                'active_tracks': {camera_id: len(tracks) for camera_id, tracks in self.tracks.items()},
+                'tracks_started': self.tracks_started,
+                'tracks_dropped': self.tracks_dropped
+            }
@@ -8,7 +8,7 @@ and internal data transfer objects.
 
 # Import will be added as needed
 # from .telemetry import TelemetryMessage, Detection, BoundingBox, SpatialCoordinates, SystemStatus
-# from .config import CameraConfig, SystemConfig
+# from .config import CameraConfig, SystemConfig, SyntheticSceneConfig
 
 __all__ = [
     'TelemetryMessage',
@@ -17,5 +17,6 @@ __all__ = [
     'SpatialCoordinates',
     'SystemStatus',
     'CameraConfig',
-    'SystemConfig'
+    'SystemConfig',
+    'SyntheticSceneConfig'
 ] 
\ No newline at end of file
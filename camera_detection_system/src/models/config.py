@@ -5,16 +5,43 @@ These models define the structure of configuration files and
 system parameters used throughout the application.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 import json
 
 
+@dataclass
+class SyntheticSceneConfig:
+    """Scripted scene parameters for the mock camera."""
+    num_people: int = 3
+    person_width: int = 80      # pixels
+    person_height: int = 160    # pixels
+    cycle_frames: int = 60      # frames per trajectory loop
+    trajectories: Optional[List[List[List[float]]]] = None  # per person closed loop of [x, y] waypoints
+    seed: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "num_people": self.num_people,
+            "person_width": self.person_width,
+            "person_height": self.person_height,
+            "cycle_frames": self.cycle_frames,
+            "trajectories": self.trajectories,
+            "seed": self.seed
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SyntheticSceneConfig':
+        """Create SyntheticSceneConfig from dictionary."""
+        return cls(**data)
+
+
 @dataclass
 class CameraConfig:
     """Camera configuration parameters."""
     name: str
-    type: str                   # "pi_camera", "usb_camera"
+    type: str                   # "pi_camera", "usb_camera", "replay"
     width: int
     height: int
     horizontal_fov: float       # degrees
@@ -23,6 +50,26 @@ class CameraConfig:
     device_path: Optional[str] = None
     calibration_matrix: Optional[List[List[float]]] = None
     distortion_coefficients: Optional[List[float]] = None
+    frame_pool_size: Optional[int] = None   # reusable frame buffers, None = queue size + 2
+    pacing: str = "deadline"    # "deadline" (sleep until next slot), "camera" (block on frame arrival)
+    capture_mode: str = "read"  # "read" (decode every frame), "latest" (USB grab/retrieve, latest frame wins),
+                                # "mjpeg" (USB compressed frames, decoded on demand by the consumer),
+                                # "jpeg" (Pi Camera JPEG still capture instead of raw video-port frames)
+    fourcc: Optional[str] = None    # USB pixel format request, e.g. "MJPG" ("mjpeg" mode implies it)
+    jpeg_decode_width: Optional[int] = None  # decode MJPEG with DCT downscaling to at least this width
+    pi_raw_format: str = "bgr"  # Pi Camera raw video-port format: "bgr" or "yuv"
+    camera_id: Optional[str] = None  # identifier carried into telemetry, defaults to name
+    replay_path: Optional[str] = None   # "replay": video file or packed frame directory
+    replay_speed: str = "realtime"      # "realtime" (recorded timestamps) or "fast" (as fast as possible)
+    replay_loop: bool = False
+    mock_scene: Optional[SyntheticSceneConfig] = None  # scene used by the mock camera
+    roi_include: Optional[List[List[List[float]]]] = None  # polygons of [x, y] camera pixels where people can appear
+    roi_exclude: Optional[List[List[List[float]]]] = None  # polygons removed from the included area (sky, walls)
+
+    @property
+    def effective_id(self) -> str:
+        """Identifier used to tag frames and detections from this camera."""
+        return self.camera_id or self.name
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -36,13 +83,29 @@ class CameraConfig:
             "fps": self.fps,
             "device_path": self.device_path,
             "calibration_matrix": self.calibration_matrix,
-            "distortion_coefficients": self.distortion_coefficients
+            "distortion_coefficients": self.distortion_coefficients,
+            "frame_pool_size": self.frame_pool_size,
+            "pacing": self.pacing,
+            "capture_mode": self.capture_mode,
+            "fourcc": self.fourcc,
+            "jpeg_decode_width": self.jpeg_decode_width,
+            "pi_raw_format": self.pi_raw_format,
+            "camera_id": self.camera_id,
+            "replay_path": self.replay_path,
+            "replay_speed": self.replay_speed,
+            "replay_loop": self.replay_loop,
+            "mock_scene": self.mock_scene.to_dict() if self.mock_scene else None,
+            "roi_include": self.roi_include,
+            "roi_exclude": self.roi_exclude
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'CameraConfig':
         """Create CameraConfig from dictionary."""
-        return cls(**data)
+        data = dict(data)
+        scene_data = data.pop('mock_scene', None)
+        mock_scene = SyntheticSceneConfig.from_dict(scene_data) if scene_data else None
+        return cls(mock_scene=mock_scene, **data)
 
 
 @dataclass
@@ -52,12 +115,58 @@ class SystemConfig:
     atlas_api_url: str
     telemetry_interval: float   # seconds
     detection_confidence_threshold: float
-    camera: CameraConfig
+    camera: CameraConfig        # primary camera
     logging_level: str = "INFO"
     max_detections_per_frame: int = 10
     frame_queue_size: int = 5
     detection_queue_size: int = 10
     telemetry_queue_size: int = 50
+    cameras: List[CameraConfig] = field(default_factory=list)  # all cameras sharing one detector
+    motion_gate_enabled: bool = False
+    motion_gate_pixel_threshold: int = 25           # grayscale delta for a pixel to count as changed
+    motion_gate_min_changed_fraction: float = 0.002 # changed-pixel fraction that admits a frame
+    motion_gate_refresh_interval: float = 5.0       # seconds, forced detection even without motion
+    detection_batch_size: int = 1           # frames per model call
+    detection_batch_timeout_ms: float = 10.0  # longest wait for a batch to fill
+    model_path: str = "yolov8n.pt"
+    inference_backend: str = "pytorch"      # "pytorch", "onnxruntime", "openvino"
+    inference_image_size: int = 640         # model input size in pixels
+    model_cache_dir: Optional[str] = None   # exported model cache, None = ~/.cache/edge_os/models
+    model_precision: str = "fp32"           # "fp32" or "int8" (onnxruntime/openvino backends)
+    calibration_data: Optional[str] = None  # recording used for INT8 calibration (packed dir, video, image dir)
+    detector_workers: int = 1               # >1 runs detection in a pool of worker processes
+    latency_budget_ms: Optional[float] = None   # per-frame inference budget, None = fixed image size
+    adaptive_image_sizes: List[int] = field(default_factory=lambda: [640, 480, 320])
+    adaptive_cooldown_frames: int = 30      # frames measured at a size before it can change again
+    roi_detection_enabled: bool = False     # crops around tracked people between full-frame passes
+    roi_full_frame_interval: int = 10       # frames between full-frame passes per camera
+    roi_crop_size: int = 320                # minimum crop side in frame pixels, run at native resolution
+    roi_crop_margin: float = 0.5            # context around each predicted box, fraction of its size
+    tracker_iou_threshold: float = 0.3      # IoU needed to match a detection to a track
+    tracker_max_missed: int = 5             # detection passes a track survives without a match
+    detection_interval: int = 1             # run the model every N frames, tracker fills the rest
+    detection_interval_adaptive: bool = True    # lower N when people move fast or come and go
+    detector_preprocessing: bool = False    # letterbox into reused buffers in the detector instead of ultralytics
+    capture_resize: bool = False            # camera threads downscale frames to the model input size
+    detection_pipeline: bool = False        # overlap preprocessing, inference and post-processing on threads
+    cascade_model_path: Optional[str] = None    # larger model re-checking uncertain boxes, None = single model
+    cascade_margin: float = 0.15            # tier-1 confidences this close to the threshold go to tier 2
+    cascade_image_size: int = 320           # tier-2 crop side and input size in pixels
+    model_swap_trial_frames: int = 30       # frames a hot-swapped model serves before its latency is judged
+    max_frame_age_ms: Optional[float] = None    # skip frames older than this at every stage, None = no deadline
+
+    def get_camera_configs(self) -> List[CameraConfig]:
+        """Return every configured camera, falling back to the single primary camera."""
+        return self.cameras if self.cameras else [self.camera]
+
+    def get_capture_resize_size(self) -> Optional[int]:
+        """Longest frame side camera threads resize to, or None when capture_resize is off."""
+        if not self.capture_resize:
+            return None
+        sizes = [self.inference_image_size]
+        if self.latency_budget_ms:
+            sizes += list(self.adaptive_image_sizes)
+        return max(sizes)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -71,7 +180,40 @@ class SystemConfig:
             "frame_queue_size": self.frame_queue_size,
             "detection_queue_size": self.detection_queue_size,
             "telemetry_queue_size": self.telemetry_queue_size,
-            "camera": self.camera.to_dict()
+            "motion_gate_enabled": self.motion_gate_enabled,
+            "motion_gate_pixel_threshold": self.motion_gate_pixel_threshold,
+            "motion_gate_min_changed_fraction": self.motion_gate_min_changed_fraction,
+            "motion_gate_refresh_interval": self.motion_gate_refresh_interval,
+            "detection_batch_size": self.detection_batch_size,
+            "detection_batch_timeout_ms": self.detection_batch_timeout_ms,
+            "model_path": self.model_path,
+            "inference_backend": self.inference_backend,
+            "inference_image_size": self.inference_image_size,
+            "model_cache_dir": self.model_cache_dir,
+            "model_precision": self.model_precision,
+            "calibration_data": self.calibration_data,
+            "detector_workers": self.detector_workers,
+            "latency_budget_ms": self.latency_budget_ms,
+            "adaptive_image_sizes": self.adaptive_image_sizes,
+            "adaptive_cooldown_frames": self.adaptive_cooldown_frames,
+            "roi_detection_enabled": self.roi_detection_enabled,
+            "roi_full_frame_interval": self.roi_full_frame_interval,
+            "roi_crop_size": self.roi_crop_size,
+            "roi_crop_margin": self.roi_crop_margin,
+            "tracker_iou_threshold": self.tracker_iou_threshold,
+            "tracker_max_missed": self.tracker_max_missed,
+            "detection_interval": self.detection_interval,
+            "detection_interval_adaptive": self.detection_interval_adaptive,
+            "detector_preprocessing": self.detector_preprocessing,
+            "capture_resize": self.capture_resize,
+            "detection_pipeline": self.detection_pipeline,
+            "cascade_model_path": self.cascade_model_path,
+            "cascade_margin": self.cascade_margin,
+            "cascade_image_size": self.cascade_image_size,
+            "model_swap_trial_frames": self.model_swap_trial_frames,
+            "max_frame_age_ms": self.max_frame_age_ms,
+            "camera": self.camera.to_dict(),
+            "cameras": [camera.to_dict() for camera in self.cameras]
         }
 
     def to_json_file(self, filepath: str) -> None:
@@ -81,10 +223,36 @@ class SystemConfig:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SystemConfig':
-        """Create SystemConfig from dictionary."""
-        camera_data = data.pop('camera')
-        camera_config = CameraConfig.from_dict(camera_data)
-        return cls(camera=camera_config, **data)
+        """
+        Create SystemConfig from dictionary.
+
+        Raises:
+            ValueError: If two cameras share the same effective_id
+        """
+        data = dict(data)
+        cameras = [CameraConfig.from_dict(camera_data) for camera_data in data.pop('cameras', None) or []]
+        camera_data = data.pop('camera', None)
+        camera_config = CameraConfig.from_dict(camera_data) if camera_data else cameras[0]
+        config = cls(camera=camera_config, cameras=cameras, **data)
+        config.check_camera_ids()
+        return config
+
+    def check_camera_ids(self) -> None:
+        """
+        Reject camera sets where two cameras would tag frames with the same id.
+
+        Frame queue accounting, tracks and telemetry are all keyed by
+        effective_id, so duplicates would silently merge two cameras.
+
+        Raises:
+            ValueError: If two cameras share the same effective_id
+        """
+        seen = set()
+        for camera in self.get_camera_configs():
+            if camera.effective_id in seen:
+                raise ValueError(f"Duplicate camera id '{camera.effective_id}': set a unique "
+                                 f"camera_id (or name) for each camera")
+            seen.add(camera.effective_id)
 
     @classmethod
     def from_json_file(cls, filepath: str) -> 'SystemConfig':
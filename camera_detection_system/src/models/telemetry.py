@@ -53,6 +53,9 @@ class Detection:
     bounding_box: BoundingBox
     spatial_coordinates: Optional[SpatialCoordinates] = None
     track_id: Optional[str] = None
+    camera_id: Optional[str] = None  # camera that produced the frame
+    propagated: bool = False         # box predicted by the tracker, not detected by the model
+    reused: bool = False             # carried over from an earlier frame the motion gate let through
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -61,7 +64,10 @@ class Detection:
             "confidence": self.confidence,
             "bounding_box": self.bounding_box.to_dict(),
             "spatial_coordinates": self.spatial_coordinates.to_dict() if self.spatial_coordinates else None,
-            "track_id": self.track_id
+            "track_id": self.track_id,
+            "camera_id": self.camera_id,
+            "propagated": self.propagated,
+            "reused": self.reused
         }
 
 
@@ -73,6 +79,7 @@ class SystemStatus:
     cpu_usage: Optional[float] = None
     memory_usage: Optional[float] = None
     temperature: Optional[float] = None
+    inference_image_size: Optional[int] = None  # model input size currently used by the detector
 
     def to_dict(self) -> Dict[str, Optional[float]]:
         return {
@@ -80,7 +87,8 @@ class SystemStatus:
             "processing_fps": self.processing_fps,
             "cpu_usage": self.cpu_usage,
             "memory_usage": self.memory_usage,
-            "temperature": self.temperature
+            "temperature": self.temperature,
+            "inference_image_size": self.inference_image_size
         }
 
 
@@ -119,7 +127,10 @@ class TelemetryMessage:
                     confidence=det['confidence'],
                     bounding_box=BoundingBox(**det['bounding_box']),
                     spatial_coordinates=SpatialCoordinates(**det['spatial_coordinates']) if det['spatial_coordinates'] else None,
-                    track_id=det.get('track_id')
+                    track_id=det.get('track_id'),
+                    camera_id=det.get('camera_id'),
+                    propagated=det.get('propagated', False),
+                    reused=det.get('reused', False)
                 )
                 for det in data['detections']
             ]
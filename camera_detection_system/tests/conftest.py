@@ -0,0 +1,73 @@
+"""
+Shared fixtures for the camera detection system unit tests.
+
+The application imports its packages from src/ (see main.py), so the tests do the same.
+Detector tests replace the model call and result extraction, so they run without ultralytics.
+"""
+
+import os
+import sys
+import time
+import queue
+import threading
+from typing import List
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from models.config import SystemConfig
+from models.telemetry import Detection, BoundingBox
+from components.camera_manager import FrameData
+
+
+def make_frame(camera_id: str, frame_id: int, value: int = 0, width: int = 64, height: int = 48) -> FrameData:
+    """A small solid-colour frame; frames with the same value look unchanged to the motion gate."""
+    frame = np.full((height, width, 3), value, dtype=np.uint8)
+    return FrameData(frame=frame, timestamp=time.time(), frame_id=frame_id, camera_id=camera_id)
+
+
+def fake_detection(frame_data: FrameData) -> Detection:
+    """One person moving 2 pixels right per frame."""
+    return Detection(
+        object_id=f"person_{frame_data.camera_id}_{frame_data.frame_id}_0",
+        object_type="person",
+        confidence=0.9,
+        bounding_box=BoundingBox(x=4 + 2 * frame_data.frame_id, y=4, width=10, height=20),
+        camera_id=frame_data.camera_id
+    )
+
+
+@pytest.fixture
+def config() -> SystemConfig:
+    """Default system configuration with batching wide enough for the ordering tests."""
+    config = SystemConfig.create_default()
+    config.detection_batch_size = 12
+    return config
+
+
+@pytest.fixture
+def make_detector():
+    """
+    Build a detector whose model call is replaced by a fake.
+
+    The returned detector records the number of frames of every model call in
+    model_calls; infer_delay adds a sleep to each call for timing tests.
+    """
+    def build(config: SystemConfig, detector_class=None, infer_delay: float = 0.0):
+        from components.person_detector import PersonDetector
+        detector_class = detector_class or PersonDetector
+        detector = detector_class(config, queue.Queue(), queue.Queue(), threading.Event())
+        detector.model_calls: List[int] = []
+
+        def infer(images, image_size):
+            detector.model_calls.append(len(images))
+            time.sleep(infer_delay)
+            return list(images), None
+
+        detector._infer = infer
+        detector._extract_person_detections = lambda result, frame_data, geometry=None, origin=(0, 0): \
+            [fake_detection(frame_data)]
+        return detector
+    return build
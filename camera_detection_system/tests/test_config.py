@@ -0,0 +1,32 @@
+"""
+SystemConfig loading tests.
+"""
+
+import pytest
+
+from models.config import SystemConfig
+
+
+def config_dict_with_cameras(*camera_ids):
+    data = SystemConfig.create_default().to_dict()
+    data['cameras'] = [dict(data['camera'], camera_id=camera_id) for camera_id in camera_ids]
+    return data
+
+
+def test_round_trip():
+    config = SystemConfig.from_dict(config_dict_with_cameras('front', 'back'))
+
+    assert [camera.effective_id for camera in config.get_camera_configs()] == ['front', 'back']
+    assert SystemConfig.from_dict(config.to_dict()).to_dict() == config.to_dict()
+
+
+def test_duplicate_camera_ids_are_rejected():
+    with pytest.raises(ValueError, match="'front'"):
+        SystemConfig.from_dict(config_dict_with_cameras('front', 'back', 'front'))
+
+
+def test_camera_name_counts_as_its_id():
+    data = config_dict_with_cameras(None, None)
+
+    with pytest.raises(ValueError, match=data['camera']['name']):
+        SystemConfig.from_dict(data)
@@ -0,0 +1,61 @@
+"""
+DetectorWorkerPool reorder buffer tests (no worker processes are started).
+"""
+
+import queue
+import threading
+
+import pytest
+
+from conftest import make_frame, fake_detection
+from components.detector_pool import DetectorWorkerPool
+
+
+@pytest.fixture
+def pool(config, monkeypatch):
+    monkeypatch.setattr(DetectorWorkerPool, 'initialize_model', lambda self: True)
+    config.detector_workers = 2
+    return DetectorWorkerPool(config, queue.Queue(), queue.Queue(), threading.Event())
+
+
+def inferred(frame_data):
+    return ('result', frame_data, ([fake_detection(frame_data)], 0.01, 0.9, 640))
+
+
+def drain(detection_queue):
+    results = []
+    while not detection_queue.empty():
+        results.append(detection_queue.get_nowait())
+    return results
+
+
+def test_results_are_emitted_in_dispatch_order(pool):
+    frames = [make_frame('a', frame_id) for frame_id in range(3)]
+
+    pool._complete(2, inferred(frames[2]))
+    pool._complete(1, inferred(frames[1]))
+    assert pool.detection_queue.empty()
+
+    pool._complete(0, inferred(frames[0]))
+    assert [result.frame_data.frame_id for result in drain(pool.detection_queue)] == [0, 1, 2]
+    assert pool.next_emit_seq == 3
+
+
+def test_failed_frames_do_not_block_later_results(pool):
+    pool._complete(1, inferred(make_frame('a', 1)))
+    pool._complete(0, None)
+
+    assert [result.frame_data.frame_id for result in drain(pool.detection_queue)] == [1]
+
+
+def test_reuse_takes_the_detections_of_the_frame_before_it(pool):
+    earlier, gated = make_frame('a', 0), make_frame('a', 1)
+
+    # The gated frame finishes first, but is only answered once its predecessor's result is in
+    pool._complete(1, ('reuse', gated))
+    pool._complete(0, inferred(earlier))
+
+    first, second = drain(pool.detection_queue)
+    assert second.reused
+    assert [det.bounding_box for det in second.detections] == [det.bounding_box for det in first.detections]
+    assert all(det.reused for det in second.detections)
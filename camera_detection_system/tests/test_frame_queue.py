@@ -0,0 +1,61 @@
+"""
+FrameQueue per-camera accounting and eviction tests.
+"""
+
+import threading
+
+from conftest import make_frame
+from components.frame_queue import FrameQueue
+
+
+def test_pending_counts_each_camera():
+    frame_queue = FrameQueue(maxsize=10)
+    for frame_id in range(3):
+        frame_queue.put(make_frame('a', frame_id))
+    frame_queue.put(make_frame('b', 0))
+
+    assert frame_queue.pending('a') == 3
+    assert frame_queue.pending('b') == 1
+    assert frame_queue.pending('c') == 0
+
+    frame_queue.get()
+    assert frame_queue.pending('a') == 2
+
+
+def test_evict_oldest_leaves_other_cameras_in_place():
+    frame_queue = FrameQueue(maxsize=10)
+    for camera_id, frame_id in [('b', 0), ('a', 0), ('b', 1), ('a', 1)]:
+        frame_queue.put(make_frame(camera_id, frame_id))
+
+    evicted = frame_queue.evict_oldest('a')
+
+    assert (evicted.camera_id, evicted.frame_id) == ('a', 0)
+    assert [(item.camera_id, item.frame_id) for item in frame_queue.queue] == [('b', 0), ('b', 1), ('a', 1)]
+    assert frame_queue.pending('a') == 1
+    assert frame_queue.evict_oldest('c') is None
+
+
+def test_evict_frees_a_slot_for_a_blocked_producer():
+    frame_queue = FrameQueue(maxsize=1)
+    frame_queue.put(make_frame('a', 0))
+    producer = threading.Thread(target=frame_queue.put, args=(make_frame('a', 1),))
+    producer.start()
+
+    frame_queue.evict_oldest('a')
+    producer.join(timeout=1.0)
+
+    assert not producer.is_alive()
+    assert frame_queue.queue[0].frame_id == 1
+
+
+def test_evicted_frames_count_as_done_for_join():
+    frame_queue = FrameQueue(maxsize=5)
+    frame_queue.put(make_frame('a', 0))
+    frame_queue.put(make_frame('a', 1))
+
+    frame_queue.evict_oldest('a')
+    frame_queue.get()
+    frame_queue.task_done()
+
+    assert frame_queue.unfinished_tasks == 0
+    frame_queue.join()
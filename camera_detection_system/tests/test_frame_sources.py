@@ -0,0 +1,90 @@
+"""
+Mock and replay frame source tests: synthetic scene compositing and packed recordings.
+"""
+
+import json
+import os
+
+import numpy as np
+
+from models.config import SyntheticSceneConfig
+from components.synthetic_scene import SyntheticScene
+from components.replay_source import ReplaySource, write_packed_recording, PACKED_INDEX_FILE, PACKED_FRAMES_FILE
+
+
+class TestSyntheticScene:
+    def test_frames_composite_into_the_given_buffer(self):
+        scene = SyntheticScene(SyntheticSceneConfig(num_people=2, cycle_frames=4), 320, 240)
+        buffer = np.zeros((240, 320, 3), dtype=np.uint8)
+
+        frame, boxes = scene.next_frame(buffer)
+
+        assert frame is buffer
+        assert len(boxes) == 2
+        box = boxes[0]
+        assert frame[box.y + 1, box.x + 1].tolist() != scene.background[box.y + 1, box.x + 1].tolist()
+
+    def test_sprites_do_not_leave_trails_in_reused_buffers(self):
+        scene = SyntheticScene(SyntheticSceneConfig(num_people=1, cycle_frames=2, person_width=10,
+                                                    person_height=10, trajectories=[[[0, 0], [200, 200]]]),
+                               320, 240)
+        buffer = np.zeros((240, 320, 3), dtype=np.uint8)
+
+        scene.next_frame(buffer)
+        frame, _ = scene.next_frame(buffer)
+
+        assert frame[5, 5].tolist() == scene.background[5, 5].tolist()
+
+    def test_cycle_repeats(self):
+        scene = SyntheticScene(SyntheticSceneConfig(cycle_frames=3), 320, 240)
+        first = [scene.next_frame()[1] for _ in range(3)]
+
+        assert [scene.next_frame()[1] for _ in range(3)] == first
+
+
+class TestReplaySource:
+    def test_packed_recording_round_trip(self, tmp_path):
+        frames = [(np.full((4, 6, 3), value, dtype=np.uint8), value / 10.0) for value in range(3)]
+        write_packed_recording(str(tmp_path), frames)
+
+        source = ReplaySource(str(tmp_path))
+        assert source.open()
+        replayed = [source.read() for _ in range(3)]
+
+        assert [timestamp for _, timestamp in replayed] == [0.0, 0.1, 0.2]
+        assert all((frame == value).all() for (frame, _), value in zip(replayed, range(3)))
+        assert source.read() is None
+
+    def test_grayscale_frames_are_recorded_as_bgr(self, tmp_path):
+        write_packed_recording(str(tmp_path), [(np.full((4, 6), 7, dtype=np.uint8), 0.0)])
+
+        with open(os.path.join(tmp_path, PACKED_INDEX_FILE)) as f:
+            assert json.load(f)['channels'] == 3
+        source = ReplaySource(str(tmp_path))
+        source.open()
+        frame, _ = source.read()
+
+        assert frame.shape == (4, 6, 3)
+
+    def test_single_channel_recordings_replay_as_bgr(self, tmp_path):
+        gray = np.arange(24, dtype=np.uint8).reshape(4, 6)
+        with open(os.path.join(tmp_path, PACKED_FRAMES_FILE), 'wb') as f:
+            f.write(gray.tobytes())
+        with open(os.path.join(tmp_path, PACKED_INDEX_FILE), 'w') as f:
+            json.dump({"height": 4, "width": 6, "channels": 1, "timestamps": [0.0]}, f)
+
+        source = ReplaySource(str(tmp_path))
+        assert source.open()
+        buffer = np.zeros((4, 6, 3), dtype=np.uint8)
+        frame, _ = source.read(out=buffer)
+
+        assert frame is buffer
+        assert (frame == gray[:, :, None]).all()
+
+    def test_unsupported_channel_counts_are_refused(self, tmp_path):
+        with open(os.path.join(tmp_path, PACKED_FRAMES_FILE), 'wb') as f:
+            f.write(bytes(4 * 6 * 4))
+        with open(os.path.join(tmp_path, PACKED_INDEX_FILE), 'w') as f:
+            json.dump({"height": 4, "width": 6, "channels": 4, "timestamps": [0.0]}, f)
+
+        assert not ReplaySource(str(tmp_path)).open()
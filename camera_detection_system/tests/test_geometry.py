@@ -0,0 +1,55 @@
+"""
+Box geometry helper tests: letterbox mapping, duplicate merging and cascade splitting.
+"""
+
+import numpy as np
+
+from components.preprocessing import LetterboxGeometry
+from components.roi_detection import merge_duplicate_boxes
+from components.cascade import ModelCascade
+
+
+class TestLetterboxGeometry:
+    # A 640x480 frame letterboxed into a 320 input: half scale, 40 pixels of padding top and bottom
+    geometry = LetterboxGeometry(scale=0.5, left=0, top=40, width=320, height=240,
+                                 frame_width=640, frame_height=480)
+
+    def test_boxes_map_back_to_frame_pixels(self):
+        boxes = self.geometry.boxes_to_frame(np.array([[10.0, 50.0, 110.0, 150.0]]))
+
+        np.testing.assert_allclose(boxes, [[20.0, 20.0, 220.0, 220.0]])
+
+    def test_boxes_in_the_padding_are_clipped_to_the_frame(self):
+        boxes = self.geometry.boxes_to_frame(np.array([[-10.0, 0.0, 330.0, 300.0]]))
+
+        np.testing.assert_allclose(boxes, [[0.0, 0.0, 640.0, 480.0]])
+
+
+class TestMergeDuplicateBoxes:
+    def test_keeps_the_most_confident_of_overlapping_boxes(self):
+        xyxy = np.array([[0, 0, 100, 200], [5, 5, 105, 205], [300, 0, 400, 200]], dtype=np.float64)
+        confidences = np.array([0.6, 0.9, 0.7])
+
+        keep = merge_duplicate_boxes(xyxy, confidences)
+
+        assert keep.tolist() == [1, 2]
+
+    def test_empty_input(self):
+        keep = merge_duplicate_boxes(np.empty((0, 4)), np.empty(0))
+
+        assert keep.dtype == np.int64
+        assert len(keep) == 0
+
+
+class TestModelCascade:
+    def test_split_by_distance_from_threshold(self):
+        cascade = ModelCascade(margin=0.15)
+
+        confident, uncertain = cascade.split(np.array([0.9, 0.65, 0.55, 0.4, 0.3]), threshold=0.5)
+
+        assert confident.tolist() == [True, True, False, False, False]
+        assert uncertain.tolist() == [False, False, True, True, False]
+
+    def test_tier1_threshold_surfaces_uncertain_boxes(self):
+        assert ModelCascade(margin=0.15).tier1_threshold(0.5) == 0.35
+        assert ModelCascade(margin=0.15).tier1_threshold(0.1) == 0.01
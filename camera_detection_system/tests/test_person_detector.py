@@ -0,0 +1,185 @@
+"""
+PersonDetector batch ordering, keep-alive reuse, latency accounting and model hot-swap tests.
+"""
+
+from conftest import make_frame
+from components.detection_pipeline import PipelinedPersonDetector
+from components.model_swap import ACTIVE, ROLLED_BACK, TRIAL
+
+
+def record_tracker_calls(detector):
+    """Log (camera_id, frame_id, call) for every tracker update and propagate."""
+    calls = []
+    for name in ('update', 'propagate'):
+        original = getattr(detector.tracker, name)
+
+        def wrapper(camera_id, frame_id, *args, _original=original, _name=name):
+            calls.append((camera_id, frame_id, _name))
+            return _original(camera_id, frame_id, *args)
+        setattr(detector.tracker, name, wrapper)
+    return calls
+
+
+class TestBatchOrdering:
+    def test_interval_decided_after_earlier_frames_are_tracked(self, config, make_detector):
+        config.detection_interval = 3
+        config.detection_interval_adaptive = False
+        detector = make_detector(config)
+        calls = record_tracker_calls(detector)
+
+        batch = [make_frame(camera_id, frame_id) for frame_id in range(6) for camera_id in 'ab']
+        results = detector._process_batch(batch)
+
+        for camera_id in 'ab':
+            assert [(frame_id, call) for camera, frame_id, call in calls if camera == camera_id] == [
+                (0, 'update'), (1, 'propagate'), (2, 'propagate'),
+                (3, 'update'), (4, 'propagate'), (5, 'propagate')
+            ]
+        assert all(result is not None for result in results)
+        assert [result.detections[0].propagated for result in results[::2]] == \
+            [False, True, True, False, True, True]
+
+    def test_cameras_still_share_model_calls(self, config, make_detector):
+        config.detection_interval = 3
+        config.detection_interval_adaptive = False
+        detector = make_detector(config)
+
+        detector._process_batch([make_frame(camera_id, frame_id) for frame_id in range(6) for camera_id in 'ab'])
+
+        assert detector.model_calls == [2, 2]
+
+    def test_crops_planned_after_earlier_frames_are_tracked(self, config, make_detector):
+        config.roi_detection_enabled = True
+        config.roi_full_frame_interval = 3
+        config.roi_crop_size = 32
+        detector = make_detector(config)
+        cropped = []
+        detector._detect_in_crops = lambda frame_data, crops: cropped.append(frame_data.frame_id)
+        calls = record_tracker_calls(detector)
+
+        detector._process_batch([make_frame('a', frame_id, width=320, height=240) for frame_id in range(6)])
+
+        # Crops are planned from the tracks of the full-frame pass just before them
+        assert cropped == [1, 2, 4, 5]
+        assert [frame_id for _, frame_id, _ in calls] == [0, 3]
+
+    def test_reuse_waits_for_the_cameras_earlier_frames(self, config, make_detector):
+        config.motion_gate_enabled = True
+        detector = make_detector(config)
+
+        results = detector._process_batch([make_frame('a', 0), make_frame('b', 0, value=200), make_frame('a', 1)])
+
+        inferred, reused = results[0], results[2]
+        assert reused.reused
+        assert [det.bounding_box for det in reused.detections] == [det.bounding_box for det in inferred.detections]
+        assert all(det.reused for det in reused.detections)
+        assert not any(det.reused for det in inferred.detections)
+
+
+class TestLatencyAccounting:
+    def test_reused_frame_is_not_charged_for_the_flush(self, config, make_detector):
+        config.motion_gate_enabled = True
+        detector = make_detector(config, infer_delay=0.05)
+
+        inferred, reused = detector._process_batch([make_frame('a', 0), make_frame('a', 1)])
+
+        assert inferred.processing_time >= 0.05
+        assert reused.processing_time < 0.05
+
+    def test_frames_share_one_model_call(self, config, make_detector):
+        detector = make_detector(config, infer_delay=0.08)
+
+        results = detector._process_batch([make_frame(camera_id, 0) for camera_id in 'abcd'])
+
+        assert detector.model_calls == [4]
+        assert all(0.02 <= result.processing_time < 0.06 for result in results)
+
+
+class TestConfigureHook:
+    def test_pipeline_settles_modes_before_the_model_loads(self, config, make_detector):
+        config.detection_interval = 3
+        seen_at_load = {}
+
+        class ProbeDetector(PipelinedPersonDetector):
+            def initialize_model(self):
+                seen_at_load['tracker'] = self.tracker
+                seen_at_load['detection_interval'] = self.detection_interval
+                return False
+
+        make_detector(config, ProbeDetector)
+
+        assert seen_at_load == {'tracker': None, 'detection_interval': None}
+
+
+class TestModelSwap:
+    def serving_detector(self, config, make_detector, load_error=None):
+        """A detector serving 'old.pt' whose replacement models load instantly (or fail to)."""
+        config.model_path = 'old.pt'
+        config.model_swap_trial_frames = 2
+        detector = make_detector(config)
+        detector.model = 'old-model'
+
+        def create_backend(model_path):
+            if load_error:
+                raise load_error
+            return f"{model_path}-backend"
+
+        detector._create_backend = create_backend
+        detector._load_models = lambda backend: {config.inference_image_size: f"{backend}-model"}
+        detector._warm_up = lambda infer: None
+        detector._model_for_size = lambda image_size, backend=None, models=None: f"{detector.model_path}-model"
+        return detector
+
+    def swap(self, detector, latency_budget_ms):
+        assert detector.swap_model('new.pt', latency_budget_ms)
+        detector.swap_thread.join()
+
+    def test_kept_model_releases_the_previous_one(self, config, make_detector):
+        detector = self.serving_detector(config, make_detector)
+        self.swap(detector, latency_budget_ms=1000.0)
+
+        assert detector.model_path == 'new.pt'
+        assert detector.previous_model is not None
+        for _ in range(2):
+            detector._record_swap_trial(0.01)
+
+        assert detector.model_swap.status == ACTIVE
+        assert detector.previous_model is None
+        assert config.model_path == 'new.pt'
+
+    def test_rollback_restores_model_and_config(self, config, make_detector):
+        detector = self.serving_detector(config, make_detector)
+        self.swap(detector, latency_budget_ms=10.0)
+        assert config.model_path == 'new.pt'
+
+        for _ in range(2):
+            detector._record_swap_trial(0.5)
+        detector._install_pending_model()
+
+        assert detector.model_swap.status == ROLLED_BACK
+        assert detector.model_path == 'old.pt'
+        assert detector.previous_model is None
+        assert config.model_path == 'old.pt'
+
+    def test_failed_load_restores_config(self, config, make_detector):
+        detector = self.serving_detector(config, make_detector, load_error=IOError("missing weights"))
+        self.swap(detector, latency_budget_ms=None)
+
+        assert detector.model_path == 'old.pt'
+        assert config.model_path == 'old.pt'
+        assert detector.model_swap.failures == 1
+
+    def test_refused_swap_leaves_config(self, config, make_detector):
+        detector = self.serving_detector(config, make_detector)
+        detector.model = None
+
+        assert not detector.swap_model('new.pt')
+        assert config.model_path == 'old.pt'
+
+    def test_no_budget_keeps_model_without_trial(self, config, make_detector):
+        detector = self.serving_detector(config, make_detector)
+        self.swap(detector, latency_budget_ms=None)
+
+        assert detector.model_swap.status not in (TRIAL, ROLLED_BACK)
+        assert detector.previous_model is None
+        assert detector.model_swap.record(0.01) is None
@@ -0,0 +1,88 @@
+"""
+PersonTracker association/propagation and DetectionInterval scheduling tests.
+"""
+
+import pytest
+
+from models.telemetry import Detection, BoundingBox
+from components.tracker import PersonTracker
+from components.detection_interval import DetectionInterval
+
+
+def person(x: int, y: int = 10, confidence: float = 0.9) -> Detection:
+    return Detection(object_id=f"person_{x}", object_type="person", confidence=confidence,
+                     bounding_box=BoundingBox(x=x, y=y, width=20, height=40), camera_id='a')
+
+
+class TestPersonTracker:
+    def test_moving_person_keeps_its_track(self):
+        tracker = PersonTracker()
+        track_ids = {tracker.update('a', frame_id, [person(10 + 4 * frame_id)])[0].track_id
+                     for frame_id in range(5)}
+
+        assert len(track_ids) == 1
+        assert tracker.tracks_started == 1
+
+    def test_propagate_predicts_at_constant_velocity(self):
+        tracker = PersonTracker()
+        tracker.update('a', 0, [person(10)])
+        tracker.update('a', 2, [person(20)])
+
+        propagated = tracker.propagate('a', 4)
+
+        assert len(propagated) == 1
+        assert propagated[0].propagated
+        assert propagated[0].bounding_box.x == 30
+        assert propagated[0].track_id == 'track_a_0'
+
+    def test_cameras_are_tracked_separately(self):
+        tracker = PersonTracker()
+        tracker.update('a', 0, [person(10)])
+
+        assert tracker.propagate('b', 1) == []
+
+    def test_unmatched_tracks_are_dropped_after_max_missed(self):
+        tracker = PersonTracker(max_missed=2)
+        tracker.update('a', 0, [person(10)])
+        for frame_id in range(1, 4):
+            tracker.update('a', frame_id, [])
+
+        assert tracker.get_stats()['active_tracks'] == {'a': 0}
+        assert tracker.tracks_dropped == 1
+
+    def test_missed_tracks_are_not_propagated(self):
+        tracker = PersonTracker()
+        tracker.update('a', 0, [person(10)])
+        tracker.update('a', 1, [])
+
+        assert tracker.propagate('a', 2) == []
+
+
+class TestDetectionInterval:
+    def decisions(self, interval: DetectionInterval, frames: int):
+        return [interval.should_detect('a') for _ in range(frames)]
+
+    def test_first_frame_is_detected(self):
+        assert DetectionInterval(max_interval=5).should_detect('a')
+
+    def test_fixed_interval_detects_one_frame_in_n(self):
+        interval = DetectionInterval(max_interval=3, adaptive=False)
+        assert interval.should_detect('a')
+        interval.update('a', relative_speed=0.0, tracks_changed=False)
+
+        assert self.decisions(interval, 6) == [False, False, True, False, False, True]
+
+    def test_changed_tracks_force_every_frame(self):
+        interval = DetectionInterval(max_interval=4)
+        interval.should_detect('a')
+        interval.update('a', relative_speed=0.0, tracks_changed=True)
+
+        assert self.decisions(interval, 2) == [True, True]
+
+    @pytest.mark.parametrize("relative_speed, expected", [(0.0, 8), (0.05, 5), (0.2, 1)])
+    def test_interval_follows_motion(self, relative_speed, expected):
+        interval = DetectionInterval(max_interval=8, max_drift=0.25)
+        interval.should_detect('a')
+        interval.update('a', relative_speed=relative_speed, tracks_changed=False)
+
+        assert interval.get_stats()['intervals'] == {'a': expected}